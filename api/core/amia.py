@@ -1,44 +1,197 @@
 
-from autogen_agentchat.agents import AssistantAgent
-from autogen_core.models import ModelInfo
-from autogen_ext.models.openai import OpenAIChatCompletionClient
+import uuid
+from functools import cache
+from typing import TYPE_CHECKING
 from api.settings.config import config
 import api.core.calendar as calendar
 from api.services.google_events_service import GoogleEventsService
-from api.dependencies import get_google_events_service
-from fastapi import Depends
-
-model_client = OpenAIChatCompletionClient(
-    model="openai/gpt-oss-20b",
-    api_key=config.groq.api_key,
-    base_url="https://api.groq.com/openai/v1",
-    model_info=ModelInfo(
-        structured_output=False,
-        multiple_system_messages=True,
-        json_output=True,
-        function_calling=True,
-        vision=False,
-        family="unknown",
+from api.core.cache import TTLCache
+
+# autogen (and the openai SDK under it) is imported on first use so it
+# doesn't weigh on cold starts that never reach the agent
+if TYPE_CHECKING:
+    from autogen_agentchat.agents import AssistantAgent
+    from autogen_ext.models.openai import OpenAIChatCompletionClient
+
+AGENT_NAME = "amia_agent"
+
+
+@cache
+def get_model_client() -> "OpenAIChatCompletionClient":
+    """Shared Groq model client for the agent, created on first use"""
+    from autogen_core.models import ModelInfo
+    from autogen_ext.models.openai import OpenAIChatCompletionClient
+
+    return OpenAIChatCompletionClient(
+        model="openai/gpt-oss-20b",
+        api_key=config.groq.api_key,
+        base_url="https://api.groq.com/openai/v1",
+        model_info=ModelInfo(
+            structured_output=False,
+            multiple_system_messages=True,
+            json_output=True,
+            function_calling=True,
+            vision=False,
+            family="unknown",
+        )
     )
-)
 
 
-async def get_amia_agent(context: dict, metdata: dict, google_events_service: GoogleEventsService = Depends(get_google_events_service)) -> AssistantAgent:
-    # TODO: inject other context (like the current user)
+SYSTEM_MESSAGE = "You are a calendar assistant that can help with scheduling events. Your name is AMIA (stands for Am I Available?). Don't respond to questions that aren't related to scheduling."
+
+
+def get_amia_agent(
+    *,
+    user_id: str,
+    google_events_service: GoogleEventsService,
+    history: list[tuple[str, str]] | None = None,
+) -> "AssistantAgent":
+    """
+    A new agent for `user_id`, its context seeded with earlier (role, content)
+    messages of the conversation
+    """
+    from autogen_agentchat.agents import AssistantAgent
+    from autogen_core.model_context import BufferedChatCompletionContext
+    from autogen_core.models import AssistantMessage, UserMessage
+
     tools = [
         calendar.get_current_week_events_wrapper(
-            user_id="test", # TODO: inject the current user
+            user_id=user_id,
             google_events_service=google_events_service,
         )
     ]
+    initial_messages = [
+        AssistantMessage(content=content, source=AGENT_NAME)
+        if role == "assistant"
+        else UserMessage(content=content, source="user")
+        for role, content in history or []
+    ]
     agent = AssistantAgent(
-        name="amia_agent",
-        model_client=model_client,
+        name=AGENT_NAME,
+        model_client=get_model_client(),
         tools=tools,
-        system_message="You are a calendar assistant that can help with scheduling events. Your name is AMIA (stands for Am I Available?). Don't respond to questions that aren't related to schedulin. Don't respond to questions that aren't related to scheduling.",
+        model_context=BufferedChatCompletionContext(
+            buffer_size=config.agent.context_messages,
+            initial_messages=initial_messages,
+        ),
+        system_message=SYSTEM_MESSAGE,
         reflect_on_tool_use=True,
         model_client_stream=True,  # Enable streaming tokens from the model client.
         max_tool_iterations=5
     )
     return agent
-    
\ No newline at end of file
+
+
+class AgentSessionBusyError(Exception):
+    """The session is already answering a turn"""
+
+
+class AgentSessionNotFoundError(Exception):
+    """The session has expired, was evicted or lives on another process"""
+
+
+class AgentSession:
+    """A pooled agent and the (role, content) messages its context holds"""
+
+    def __init__(self, *, agent: "AssistantAgent", history: list[tuple[str, str]]):
+        self.id = str(uuid.uuid4())
+        self.agent = agent
+        self.history = history
+        self.busy = False
+
+
+class AgentPool:
+    """
+    Agents kept between chat turns, by user and session, until idle
+
+    A session's agent holds the conversation in its model context, so a turn
+    only adds the new messages rather than rebuilding the agent and its tools.
+    Clients either send the whole conversation every turn, in which case the
+    user's latest session is reused as long as the conversation continues what
+    it holds, or the `session_id` of an earlier turn and only their new messages.
+    Sessions live in one process, so an unknown `session_id` is refused rather
+    than quietly starting over without the earlier messages.
+    """
+
+    def __init__(self, *, max_sessions: int, idle_seconds: float):
+        # each session is stored by its ID and as the user's latest (ID None)
+        self._sessions: TTLCache[AgentSession] = TTLCache(
+            name="agent_sessions", max_entries=max_sessions, ttl_seconds=idle_seconds
+        )
+
+    def checkout(
+        self,
+        *,
+        user_id: str,
+        session_id: str | None,
+        messages: list[tuple[str, str]],
+        google_events_service: GoogleEventsService,
+    ) -> tuple[AgentSession, list[tuple[str, str]]]:
+        """
+        The session for a turn, marked busy, and the messages it hasn't seen
+
+        Raises:
+            AgentSessionNotFoundError: `session_id` isn't a live session of the user
+            AgentSessionBusyError: The session is still answering the last turn
+        """
+        if session_id is not None:
+            session = self._sessions.get((user_id, session_id))
+            if session is None:
+                raise AgentSessionNotFoundError(
+                    "Chat session not found, send the whole conversation without a session_id"
+                )
+            new_messages = messages
+        else:
+            session = self._sessions.get((user_id, None))
+            if session is not None:
+                seen = len(session.history)
+                # an edited or new conversation starts a new session
+                if messages[:seen] != session.history or seen >= len(messages):
+                    session = None
+            if session is None:
+                history = messages[:-1]
+                session = AgentSession(
+                    agent=get_amia_agent(
+                        user_id=user_id,
+                        google_events_service=google_events_service,
+                        history=history,
+                    ),
+                    history=history,
+                )
+                new_messages = messages[-1:]
+            else:
+                new_messages = messages[len(session.history):]
+        if session.busy:
+            raise AgentSessionBusyError("A reply is already in progress for this chat")
+
+        session.busy = True
+        # storing it again restarts the idle timer
+        self._sessions.set((user_id, session.id), session)
+        self._sessions.set((user_id, None), session)
+        return session, new_messages
+
+    def release(
+        self,
+        session: AgentSession,
+        *,
+        user_id: str,
+        messages: list[tuple[str, str]],
+        reply: str | None,
+    ) -> None:
+        """
+        Record a finished turn, or with no `reply` (the turn failed or was cut
+        off) drop the session, since its context may hold half a turn
+        """
+        session.busy = False
+        if reply is None:
+            self._sessions.invalidate((user_id, session.id))
+            if self._sessions.get((user_id, None)) is session:
+                self._sessions.invalidate((user_id, None))
+            return
+        session.history.extend([*messages, ("assistant", reply)])
+
+
+agent_pool = AgentPool(
+    max_sessions=config.agent.max_sessions,
+    idle_seconds=config.agent.session_idle_seconds,
+)
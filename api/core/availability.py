@@ -0,0 +1,226 @@
+"""
+Free/busy availability computed from calendar events
+
+Events are flattened into a `BusyIntervals` index: sorted, merged, disjoint
+[start, end) intervals stored as parallel lists of UTC epoch seconds, so every
+point query is a binary search.
+
+    busy = BusyIntervals.from_events(events, default_time_zone="America/New_York")
+    busy.is_free(start=start, end=end)
+    busy.free_slots(window_start=start, window_end=end, min_duration=timedelta(minutes=30))
+    first_common_free_slot(calendars=[busy, other_busy], window_start=start,
+                           window_end=end, duration=timedelta(hours=1))
+"""
+
+from bisect import bisect_right
+from datetime import datetime, timedelta, timezone
+from typing import Iterable
+from zoneinfo import ZoneInfo
+from pydantic import BaseModel
+from api.proxy.models.google_models import CalendarEvent, EventDateTime
+
+
+class TimeSlot(BaseModel):
+    """A [start, end) time range in UTC"""
+
+    start: datetime
+    end: datetime
+
+
+def to_utc(
+    value: EventDateTime | None, *, default_time_zone: str = "UTC"
+) -> datetime | None:
+    """
+    Convert a Google start/end to an aware UTC datetime
+
+    Naive date times and all-day `date` values are interpreted in the event's
+    time zone, falling back to `default_time_zone` (all-day dates start at
+    local midnight).
+    """
+    if value is None:
+        return None
+    tz = ZoneInfo(value.time_zone or default_time_zone)
+    if value.date_time is not None:
+        if value.date_time.tzinfo is None:
+            return value.date_time.replace(tzinfo=tz).astimezone(timezone.utc)
+        return value.date_time.astimezone(timezone.utc)
+    if value.date:
+        return (
+            datetime.fromisoformat(value.date)
+            .replace(tzinfo=tz)
+            .astimezone(timezone.utc)
+        )
+    return None
+
+
+def _is_busy(event: CalendarEvent) -> bool:
+    """Whether an event blocks time (not cancelled, not free, not declined)"""
+    if event.status == "cancelled" or event.transparency == "transparent":
+        return False
+    for attendee in event.attendees:
+        if attendee.self_ and attendee.response_status == "declined":
+            return False
+    return True
+
+
+def _ts(value: datetime) -> float:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+def _dt(value: float) -> datetime:
+    return datetime.fromtimestamp(value, tz=timezone.utc)
+
+
+class BusyIntervals:
+    """
+    Sorted, merged busy intervals for one or more calendars
+
+    Building is O(n log n); `is_free` and `next_free` are O(log n) and
+    `free_slots` is O(log n + k) for k intervals inside the window.
+    Naive datetimes passed to queries are treated as UTC.
+    """
+
+    def __init__(self, intervals: Iterable[tuple[float, float]] = ()):
+        self._starts: list[float] = []
+        self._ends: list[float] = []
+        for start, end in sorted(
+            interval for interval in intervals if interval[1] > interval[0]
+        ):
+            if self._ends and start <= self._ends[-1]:
+                if end > self._ends[-1]:
+                    self._ends[-1] = end
+            else:
+                self._starts.append(start)
+                self._ends.append(end)
+
+    @classmethod
+    def from_events(
+        cls, events: Iterable[CalendarEvent], *, default_time_zone: str = "UTC"
+    ) -> "BusyIntervals":
+        """Build the index from calendar events, skipping ones that don't block time"""
+        intervals = []
+        for event in events:
+            if not _is_busy(event):
+                continue
+            start = to_utc(event.start, default_time_zone=default_time_zone)
+            end = to_utc(event.end, default_time_zone=default_time_zone)
+            if start is None or end is None:
+                continue
+            intervals.append((start.timestamp(), end.timestamp()))
+        return cls(intervals)
+
+    @classmethod
+    def union(cls, calendars: Iterable["BusyIntervals"]) -> "BusyIntervals":
+        """Combine several calendars into one (busy if anyone is busy)"""
+        return cls(
+            interval for calendar in calendars for interval in calendar._intervals()
+        )
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def _intervals(self) -> Iterable[tuple[float, float]]:
+        return zip(self._starts, self._ends)
+
+    def _busy_until(self, ts: float) -> float | None:
+        """End of the interval containing `ts`, or None if `ts` is free"""
+        i = bisect_right(self._starts, ts) - 1
+        if i >= 0 and self._ends[i] > ts:
+            return self._ends[i]
+        return None
+
+    def _next_start(self, ts: float) -> float | None:
+        """Start of the first interval beginning after `ts`"""
+        i = bisect_right(self._starts, ts)
+        return self._starts[i] if i < len(self._starts) else None
+
+    def is_free(self, *, start: datetime, end: datetime) -> bool:
+        """Whether [start, end) overlaps no busy interval"""
+        start_ts, end_ts = _ts(start), _ts(end)
+        if self._busy_until(start_ts) is not None:
+            return False
+        next_start = self._next_start(start_ts)
+        return next_start is None or next_start >= end_ts
+
+    def busy_slots(
+        self, *, window_start: datetime, window_end: datetime
+    ) -> list[TimeSlot]:
+        """Busy intervals overlapping the window, clipped to it"""
+        start_ts, end_ts = _ts(window_start), _ts(window_end)
+        slots = []
+        i = max(bisect_right(self._starts, start_ts) - 1, 0)
+        while i < len(self._starts) and self._starts[i] < end_ts:
+            if self._ends[i] > start_ts:
+                slots.append(
+                    TimeSlot(
+                        start=_dt(max(self._starts[i], start_ts)),
+                        end=_dt(min(self._ends[i], end_ts)),
+                    )
+                )
+            i += 1
+        return slots
+
+    def free_slots(
+        self,
+        *,
+        window_start: datetime,
+        window_end: datetime,
+        min_duration: timedelta = timedelta(0),
+    ) -> list[TimeSlot]:
+        """Free gaps of at least `min_duration` inside the window"""
+        start_ts, end_ts = _ts(window_start), _ts(window_end)
+        min_seconds = min_duration.total_seconds()
+        slots = []
+        cursor = self._busy_until(start_ts) or start_ts
+        i = bisect_right(self._starts, cursor)
+        while cursor < end_ts:
+            gap_end = min(self._starts[i], end_ts) if i < len(self._starts) else end_ts
+            if gap_end - cursor >= min_seconds and gap_end > cursor:
+                slots.append(TimeSlot(start=_dt(cursor), end=_dt(gap_end)))
+            if i >= len(self._starts):
+                break
+            cursor = self._ends[i]
+            i += 1
+        return slots
+
+    def next_free(self, ts: float, *, duration: float) -> float:
+        """Earliest time >= `ts` that is free for `duration` seconds"""
+        while True:
+            busy_until = self._busy_until(ts)
+            if busy_until is not None:
+                ts = busy_until
+                continue
+            next_start = self._next_start(ts)
+            if next_start is not None and next_start < ts + duration:
+                ts = self._ends[bisect_right(self._starts, next_start) - 1]
+                continue
+            return ts
+
+
+def first_common_free_slot(
+    *,
+    calendars: list[BusyIntervals],
+    window_start: datetime,
+    window_end: datetime,
+    duration: timedelta,
+) -> TimeSlot | None:
+    """
+    Earliest slot of `duration` in the window where every calendar is free
+
+    Leapfrogs a candidate start across calendars until all agree, so each step
+    is a binary search per calendar rather than a merge of all of them.
+    """
+    seconds = duration.total_seconds()
+    candidate, end_ts = _ts(window_start), _ts(window_end)
+    while candidate + seconds <= end_ts:
+        moved = False
+        for calendar in calendars:
+            next_free = calendar.next_free(candidate, duration=seconds)
+            if next_free != candidate:
+                candidate = next_free
+                moved = True
+        if not moved:
+            return TimeSlot(start=_dt(candidate), end=_dt(candidate + seconds))
+    return None
@@ -0,0 +1,103 @@
+"""
+Bounded in-process caches
+
+`TTLCache` is an LRU map whose entries also expire after a fixed time. It is
+thread-safe and counts hits and misses so callers can report how well it works.
+
+    cache = TTLCache(name="user_tokens", max_entries=1024, ttl_seconds=60)
+    value = cache.get(key)
+    if value is None:
+        value = load(key)
+        cache.set(key, value)
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Generic, Hashable, TypeVar
+from pydantic import BaseModel
+
+V = TypeVar("V")
+
+# every cache created in this process, by name, for diagnostics
+_caches: dict[str, "TTLCache"] = {}
+
+
+class CacheStats(BaseModel):
+    """Hit/miss counters for one cache"""
+
+    name: str
+    size: int
+    max_entries: int
+    ttl_seconds: float
+    hits: int
+    misses: int
+    hit_rate: float
+
+
+class TTLCache(Generic[V]):
+    """Thread-safe LRU cache with a per-entry time to live"""
+
+    def __init__(self, *, name: str, max_entries: int, ttl_seconds: float):
+        self.name = name
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+        _caches[name] = self
+
+    def get(self, key: Hashable) -> V | None:
+        """Get a live entry (refreshing its LRU position), or None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: Hashable, value: V, *, ttl_seconds: float | None = None) -> None:
+        """Store an entry, evicting the least recently used one when full"""
+        expires_at = time.monotonic() + (
+            self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        )
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop one entry"""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return CacheStats(
+                name=self.name,
+                size=len(self._entries),
+                max_entries=self.max_entries,
+                ttl_seconds=self.ttl_seconds,
+                hits=self.hits,
+                misses=self.misses,
+                hit_rate=self.hits / lookups if lookups else 0.0,
+            )
+
+
+def get_cache_stats() -> list[CacheStats]:
+    """Counters for every cache created in this process"""
+    return [cache.stats() for cache in _caches.values()]
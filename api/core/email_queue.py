@@ -0,0 +1,286 @@
+"""
+Asynchronous outbound email queue
+
+Emails are queued in process and sent in the background, so callers get a
+handle back immediately:
+
+    status = email_queue.enqueue(to=["a@example.com"], subject="Hi", body="<p>Hello</p>")
+    email_queue.get_status(status.handle)
+
+A dispatcher task collects queued emails into batches of up to
+`EMAIL__BATCH_SIZE` and sends each batch with one SES SendBulkTemplatedEmail
+call, at most `EMAIL__MAX_CONCURRENCY` at a time. The HTML layout is registered
+once as an SES template, so each email only carries its subject and body.
+Throttled calls (and throttled or transient per-email failures) are retried
+with exponential backoff.
+"""
+
+import asyncio
+import json
+import logging
+import random
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Callable, Literal
+from botocore.exceptions import ClientError
+from pydantic import BaseModel, Field
+from .cache import TTLCache
+from ..proxy.ses_client import create_ses_client
+from ..settings.config import config
+
+logger = logging.getLogger(__name__)
+
+# errors for a whole SendBulkTemplatedEmail call that are worth retrying
+THROTTLING_ERRORS = {"Throttling", "ThrottlingException", "TooManyRequestsException"}
+# per-email statuses in a bulk response that are worth retrying
+RETRYABLE_STATUSES = {"AccountThrottled", "TransientFailure"}
+
+
+class EmailStatus(BaseModel):
+    """Delivery state of one queued email"""
+
+    handle: str
+    status: Literal["queued", "sent", "failed"] = "queued"
+    to: list[str]
+    subject: str
+    requested_by: str | None = None
+    message_id: str | None = None
+    error: str | None = None
+    attempts: int = 0
+    queued_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+
+class QueuedEmail(BaseModel):
+    handle: str
+    to: list[str]
+    subject: str
+    body: str
+
+
+class EmailQueue:
+    """Batches queued emails into bulk templated SES sends"""
+
+    def __init__(
+        self,
+        *,
+        template: dict[str, str],
+        client_factory: Callable[[], Any] = create_ses_client,
+    ):
+        self.template = template
+        self._client_factory = client_factory
+        self._client: Any = None
+        self._template_ready = False
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._queue: asyncio.Queue[QueuedEmail] | None = None
+        self._dispatcher: asyncio.Task | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+        self._template_lock: asyncio.Lock | None = None
+        self._in_flight: set[asyncio.Task] = set()
+        self._statuses: TTLCache[EmailStatus] = TTLCache(
+            name="email_status",
+            max_entries=10000,
+            ttl_seconds=config.email.status_ttl_seconds,
+        )
+
+    def _ensure_started(self) -> None:
+        """Start the dispatcher on the running event loop if it isn't running"""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._dispatcher and not self._dispatcher.done():
+            return
+        self._loop = loop
+        self._queue = asyncio.Queue()
+        self._semaphore = asyncio.Semaphore(config.email.max_concurrency)
+        self._template_lock = asyncio.Lock()
+        self._dispatcher = loop.create_task(self._dispatch())
+
+    def enqueue(
+        self,
+        *,
+        to: list[str],
+        subject: str,
+        body: str,
+        requested_by: str | None = None,
+    ) -> EmailStatus:
+        """Queue an email for sending and return its status handle"""
+        self._ensure_started()
+        handle = str(uuid.uuid4())
+        status = EmailStatus(
+            handle=handle, to=to, subject=subject, requested_by=requested_by
+        )
+        self._statuses.set(handle, status)
+        self._queue.put_nowait(
+            QueuedEmail(handle=handle, to=to, subject=subject, body=body)
+        )
+        return status
+
+    def get_status(self, handle: str) -> EmailStatus | None:
+        """Get the status of a queued email, or None if unknown or expired"""
+        return self._statuses.get(handle)
+
+    def _update_status(self, handle: str, **changes: Any) -> None:
+        status = self._statuses.get(handle)
+        if status is None:
+            return
+        self._statuses.set(
+            handle,
+            status.model_copy(
+                update={**changes, "updated_at": datetime.now(timezone.utc)}
+            ),
+        )
+
+    async def _dispatch(self) -> None:
+        """Collect queued emails into batches and hand them to senders"""
+        while True:
+            batch = [await self._queue.get()]
+            deadline = self._loop.time() + config.email.batch_window_ms / 1000
+            while len(batch) < config.email.batch_size:
+                timeout = deadline - self._loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            # wait for a free slot so at most max_concurrency sends run at once
+            await self._semaphore.acquire()
+            task = self._loop.create_task(self._send_batch(batch))
+            self._in_flight.add(task)
+            task.add_done_callback(self._on_batch_done)
+
+    def _on_batch_done(self, task: asyncio.Task) -> None:
+        self._in_flight.discard(task)
+        self._semaphore.release()
+
+    async def _ensure_template(self) -> None:
+        """Create or update the SES template once per process"""
+        if self._template_ready:
+            return
+        async with self._template_lock:
+            if self._template_ready:
+                return
+            if self._client is None:
+                self._client = await asyncio.to_thread(self._client_factory)
+            name = self.template["TemplateName"]
+            try:
+                response = await asyncio.to_thread(
+                    self._client.get_template, TemplateName=name
+                )
+                if response["Template"] != self.template:
+                    await asyncio.to_thread(
+                        self._client.update_template, Template=self.template
+                    )
+            except ClientError as e:
+                if e.response["Error"]["Code"] != "TemplateDoesNotExist":
+                    raise
+                await asyncio.to_thread(
+                    self._client.create_template, Template=self.template
+                )
+                logger.info(f"Created SES template {name}")
+            self._template_ready = True
+
+    async def _backoff(self, attempt: int) -> None:
+        delay = config.email.retry_base_delay_seconds * 2**attempt
+        await asyncio.sleep(delay * random.uniform(0.5, 1.0))
+
+    async def _send_batch(self, batch: list[QueuedEmail]) -> None:
+        """Send a batch with SendBulkTemplatedEmail, retrying throttled emails"""
+        try:
+            await self._ensure_template()
+        except Exception as e:
+            logger.error(f"Failed to set up SES template: {e}")
+            for email in batch:
+                self._update_status(email.handle, status="failed", error=str(e))
+            self._mark_done(batch)
+            return
+
+        pending = batch
+        attempt = 0
+        while pending:
+            for email in pending:
+                self._update_status(email.handle, attempts=attempt + 1)
+            retry: list[QueuedEmail] = []
+            try:
+                response = await asyncio.to_thread(
+                    self._client.send_bulk_templated_email,
+                    Source=f"{config.email.source_name} <{config.email.source_email}>",
+                    Template=self.template["TemplateName"],
+                    DefaultTemplateData=json.dumps({"subject": "", "body": ""}),
+                    Destinations=[
+                        {
+                            "Destination": {"ToAddresses": email.to},
+                            "ReplacementTemplateData": json.dumps(
+                                {"subject": email.subject, "body": email.body}
+                            ),
+                        }
+                        for email in pending
+                    ],
+                )
+                for email, result in zip(pending, response["Status"]):
+                    if result["Status"] == "Success":
+                        self._update_status(
+                            email.handle,
+                            status="sent",
+                            message_id=result.get("MessageId"),
+                        )
+                    elif result["Status"] in RETRYABLE_STATUSES:
+                        retry.append(email)
+                    else:
+                        self._update_status(
+                            email.handle,
+                            status="failed",
+                            error=result.get("Error") or result["Status"],
+                        )
+            except ClientError as e:
+                if e.response["Error"]["Code"] in THROTTLING_ERRORS:
+                    retry = pending
+                else:
+                    logger.error(f"Failed to send email batch: {e}")
+                    for email in pending:
+                        self._update_status(
+                            email.handle,
+                            status="failed",
+                            error=e.response["Error"]["Message"],
+                        )
+            except Exception as e:
+                logger.error(f"Unexpected error sending email batch: {e}")
+                for email in pending:
+                    self._update_status(email.handle, status="failed", error=str(e))
+
+            if retry and attempt >= config.email.max_retries:
+                for email in retry:
+                    self._update_status(
+                        email.handle, status="failed", error="Throttled by SES"
+                    )
+                retry = []
+            if retry:
+                logger.warning(
+                    f"SES throttled {len(retry)} emails, retrying (attempt {attempt + 1})"
+                )
+                await self._backoff(attempt)
+                attempt += 1
+            pending = retry
+        self._mark_done(batch)
+
+    def _mark_done(self, batch: list[QueuedEmail]) -> None:
+        for _ in batch:
+            self._queue.task_done()
+
+    async def flush(self) -> None:
+        """Wait until every queued email has been sent or has failed"""
+        if self._queue is not None and self._loop is asyncio.get_running_loop():
+            await self._queue.join()
+
+    async def close(self, *, timeout: float = 10) -> None:
+        """Drain the queue (up to `timeout` seconds) and stop the dispatcher"""
+        if self._dispatcher is None or self._loop is not asyncio.get_running_loop():
+            return
+        try:
+            await asyncio.wait_for(self.flush(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"Email queue closed with {self._queue.qsize()} unsent emails"
+            )
+        self._dispatcher.cancel()
+        self._dispatcher = None
@@ -0,0 +1,453 @@
+"""
+Rule-based parser for simple event requests
+
+Handles the common shapes of auto-fill input without a model call, e.g.
+"lunch with Alex tomorrow 12-1", "dinner with Sam friday at 7, ask Jordan" or
+"standup 9:30am for 15 min". Relative dates are resolved against the user's
+current date, am/pm is inferred from words like "dinner" when it is missing,
+and approvers are matched against the user's relationships ("ask X" makes an
+approval required, "let X know" does not).
+
+Anything the rules can't account for lowers the confidence of the result, so
+the caller can fall back to an LLM:
+
+    parsed = parse_event_text(text, now=current_date, contacts=contacts)
+    if parsed is not None and parsed.confidence >= 0.8:
+        ...
+"""
+
+import re
+from datetime import date, datetime, time, timedelta
+from pydantic import BaseModel
+
+# an event without an end or a duration lasts this long
+DEFAULT_DURATION = timedelta(hours=1)
+
+_WEEKDAY = (
+    r"(?:mon(?:day)?|tue(?:s(?:day)?)?|wed(?:nesday)?|thu(?:r(?:s(?:day)?)?)?"
+    r"|fri(?:day)?|sat(?:urday)?|sun(?:day)?)"
+)
+_MONTH = (
+    r"(?:jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?"
+    r"|aug(?:ust)?|sept?(?:ember)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)"
+)
+_AMPM = r"[ap]\.?m\.?(?!\w)"
+# "saturday night", "tomorrow morning": only a hint for am/pm (see _guess_ampm)
+_PART_OF_DAY = r"(?:\s+(?:morning|afternoon|evening|night))?"
+
+_WEEKDAY_DATE = re.compile(
+    rf"\b(?:on\s+)?(?:(?P<rel>next|this)\s+)?(?P<weekday>{_WEEKDAY})\b\.?"
+    rf"(?:,?\s+(?P<month>{_MONTH})\.?\s+(?P<day>\d{{1,2}})(?:st|nd|rd|th)?\b)?{_PART_OF_DAY}",
+    re.I,
+)
+_MONTH_DAY_DATE = re.compile(
+    rf"\b(?:on\s+)?(?P<month>{_MONTH})\.?\s+(?P<day>\d{{1,2}})(?:st|nd|rd|th)?\b", re.I
+)
+_DAY_MONTH_DATE = re.compile(
+    rf"\b(?:on\s+)?(?:the\s+)?(?P<day>\d{{1,2}})(?:st|nd|rd|th)?\s+(?:of\s+)?(?P<month>{_MONTH})\b",
+    re.I,
+)
+_NUMERIC_DATE = re.compile(
+    r"\b(?:on\s+)?(?P<month>\d{1,2})/(?P<day>\d{1,2})(?:/(?P<year>\d{4}|\d{2}))?\b",
+    re.I,
+)
+_RELATIVE_DATE = re.compile(
+    rf"\b(?P<word>today|tonight|tomorrow|tmrw|tmr)\b{_PART_OF_DAY}", re.I
+)
+_IN_THE_PART_OF_DAY = re.compile(r"\bin\s+the\s+(?:morning|afternoon|evening)\b", re.I)
+
+_TIME_RANGE = re.compile(
+    rf"\b(?:from\s+|between\s+)?(?P<h1>\d{{1,2}})(?::(?P<m1>\d{{2}}))?\s*(?P<ap1>{_AMPM})?"
+    rf"\s*(?:-|–|to|until|till|and)\s*"
+    rf"(?P<h2>\d{{1,2}})(?::(?P<m2>\d{{2}}))?\s*(?P<ap2>{_AMPM})?(?![\w/])",
+    re.I,
+)
+_TIME = re.compile(
+    rf"(?:\b(?:at|@)\s*|@|\b)(?P<h>\d{{1,2}})(?::(?P<m>\d{{2}}))?\s*(?P<ap>{_AMPM})"
+    r"|(?:\b(?:at|@)\s*|@)(?P<h_at>\d{1,2})(?::(?P<m_at>\d{2}))?\b(?!\s*(?:min|hour|hr|/))"
+    r"|\b(?P<h_clock>\d{1,2}):(?P<m_clock>\d{2})\b"
+    r"|\b(?:at\s+)?(?P<word>noon|midnight)\b",
+    re.I,
+)
+_DURATION = re.compile(
+    r"(?<!in )\b(?:for\s+)?(?:(?P<num>\d+(?:\.\d+)?)\s*|for\s+(?P<half>half\s+an?)\s+"
+    r"|for\s+(?:an?|one)\s+)(?P<unit>hours?|hrs?|h|minutes?|mins?)\b",
+    re.I,
+)
+
+_ASK_VERBS = r"ask|check\s+with|run\s+(?:it|this)\s+by|get\s+(?:an?\s+)?(?:ok|okay|approval)\s+from"
+_NOTIFY_VERBS = r"notify|let|tell|cc|loop\s+in"
+_ANY_VERB = re.compile(
+    rf"\b(?:{_ASK_VERBS}|notify|tell|cc|loop\s+in|let\s+\w+(?:\s+\w+)?\s+know)\b", re.I
+)
+
+# words that decide am/pm when a time doesn't say
+_PM_HINTS = re.compile(
+    r"\b(?:dinner|drinks|tonight|evening|night|party|movie|happy\s+hour|afternoon|game)\b",
+    re.I,
+)
+_AM_HINTS = re.compile(r"\b(?:breakfast|brunch|morning|standup)\b", re.I)
+_LUNCH = re.compile(r"\blunch\b", re.I)
+
+# leftover words that mean the request says something the rules didn't parse
+_UNPARSED = re.compile(
+    r"\b(?:week|weekend|month|year|every|daily|weekly|monthly|after|before|until|later"
+    r"|soon|asap|sometime|or|next|this|in\s+\d+|\d+)\b",
+    re.I,
+)
+# punctuation and words left dangling at either end of the title
+_CONNECTOR = r"(?:[\s,;:.\-–@]|\b(?:on|at|from|for|and|to|by|the)\b)+"
+_CONNECTORS = re.compile(rf"^{_CONNECTOR}|{_CONNECTOR}$", re.I)
+
+
+class Contact(BaseModel):
+    """Someone the user can name in a request"""
+
+    id: str
+    name: str
+
+
+class ParsedApprover(BaseModel):
+    user_id: str
+    required: bool
+
+
+class RuleParse(BaseModel):
+    """Result of the rule-based parser; times are naive, in the user's local time"""
+
+    title: str
+    start: datetime
+    end: datetime
+    approvers: list[ParsedApprover]
+    # 1.0 when nothing was guessed; every guess or unparsed word lowers it
+    confidence: float
+    reasons: list[str]
+
+
+class _Text:
+    """The request text with the spans each rule consumed blanked out"""
+
+    def __init__(self, text: str):
+        self.original = text
+        self.remaining = text
+
+    def take(self, pattern: re.Pattern) -> list[re.Match]:
+        matches = list(pattern.finditer(self.remaining))
+        for match in matches:
+            start, end = match.span()
+            self.remaining = (
+                self.remaining[:start] + " " * (end - start) + self.remaining[end:]
+            )
+        return matches
+
+
+def _weekday_number(name: str) -> int:
+    return ["mon", "tue", "wed", "thu", "fri", "sat", "sun"].index(name[:3].lower())
+
+
+def _month_number(name: str) -> int:
+    return [
+        "jan",
+        "feb",
+        "mar",
+        "apr",
+        "may",
+        "jun",
+        "jul",
+        "aug",
+        "sep",
+        "oct",
+        "nov",
+        "dec",
+    ].index(name[:3].lower()) + 1
+
+
+def _upcoming(today: date, *, month: int, day: int, year: int | None) -> date | None:
+    """
+    A month/day without a year means the next one on or after today; None for
+    a day that doesn't exist ("feb 30", "13/1", or feb 29 this year and next)
+    """
+    years = (
+        [year + 2000 if year < 100 else year]
+        if year is not None
+        else [
+            today.year,
+            today.year + 1,
+        ]
+    )
+    for _year in years:
+        try:
+            candidate = date(_year, month, day)
+        except ValueError:
+            continue
+        if year is not None or candidate >= today:
+            return candidate
+    return None
+
+
+def _parse_dates(text: _Text, today: date, penalize) -> list[date]:
+    dates = []
+    for match in text.take(_WEEKDAY_DATE):
+        if match["month"]:
+            day = _upcoming(
+                today,
+                month=_month_number(match["month"]),
+                day=int(match["day"]),
+                year=None,
+            )
+            if day is None:
+                penalize(1.0, f"'{match[0]}' is not a date")
+                continue
+            dates.append(day)
+            if day.weekday() != _weekday_number(match["weekday"]):
+                penalize(0.5, "weekday does not match the date")
+            continue
+        days_ahead = (_weekday_number(match["weekday"]) - today.weekday()) % 7
+        rel = (match["rel"] or "").lower()
+        if rel == "next":
+            if days_ahead == 0:
+                days_ahead = 7
+            else:
+                # could be this coming one or the one in the following week
+                penalize(0.3, f"'next {match['weekday']}' is ambiguous")
+        elif days_ahead == 0:
+            penalize(0.2, f"'{match['weekday']}' could mean today or next week")
+        dates.append(today + timedelta(days=days_ahead))
+    for pattern in (_MONTH_DAY_DATE, _DAY_MONTH_DATE):
+        for match in text.take(pattern):
+            day = _upcoming(
+                today,
+                month=_month_number(match["month"]),
+                day=int(match["day"]),
+                year=None,
+            )
+            if day is None:
+                penalize(1.0, f"'{match[0]}' is not a date")
+                continue
+            dates.append(day)
+    for match in text.take(_NUMERIC_DATE):
+        day = _upcoming(
+            today,
+            month=int(match["month"]),
+            day=int(match["day"]),
+            year=int(match["year"]) if match["year"] else None,
+        )
+        if day is None:
+            penalize(1.0, f"'{match[0]}' is not a date")
+            continue
+        dates.append(day)
+    for match in text.take(_RELATIVE_DATE):
+        word = match["word"].lower()
+        dates.append(
+            today if word in ("today", "tonight") else today + timedelta(days=1)
+        )
+    return dates
+
+
+def _hour_24(hour: int, ampm: str | None) -> int:
+    ampm = ampm[0].lower()
+    if hour == 12:
+        return 0 if ampm == "a" else 12
+    return hour + 12 if ampm == "p" else hour
+
+
+def _guess_ampm(hour: int, minute: int, original: str, penalize) -> int:
+    """24-hour clock for a 1-12 hour without am/pm, from the words around it"""
+    if _PM_HINTS.search(original):
+        return _hour_24(hour, "pm")
+    if _AM_HINTS.search(original):
+        return _hour_24(hour, "am")
+    if _LUNCH.search(original):
+        return hour if hour in (10, 11) else _hour_24(hour, "pm")
+    if hour == 12 or 1 <= hour <= 6:
+        penalize(0.05, f"assumed {hour}:{minute:02d} is pm")
+        return _hour_24(hour, "pm")
+    penalize(0.15, f"assumed {hour}:{minute:02d} is am")
+    return hour
+
+
+def _clock(
+    hour: int, minute: int, ampm: str | None, original: str, penalize
+) -> time | None:
+    if minute > 59 or hour > 23 or (ampm and not 1 <= hour <= 12):
+        return None
+    if ampm:
+        return time(_hour_24(hour, ampm), minute)
+    if hour == 0 or hour > 12:
+        return time(hour, minute)
+    return time(_guess_ampm(hour, minute, original, penalize), minute)
+
+
+def _parse_times(text: _Text, penalize) -> tuple[list[time], timedelta | None]:
+    """Start times found, and the length of a range if one was given"""
+    original = text.original
+    times: list[time] = []
+    length = None
+    for match in text.take(_TIME_RANGE):
+        h1, m1 = int(match["h1"]), int(match["m1"] or 0)
+        h2, m2 = int(match["h2"]), int(match["m2"] or 0)
+        ap1, ap2 = match["ap1"], match["ap2"]
+        if ap2 and not ap1 and 1 <= h1 <= 12 and h2 <= 12:
+            # "3-5pm" is 3pm-5pm, but "11-1pm" is 11am-1pm
+            ap1 = ap2
+            if _hour_24(h1, ap1) * 60 + m1 >= _hour_24(h2, ap2) * 60 + m2:
+                ap1 = "am" if ap2[0].lower() == "p" else "pm"
+        start = _clock(h1, m1, ap1, original, penalize)
+        if start is None or h2 > 23 or m2 > 59:
+            penalize(1.0, f"unreadable time range '{match[0].strip()}'")
+            continue
+        if ap2:
+            end_minutes = _hour_24(h2, ap2) * 60 + m2 if 1 <= h2 <= 12 else -1
+        else:
+            # the first time on the clock after the start
+            end_minutes = h2 % 12 * 60 + m2
+            while end_minutes <= start.hour * 60 + start.minute:
+                end_minutes += 12 * 60
+        minutes = end_minutes - (start.hour * 60 + start.minute)
+        if not 0 < minutes <= 12 * 60:
+            penalize(1.0, f"unreadable time range '{match[0].strip()}'")
+            continue
+        times.append(start)
+        length = timedelta(minutes=minutes)
+    for match in text.take(_TIME):
+        if match["word"]:
+            times.append(time(12) if match["word"].lower() == "noon" else time(0))
+            continue
+        hour = match["h"] or match["h_at"] or match["h_clock"]
+        minute = match["m"] or match["m_at"] or match["m_clock"] or 0
+        start = _clock(int(hour), int(minute), match["ap"], original, penalize)
+        if start is None:
+            penalize(1.0, f"unreadable time '{match[0].strip()}'")
+            continue
+        times.append(start)
+    return times, length
+
+
+def _parse_duration(text: _Text) -> list[timedelta]:
+    durations = []
+    for match in text.take(_DURATION):
+        amount = float(match["num"]) if match["num"] else 0.5 if match["half"] else 1
+        unit = match["unit"].lower()
+        durations.append(
+            timedelta(hours=amount)
+            if unit.startswith("h")
+            else timedelta(minutes=amount)
+        )
+    return durations
+
+
+def _parse_approvers(
+    text: _Text, contacts: list[Contact], penalize
+) -> list[ParsedApprover]:
+    """People to ask ("ask Sam", required) or tell ("let Sam know", not required)"""
+    # a relationship without a name can't be named in a request
+    contacts = [contact for contact in contacts if contact.name.strip()]
+    if not contacts:
+        return []
+    first_names: dict[str, list[Contact]] = {}
+    for contact in contacts:
+        first_names.setdefault(contact.name.split()[0].lower(), []).append(contact)
+    by_name = {contact.name.lower(): contact for contact in contacts}
+    for first, matches in first_names.items():
+        by_name.setdefault(first, matches[0])
+
+    names = "|".join(re.escape(name) for name in sorted(by_name, key=len, reverse=True))
+    name_list = rf"(?:{names})(?:\s*(?:,|&|\band\b)\s*(?:{names}))*"
+    pattern = re.compile(
+        rf"\b(?:(?P<ask>{_ASK_VERBS})|(?P<notify>{_NOTIFY_VERBS}))\s+(?P<names>{name_list})\b(?:\s+know\b)?",
+        re.I,
+    )
+    approvers: dict[str, ParsedApprover] = {}
+    for match in text.take(pattern):
+        for name in re.split(r"\s*(?:,|&|\band\b)\s*", match["names"], flags=re.I):
+            name = name.lower()
+            if (
+                name in first_names
+                and len(first_names[name]) > 1
+                and name not in {contact.name.lower() for contact in contacts}
+            ):
+                penalize(0.5, f"more than one relationship is called '{name}'")
+            contact = by_name[name]
+            # asking anywhere in the request makes the approval required
+            previous = approvers.get(contact.id)
+            approvers[contact.id] = ParsedApprover(
+                user_id=contact.id,
+                required=bool(match["ask"])
+                or (previous is not None and previous.required),
+            )
+    return list(approvers.values())
+
+
+def parse_event_text(
+    text: str, *, now: datetime, contacts: list[Contact]
+) -> RuleParse | None:
+    """
+    Parse a one-line event request, or None if it has no recognizable time
+
+    Args:
+        text: What the user typed
+        now: The user's current date and time (its local time is used as-is)
+        contacts: All of the user's relationships, for approvers; anyone left
+            out is treated as someone who isn't a relationship
+
+    Returns:
+        The parsed event with a confidence between 0 and 1
+    """
+    confidence = 1.0
+    reasons: list[str] = []
+
+    def penalize(amount: float, reason: str) -> None:
+        nonlocal confidence
+        confidence -= amount
+        reasons.append(reason)
+
+    remaining = _Text(text)
+    approvers = _parse_approvers(remaining, contacts, penalize)
+    dates = _parse_dates(remaining, now.date(), penalize)
+    durations = _parse_duration(remaining)
+    remaining.take(_IN_THE_PART_OF_DAY)
+    times, length = _parse_times(remaining, penalize)
+
+    if not times:
+        # all-day events and "sometime friday" are left to the model
+        return None
+    if len(set(times)) > 1 or len(set(dates)) > 1 or len(durations) > 1:
+        penalize(1.0, "more than one date, time or duration")
+    if length is not None and durations:
+        penalize(0.5, "both a time range and a duration")
+
+    start_time = times[0]
+    if dates:
+        day = dates[0]
+    else:
+        day = now.date()
+        if datetime.combine(day, start_time) <= now.replace(tzinfo=None):
+            day += timedelta(days=1)
+            penalize(0.2, "time has passed today, assumed tomorrow")
+    start = datetime.combine(day, start_time)
+    if start < now.replace(tzinfo=None):
+        penalize(0.5, "start is in the past")
+    if length is None and not durations:
+        length = DEFAULT_DURATION
+        penalize(0.05, "no end time, assumed one hour")
+
+    if _ANY_VERB.search(remaining.remaining):
+        penalize(0.7, "asks or notifies someone who isn't a relationship")
+    if _UNPARSED.search(remaining.remaining):
+        penalize(0.5, "has date or time words the rules did not parse")
+    if re.search(r"\b(?:at|@)\s+\w", remaining.remaining, re.I):
+        penalize(0.3, "may name a location")
+
+    title = _CONNECTORS.sub("", " ".join(remaining.remaining.split()))
+    title = re.sub(r"\s+([,;.])", r"\1", title)
+    if not title:
+        penalize(0.5, "no title")
+
+    return RuleParse(
+        title=title[:1].upper() + title[1:],
+        start=start,
+        end=start + (length if length is not None else durations[0]),
+        approvers=approvers,
+        confidence=max(confidence, 0.0),
+        reasons=reasons,
+    )
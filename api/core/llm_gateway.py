@@ -0,0 +1,330 @@
+"""
+Gateway for outbound LLM calls: limits, and a ledger of what they cost
+
+Every model call goes through `llm_gateway.call`, which waits for a slot under
+the process-wide concurrency limit and token-bucket rate (refusing with
+`LLMRateLimitError` if none frees up within `LLM__GATEWAY_QUEUE_TIMEOUT_SECONDS`)
+and records the call's tokens, latency and cost:
+
+    async with llm_gateway.user_slot(user_id):
+        async with llm_gateway.call(model=model, purpose="smart_parse") as call:
+            response = await client.chat.completions.create(model=model, ...)
+            call.record(model=response.model, cost=cost)
+
+`user_slot` applies the per-user limits once per user request (however many
+model calls it takes), refusing immediately rather than queueing, so one user's
+burst can't use up the provider's rate limit for everyone else. `check_user`
+refuses the same way without taking a slot, for checking before a streamed
+response starts.
+
+The limits and the ledger are per process. On Lambda each container handles
+one request at a time with its own buckets, so they bound a container's calls
+(and a user's calls within it), not a user's total across containers; the
+provider's own rate limits still apply on top.
+"""
+
+import asyncio
+import json
+import logging
+import math
+import statistics
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Protocol
+from pydantic import BaseModel
+from .cache import TTLCache
+from ..settings.config import config
+
+logger = logging.getLogger(__name__)
+
+
+class LLMRateLimitError(Exception):
+    """An LLM call was refused by the per-user or process-wide limits"""
+
+    def __init__(self, message: str, *, retry_after_seconds: float):
+        super().__init__(message)
+        self.retry_after_seconds = retry_after_seconds
+
+
+class CallCost(Protocol):
+    """What the gateway records about a call (see LLMService.LLMCosts)"""
+
+    total_cost: float
+    prompt_tokens: int
+    cached_prompt_tokens: int
+    completion_tokens: int
+
+
+class TokenBucket:
+    """Allows bursts of `capacity` calls, refilled at `rate_per_second`"""
+
+    def __init__(self, *, rate_per_second: float, capacity: float):
+        self.rate_per_second = rate_per_second
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity,
+            self._tokens + (now - self._updated) * self.rate_per_second,
+        )
+        self._updated = now
+
+    def try_acquire(self) -> float:
+        """Take a token; returns 0, or the seconds until one will be available"""
+        with self._lock:
+            self._refill()
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate_per_second
+
+    def available_in(self) -> float:
+        """Seconds until a token will be available (0 if one is), without taking it"""
+        with self._lock:
+            self._refill()
+            return max(0.0, (1 - self._tokens) / self.rate_per_second)
+
+
+class LLMUsageStats(BaseModel):
+    """Aggregated calls for one purpose and model"""
+
+    purpose: str
+    model: str
+    calls: int
+    errors: int
+    prompt_tokens: int
+    cached_prompt_tokens: int
+    completion_tokens: int
+    total_cost: float
+    p50_latency_ms: float
+    p95_latency_ms: float
+
+
+class LLMGatewayStats(BaseModel):
+    """Current load and per-purpose usage of the gateway"""
+
+    in_flight: int
+    max_concurrency: int
+    rejected_user: int
+    rejected_global: int
+    total_cost: float
+    usage: list[LLMUsageStats]
+
+
+class LLMCall:
+    """One call through the gateway; `record` the response's model and cost"""
+
+    def __init__(self, *, model: str):
+        self.model = model
+        self.cost: CallCost | None = None
+
+    def record(self, *, model: str, cost: CallCost) -> None:
+        self.model = model
+        self.cost = cost
+
+
+class _UserLimits:
+    def __init__(self):
+        self.bucket = TokenBucket(
+            rate_per_second=config.llm.user_calls_per_minute / 60,
+            capacity=config.llm.user_burst,
+        )
+        self.in_flight = 0
+
+
+class _Usage:
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.prompt_tokens = 0
+        self.cached_prompt_tokens = 0
+        self.completion_tokens = 0
+        self.total_cost = 0.0
+        self.latencies: deque[float] = deque(maxlen=1024)
+
+
+class LLMGateway:
+    """Process-wide limiter and usage ledger for LLM calls"""
+
+    def __init__(self):
+        self.rejected_user = 0
+        self.rejected_global = 0
+        self._in_flight = 0
+        self._bucket = TokenBucket(
+            rate_per_second=config.llm.gateway_calls_per_minute / 60,
+            capacity=config.llm.gateway_burst,
+        )
+        self._users: TTLCache[_UserLimits] = TTLCache(
+            name="llm_user_limits", max_entries=10000, ttl_seconds=600
+        )
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+        self._usage: dict[tuple[str, str], _Usage] = {}
+        self._lock = threading.Lock()
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """The concurrency limit, recreated if the event loop has changed"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(config.llm.gateway_max_concurrency)
+        return self._semaphore
+
+    def _user_limits(self, user_id: str) -> _UserLimits:
+        limits = self._users.get(user_id)
+        if limits is None:
+            limits = _UserLimits()
+            self._users.set(user_id, limits)
+        return limits
+
+    def _check_user_concurrency(self, limits: _UserLimits) -> None:
+        if limits.in_flight >= config.llm.user_max_concurrency:
+            self.rejected_user += 1
+            raise LLMRateLimitError(
+                "Too many AI requests in progress", retry_after_seconds=1.0
+            )
+
+    def check_user(self, user_id: str | None) -> None:
+        """Raise LLMRateLimitError if `user_slot` would refuse the user now"""
+        if user_id is None:
+            return
+        limits = self._user_limits(user_id)
+        self._check_user_concurrency(limits)
+        wait = limits.bucket.available_in()
+        if wait > 0:
+            self.rejected_user += 1
+            raise LLMRateLimitError(
+                "Too many AI requests, try again shortly", retry_after_seconds=wait
+            )
+
+    @asynccontextmanager
+    async def user_slot(self, user_id: str | None) -> AsyncIterator[None]:
+        """Apply the per-user concurrency and rate limits to one user request"""
+        if user_id is None:
+            yield
+            return
+        limits = self._user_limits(user_id)
+        self._check_user_concurrency(limits)
+        wait = limits.bucket.try_acquire()
+        if wait > 0:
+            self.rejected_user += 1
+            raise LLMRateLimitError(
+                "Too many AI requests, try again shortly", retry_after_seconds=wait
+            )
+        limits.in_flight += 1
+        try:
+            yield
+        finally:
+            limits.in_flight -= 1
+
+    async def _acquire(self) -> asyncio.Semaphore:
+        """Wait for the process-wide rate and concurrency limits, up to the timeout"""
+        deadline = time.monotonic() + config.llm.gateway_queue_timeout_seconds
+        while (wait := self._bucket.try_acquire()) > 0:
+            if time.monotonic() + wait > deadline:
+                self.rejected_global += 1
+                raise LLMRateLimitError(
+                    "AI requests are busy, try again shortly", retry_after_seconds=wait
+                )
+            await asyncio.sleep(wait)
+        semaphore = self._get_semaphore()
+        try:
+            await asyncio.wait_for(
+                semaphore.acquire(), timeout=max(deadline - time.monotonic(), 0)
+            )
+        except asyncio.TimeoutError:
+            self.rejected_global += 1
+            raise LLMRateLimitError(
+                "AI requests are busy, try again shortly", retry_after_seconds=1.0
+            )
+        return semaphore
+
+    @asynccontextmanager
+    async def call(self, *, model: str, purpose: str) -> AsyncIterator[LLMCall]:
+        """Run one model call under the process-wide limits and record it"""
+        semaphore = await self._acquire()
+        call = LLMCall(model=model)
+        started = time.perf_counter()
+        self._in_flight += 1
+        error = True
+        try:
+            yield call
+            error = False
+        finally:
+            self._in_flight -= 1
+            semaphore.release()
+            self._record(purpose, call, time.perf_counter() - started, error=error)
+
+    def _record(
+        self, purpose: str, call: LLMCall, latency_seconds: float, *, error: bool
+    ) -> None:
+        cost = call.cost
+        with self._lock:
+            usage = self._usage.setdefault((purpose, call.model), _Usage())
+            usage.calls += 1
+            usage.errors += error
+            usage.latencies.append(latency_seconds * 1000)
+            if cost is not None:
+                usage.prompt_tokens += cost.prompt_tokens
+                usage.cached_prompt_tokens += cost.cached_prompt_tokens
+                usage.completion_tokens += cost.completion_tokens
+                usage.total_cost += cost.total_cost
+        # one line per call, so the logs are a complete ledger
+        logger.info(
+            "LLM call "
+            + json.dumps(
+                {
+                    "purpose": purpose,
+                    "model": call.model,
+                    "error": error,
+                    "latency_ms": round(latency_seconds * 1000, 1),
+                    "prompt_tokens": cost.prompt_tokens if cost else None,
+                    "cached_prompt_tokens": cost.cached_prompt_tokens if cost else None,
+                    "completion_tokens": cost.completion_tokens if cost else None,
+                    "cost": cost.total_cost if cost else None,
+                }
+            )
+        )
+
+    def stats(self) -> LLMGatewayStats:
+        with self._lock:
+            usage = []
+            for (purpose, model), entry in self._usage.items():
+                latencies = sorted(entry.latencies)
+                usage.append(
+                    LLMUsageStats(
+                        purpose=purpose,
+                        model=model,
+                        calls=entry.calls,
+                        errors=entry.errors,
+                        prompt_tokens=entry.prompt_tokens,
+                        cached_prompt_tokens=entry.cached_prompt_tokens,
+                        completion_tokens=entry.completion_tokens,
+                        total_cost=entry.total_cost,
+                        p50_latency_ms=(
+                            statistics.median(latencies) if latencies else 0.0
+                        ),
+                        p95_latency_ms=(
+                            latencies[math.ceil(0.95 * len(latencies)) - 1]
+                            if latencies
+                            else 0.0
+                        ),
+                    )
+                )
+        return LLMGatewayStats(
+            in_flight=self._in_flight,
+            max_concurrency=config.llm.gateway_max_concurrency,
+            rejected_user=self.rejected_user,
+            rejected_global=self.rejected_global,
+            total_cost=sum(entry.total_cost for entry in usage),
+            usage=usage,
+        )
+
+
+llm_gateway = LLMGateway()
@@ -0,0 +1,94 @@
+"""
+In-process fan-out of new notifications to connected clients
+
+Every open notification stream holds a `Subscription` for its user, and
+`NotificationsService.create_notification` publishes each new notification to
+all of that user's subscriptions in this process.
+
+    with notification_hub.subscribe(user_id) as subscription:
+        notification = await subscription.next(timeout=15)
+"""
+
+import asyncio
+import logging
+from contextlib import contextmanager
+from typing import Iterator
+from ..models.v1.notifications import NotificationData
+from ..settings.config import config
+
+logger = logging.getLogger(__name__)
+
+
+class Subscription:
+    """One client's buffered view of a user's new notifications"""
+
+    def __init__(self, *, user_id: str, max_size: int):
+        self.user_id = user_id
+        self.overflowed = False
+        self._queue: asyncio.Queue[NotificationData] = asyncio.Queue(maxsize=max_size)
+
+    def put(self, notification: NotificationData) -> bool:
+        """Buffer a notification; marks the subscription overflowed when full"""
+        try:
+            self._queue.put_nowait(notification)
+            return True
+        except asyncio.QueueFull:
+            self.overflowed = True
+            return False
+
+    async def next(self, *, timeout: float) -> NotificationData | None:
+        """Wait for the next notification, or None after `timeout` seconds"""
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class NotificationHub:
+    """Registry of open subscriptions by user"""
+
+    def __init__(self, *, max_queue_size: int):
+        self.max_queue_size = max_queue_size
+        self._subscriptions: dict[str, set[Subscription]] = {}
+
+    @contextmanager
+    def subscribe(self, user_id: str) -> Iterator[Subscription]:
+        """Register a subscription for the duration of the block"""
+        subscription = Subscription(user_id=user_id, max_size=self.max_queue_size)
+        self._subscriptions.setdefault(user_id, set()).add(subscription)
+        try:
+            yield subscription
+        finally:
+            subscriptions = self._subscriptions.get(user_id)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self._subscriptions[user_id]
+
+    def publish(self, notification: NotificationData) -> int:
+        """
+        Deliver a notification to its user's subscriptions in this process
+
+        Returns:
+            Number of subscriptions that received it
+        """
+        delivered = 0
+        for subscription in list(self._subscriptions.get(notification.user_id, ())):
+            if subscription.put(notification):
+                delivered += 1
+            else:
+                logger.warning(
+                    f"Notification stream for user {notification.user_id} fell behind, closing it"
+                )
+        return delivered
+
+    def subscriber_count(self, user_id: str | None = None) -> int:
+        """Open subscriptions for one user, or for everyone"""
+        if user_id is not None:
+            return len(self._subscriptions.get(user_id, ()))
+        return sum(len(subscriptions) for subscriptions in self._subscriptions.values())
+
+
+notification_hub = NotificationHub(
+    max_queue_size=config.notifications.stream_queue_size
+)
@@ -0,0 +1,39 @@
+"""
+Keyset (cursor) pagination on `(created_at, id)`
+
+Lists are ordered newest first by `created_at`, with `id` breaking ties, so the
+next page is everything strictly "before" the last row of the current one.
+The position is handed to clients as an opaque cursor:
+
+    cursor = encode_cursor(created_at=row.created_at, id=row.id)
+    created_at, id = decode_cursor(cursor)
+"""
+
+import base64
+import json
+from datetime import datetime
+
+
+class InvalidCursorError(ValueError):
+    """The cursor was not produced by `encode_cursor`"""
+
+
+def encode_cursor(*, created_at: datetime, id: str) -> str:
+    """Encode a row's position as an opaque, URL-safe cursor"""
+    raw = json.dumps([created_at.isoformat(), str(id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    """
+    Decode a cursor back into the `(created_at, id)` it points at
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), str(id)
+    except Exception as e:
+        raise InvalidCursorError(f"Invalid cursor: {cursor}") from e
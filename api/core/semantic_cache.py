@@ -0,0 +1,249 @@
+"""
+Two-tier response cache for LLM calls
+
+Tier 1 is an exact match on a normalized key (TTL + LRU, via `TTLCache`).
+Tier 2, when embeddings are supplied, reuses a cached response for a
+near-identical phrasing: entries are grouped by a partition (e.g. the user's
+relationship context and date bucket) and matched by cosine similarity, but only
+when the texts share the same "signature" of numbers, weekdays, months and
+am/pm words, so "dinner at 7" never reuses the answer for "dinner at 8".
+
+    cache = SemanticCache(name="smart_parse", max_entries=1024, ttl_seconds=3600)
+    hit = cache.get(key, partition=partition, text=text, embedding=embedding)
+    if hit is None:
+        value = call_llm()
+        cache.set(key, value, cost=cost, partition=partition, text=text, embedding=embedding)
+
+When the embedding costs a call, look up the exact tier first and only embed
+on a miss:
+
+    hit = cache.get_exact(key)
+    if hit is None:
+        hit = cache.get_similar(partition=partition, text=text, embedding=embed(text))
+"""
+
+import math
+import re
+import threading
+from collections import OrderedDict
+from typing import Generic, Hashable, Literal, TypeVar
+from pydantic import BaseModel
+from .cache import TTLCache
+
+V = TypeVar("V")
+
+# every semantic cache created in this process, by name, for diagnostics
+_semantic_caches: dict[str, "SemanticCache"] = {}
+
+_SIGNATURE_TOKEN = re.compile(
+    r"\d+|\b(?:mon|tue|wed|thu|fri|sat|sun|jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec"
+    r"|am|pm|noon|midnight|today|tonight|tomorrow|next|last|this)[a-z]*\b"
+)
+
+
+def normalize_text(text: str) -> str:
+    """Lowercase and collapse whitespace and trailing punctuation"""
+    return " ".join(text.lower().split()).strip(" .!?")
+
+
+def text_signature(text: str) -> tuple[str, ...]:
+    """Tokens that must match exactly for two phrasings to mean the same thing"""
+    return tuple(_SIGNATURE_TOKEN.findall(normalize_text(text)))
+
+
+def _unit(vector: list[float]) -> list[float]:
+    norm = math.sqrt(sum(x * x for x in vector)) or 1.0
+    return [x / norm for x in vector]
+
+
+class SemanticCacheStats(BaseModel):
+    """Hit counters and savings for one semantic cache"""
+
+    name: str
+    size: int
+    exact_hits: int
+    semantic_hits: int
+    misses: int
+    hit_rate: float
+    dollars_saved: float
+
+
+class _CachedResponse(BaseModel, Generic[V]):
+    value: V
+    cost: float
+
+
+class SemanticCache(Generic[V]):
+    """Exact-match cache with an optional embedding-similarity tier"""
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        max_entries: int,
+        ttl_seconds: float,
+        similarity_threshold: float = 0.95,
+    ):
+        self.name = name
+        self.max_entries = max_entries
+        self.similarity_threshold = similarity_threshold
+        self.exact_hits = 0
+        self.semantic_hits = 0
+        self.misses = 0
+        self.dollars_saved = 0.0
+        self._responses: TTLCache[_CachedResponse] = TTLCache(
+            name=name, max_entries=max_entries, ttl_seconds=ttl_seconds
+        )
+        # partition -> key -> (unit embedding, signature), oldest first
+        self._embeddings: dict[
+            Hashable, OrderedDict[Hashable, tuple[list[float], tuple[str, ...]]]
+        ] = {}
+        self._embedding_count = 0
+        self._lock = threading.Lock()
+        _semantic_caches[name] = self
+
+    def _similar_key(
+        self, *, partition: Hashable, text: str, embedding: list[float]
+    ) -> Hashable | None:
+        signature = text_signature(text)
+        query = _unit(embedding)
+        best_key, best_score = None, self.similarity_threshold
+        with self._lock:
+            for key, (vector, entry_signature) in self._embeddings.get(
+                partition, {}
+            ).items():
+                if entry_signature != signature:
+                    continue
+                score = sum(a * b for a, b in zip(query, vector))
+                if score >= best_score:
+                    best_key, best_score = key, score
+        return best_key
+
+    def get(
+        self,
+        key: Hashable,
+        *,
+        partition: Hashable = None,
+        text: str | None = None,
+        embedding: list[float] | None = None,
+    ) -> tuple[V, Literal["exact", "semantic"]] | None:
+        """Get a cached value and the tier that matched, or None"""
+        hit = self.get_exact(key)
+        if hit is None:
+            hit = self.get_similar(partition=partition, text=text, embedding=embedding)
+        return hit
+
+    def get_exact(self, key: Hashable) -> tuple[V, Literal["exact"]] | None:
+        """
+        Get a value cached under `key`, or None; a None isn't counted as a miss
+        until `get_similar` (or `record_miss`) also comes up empty
+        """
+        cached = self._responses.get(key)
+        if cached is None:
+            return None
+        with self._lock:
+            self.exact_hits += 1
+            self.dollars_saved += cached.cost
+        return cached.value, "exact"
+
+    def get_similar(
+        self,
+        *,
+        partition: Hashable = None,
+        text: str | None = None,
+        embedding: list[float] | None = None,
+    ) -> tuple[V, Literal["semantic"]] | None:
+        """Get the value cached for a near-identical text, or None (a miss)"""
+        cached = None
+        if embedding is not None and text is not None:
+            similar_key = self._similar_key(
+                partition=partition, text=text, embedding=embedding
+            )
+            if similar_key is not None:
+                cached = self._responses.get(similar_key)
+                if cached is None:
+                    self._forget(partition, similar_key)
+
+        with self._lock:
+            if cached is None:
+                self.misses += 1
+                return None
+            self.semantic_hits += 1
+            self.dollars_saved += cached.cost
+        return cached.value, "semantic"
+
+    def record_miss(self) -> None:
+        """Count a lookup answered without either tier after `get_exact` missed"""
+        with self._lock:
+            self.misses += 1
+
+    def set(
+        self,
+        key: Hashable,
+        value: V,
+        *,
+        cost: float = 0.0,
+        partition: Hashable = None,
+        text: str | None = None,
+        embedding: list[float] | None = None,
+    ) -> None:
+        """Cache a value (and index its embedding for the similarity tier)"""
+        self._responses.set(key, _CachedResponse(value=value, cost=cost))
+        if embedding is None or text is None:
+            return
+        with self._lock:
+            entries = self._embeddings.setdefault(partition, OrderedDict())
+            if key not in entries:
+                self._embedding_count += 1
+            entries[key] = (_unit(embedding), text_signature(text))
+            entries.move_to_end(key)
+            # keep the index no larger than the response cache
+            while self._embedding_count > self.max_entries:
+                oldest_partition = next(iter(self._embeddings))
+                self._forget_locked(
+                    oldest_partition, next(iter(self._embeddings[oldest_partition]))
+                )
+
+    def _forget(self, partition: Hashable, key: Hashable) -> None:
+        with self._lock:
+            self._forget_locked(partition, key)
+
+    def _forget_locked(self, partition: Hashable, key: Hashable) -> None:
+        entries = self._embeddings.get(partition)
+        if entries is None or key not in entries:
+            return
+        del entries[key]
+        self._embedding_count -= 1
+        if not entries:
+            del self._embeddings[partition]
+
+    def clear(self) -> None:
+        self._responses.clear()
+        with self._lock:
+            self._embeddings.clear()
+            self._embedding_count = 0
+            self.exact_hits = 0
+            self.semantic_hits = 0
+            self.misses = 0
+            self.dollars_saved = 0.0
+
+    def stats(self) -> SemanticCacheStats:
+        size = self._responses.stats().size
+        with self._lock:
+            lookups = self.exact_hits + self.semantic_hits + self.misses
+            return SemanticCacheStats(
+                name=self.name,
+                size=size,
+                exact_hits=self.exact_hits,
+                semantic_hits=self.semantic_hits,
+                misses=self.misses,
+                hit_rate=(
+                    (self.exact_hits + self.semantic_hits) / lookups if lookups else 0.0
+                ),
+                dollars_saved=self.dollars_saved,
+            )
+
+
+def get_semantic_cache_stats() -> list[SemanticCacheStats]:
+    """Counters for every semantic cache created in this process"""
+    return [cache.stats() for cache in _semantic_caches.values()]
@@ -0,0 +1,114 @@
+"""
+Latency and cost counters for each tier of a routed call
+
+A request is tried on the cheapest tier first and escalated when that tier's
+answer isn't confident enough. Each tier records every attempt, whether its
+answer was accepted, how long it took and what it cost:
+
+    tier = TierMetrics(name="smart_parse.rules")
+    tier.record(latency_seconds=elapsed, cost=0.0, accepted=True)
+    tier.record(latency_seconds=elapsed, cost=0.0012, accepted=False, prompt_tokens=900)
+"""
+
+import math
+import statistics
+import threading
+from collections import deque
+from pydantic import BaseModel
+
+# every tier created in this process, by name, for diagnostics
+_tiers: dict[str, "TierMetrics"] = {}
+
+
+class TierStats(BaseModel):
+    """Counters for one tier"""
+
+    name: str
+    calls: int
+    accepted: int
+    escalated: int
+    errors: int
+    accept_rate: float
+    p50_latency_ms: float
+    p95_latency_ms: float
+    total_cost: float
+    cost_per_call: float
+    prompt_tokens_per_call: float
+    # share of prompt tokens served from the provider's prompt cache
+    cached_prompt_ratio: float
+    completion_tokens_per_call: float
+
+
+class TierMetrics:
+    """Thread-safe counters, with latency percentiles over the last `window` calls"""
+
+    def __init__(self, *, name: str, window: int = 1024):
+        self.name = name
+        self.calls = 0
+        self.accepted = 0
+        self.errors = 0
+        self.total_cost = 0.0
+        self.prompt_tokens = 0
+        self.cached_prompt_tokens = 0
+        self.completion_tokens = 0
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+        _tiers[name] = self
+
+    def record(
+        self,
+        *,
+        latency_seconds: float,
+        cost: float = 0.0,
+        accepted: bool,
+        error: bool = False,
+        prompt_tokens: int = 0,
+        cached_prompt_tokens: int = 0,
+        completion_tokens: int = 0,
+    ) -> None:
+        """Count one attempt; rejected and failed attempts escalate to the next tier"""
+        with self._lock:
+            self.calls += 1
+            self.accepted += accepted
+            self.errors += error
+            self.total_cost += cost
+            self.prompt_tokens += prompt_tokens
+            self.cached_prompt_tokens += cached_prompt_tokens
+            self.completion_tokens += completion_tokens
+            self._latencies.append(latency_seconds * 1000)
+
+    def stats(self) -> TierStats:
+        with self._lock:
+            latencies = sorted(self._latencies)
+            return TierStats(
+                name=self.name,
+                calls=self.calls,
+                accepted=self.accepted,
+                escalated=self.calls - self.accepted,
+                errors=self.errors,
+                accept_rate=self.accepted / self.calls if self.calls else 0.0,
+                p50_latency_ms=statistics.median(latencies) if latencies else 0.0,
+                p95_latency_ms=(
+                    latencies[math.ceil(0.95 * len(latencies)) - 1]
+                    if latencies
+                    else 0.0
+                ),
+                total_cost=self.total_cost,
+                cost_per_call=self.total_cost / self.calls if self.calls else 0.0,
+                prompt_tokens_per_call=(
+                    self.prompt_tokens / self.calls if self.calls else 0.0
+                ),
+                cached_prompt_ratio=(
+                    self.cached_prompt_tokens / self.prompt_tokens
+                    if self.prompt_tokens
+                    else 0.0
+                ),
+                completion_tokens_per_call=(
+                    self.completion_tokens / self.calls if self.calls else 0.0
+                ),
+            )
+
+
+def get_tier_stats() -> list[TierStats]:
+    """Counters for every tier created in this process"""
+    return [tier.stats() for tier in _tiers.values()]
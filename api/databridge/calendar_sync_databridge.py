@@ -0,0 +1,179 @@
+from supabase import AsyncClient
+from pydantic import BaseModel
+from datetime import datetime
+from typing import Any
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class DBCalendarSyncStateResponse(BaseModel):
+    user_id: str
+    calendar_id: str
+    sync_token: str | None
+    last_synced_at: datetime | None
+
+
+class DBCalendarEventResponse(BaseModel):
+    event_id: str
+    start_time: datetime | None
+    end_time: datetime | None
+    data: dict[str, Any]  # JSONB field
+
+
+class CalendarSyncDatabridge:
+    def __init__(self, supabase: AsyncClient):
+        self.supabase = supabase
+        self.sync_state = self.supabase.table("calendar_sync_state")
+        self.calendar_events = self.supabase.table("calendar_events")
+
+    async def get_sync_state(
+        self, *, user_id: str, calendar_id: str
+    ) -> DBCalendarSyncStateResponse | None:
+        """Get the sync state for a user's calendar"""
+        try:
+            response = await (
+                self.sync_state.select(
+                    "user_id, calendar_id, sync_token, last_synced_at"
+                )
+                .eq("user_id", user_id)
+                .eq("calendar_id", calendar_id)
+                .execute()
+            )
+            if not response.data:
+                return None
+
+            return DBCalendarSyncStateResponse(**response.data[0])
+        except Exception as e:
+            logger.error(f"Error fetching calendar sync state: {e}")
+            return None
+
+    async def upsert_sync_state(
+        self,
+        *,
+        user_id: str,
+        calendar_id: str,
+        sync_token: str | None,
+        last_synced_at: datetime | None,
+    ) -> bool:
+        """Create or replace the sync state for a user's calendar"""
+        try:
+            data = {
+                "user_id": user_id,
+                "calendar_id": calendar_id,
+                "sync_token": sync_token,
+                "last_synced_at": (
+                    last_synced_at.isoformat() if last_synced_at else None
+                ),
+                "updated_at": datetime.now().isoformat(),
+            }
+            response = await self.sync_state.upsert(
+                data, on_conflict="user_id,calendar_id"
+            ).execute()
+            return bool(response.data)
+        except Exception as e:
+            logger.error(f"Error saving calendar sync state: {e}")
+            return False
+
+    async def mark_stale(self, *, user_id: str, calendar_id: str) -> bool:
+        """Clear last_synced_at so the next read syncs (the sync token is kept)"""
+        try:
+            await self.sync_state.update(
+                {"last_synced_at": None, "updated_at": datetime.now().isoformat()}
+            ).eq("user_id", user_id).eq("calendar_id", calendar_id).execute()
+            return True
+        except Exception as e:
+            logger.error(f"Error marking calendar sync state stale: {e}")
+            return False
+
+    async def upsert_events(
+        self,
+        *,
+        user_id: str,
+        calendar_id: str,
+        events: list[dict[str, Any]],
+        updated_at: datetime | None = None,
+    ) -> bool:
+        """
+        Insert or replace stored events in one multi-row upsert
+
+        Each event dict needs event_id, start_time, end_time and data.
+        """
+        if not events:
+            return True
+        try:
+            now = (updated_at or datetime.now()).isoformat()
+            rows = [
+                {
+                    "user_id": user_id,
+                    "calendar_id": calendar_id,
+                    "event_id": event["event_id"],
+                    "start_time": event["start_time"],
+                    "end_time": event["end_time"],
+                    "data": event["data"],
+                    "updated_at": now,
+                }
+                for event in events
+            ]
+            await self.calendar_events.upsert(
+                rows, on_conflict="user_id,calendar_id,event_id"
+            ).execute()
+            return True
+        except Exception as e:
+            logger.error(f"Error saving calendar events: {e}")
+            return False
+
+    async def delete_events(
+        self, *, user_id: str, calendar_id: str, event_ids: list[str]
+    ) -> bool:
+        """Delete stored events by Google event ID"""
+        if not event_ids:
+            return True
+        try:
+            await self.calendar_events.delete().eq("user_id", user_id).eq(
+                "calendar_id", calendar_id
+            ).in_("event_id", event_ids).execute()
+            return True
+        except Exception as e:
+            logger.error(f"Error deleting calendar events: {e}")
+            return False
+
+    async def delete_events_updated_before(
+        self, *, user_id: str, calendar_id: str, updated_before: datetime
+    ) -> bool:
+        """Delete stored events not written since `updated_before` (after a full resync)"""
+        try:
+            await self.calendar_events.delete().eq("user_id", user_id).eq(
+                "calendar_id", calendar_id
+            ).lt("updated_at", updated_before.isoformat()).execute()
+            return True
+        except Exception as e:
+            logger.error(f"Error deleting stale calendar events: {e}")
+            return False
+
+    async def get_events_in_range(
+        self,
+        *,
+        user_id: str,
+        calendar_id: str,
+        time_min: datetime,
+        time_max: datetime,
+    ) -> list[DBCalendarEventResponse] | None:
+        """Get stored events overlapping [time_min, time_max), ordered by start time"""
+        try:
+            response = await (
+                self.calendar_events.select("event_id, start_time, end_time, data")
+                .eq("user_id", user_id)
+                .eq("calendar_id", calendar_id)
+                .lt("start_time", time_max.isoformat())
+                .gt("end_time", time_min.isoformat())
+                .order("start_time")
+                .execute()
+            )
+            if not response.data:
+                return []
+
+            return [DBCalendarEventResponse(**item) for item in response.data]
+        except Exception as e:
+            logger.error(f"Error fetching stored calendar events: {e}")
+            return None
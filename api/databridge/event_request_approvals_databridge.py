@@ -1,5 +1,5 @@
 from ..settings.database import get_supabase_admin_client
-from supabase import Client
+from supabase import AsyncClient
 from pydantic import BaseModel
 from datetime import datetime
 import api.models.v1.event_request_approvals as era_models
@@ -18,7 +18,7 @@ class DBEventRequestApprovalResponse(BaseModel):
 
 
 class EventRequestApprovalsDatabridge:
-    def __init__(self, supabase: Client):
+    def __init__(self, supabase: AsyncClient):
         self.supabase = supabase
         self.event_request_approvals = self.supabase.table("event_request_approvals")
 
@@ -38,7 +38,7 @@ class EventRequestApprovalsDatabridge:
                 approval_data["status"] = "pending"
                 data.append(approval_data)
 
-            response = self.event_request_approvals.insert(data).execute()
+            response = await self.event_request_approvals.insert(data).execute()
             if not response.data:
                 return []
             return [DBEventRequestApprovalResponse(**item) for item in response.data]
@@ -58,7 +58,7 @@ class EventRequestApprovalsDatabridge:
                 "status": "pending",
             }
 
-            response = self.event_request_approvals.insert(data).execute()
+            response = await self.event_request_approvals.insert(data).execute()
             if not response.data:
                 return None
 
@@ -73,7 +73,7 @@ class EventRequestApprovalsDatabridge:
     ) -> DBEventRequestApprovalResponse | None:
         """Get a specific event request approval by ID"""
         try:
-            response = (
+            response = await (
                 self.event_request_approvals.select("*")
                 .eq("id", approval_id)
                 .single()
@@ -108,7 +108,7 @@ class EventRequestApprovalsDatabridge:
             if required is not None:
                 query = query.eq("required", required)
 
-            response = query.execute()
+            response = await query.execute()
             if not response.data:
                 return []
 
@@ -122,7 +122,7 @@ class EventRequestApprovalsDatabridge:
     ) -> list[DBEventRequestApprovalResponse]:
         """Get all approvals for a specific event request"""
         try:
-            response = (
+            response = await (
                 self.event_request_approvals.select("*")
                 .eq("event_request_id", event_request_id)
                 .execute()
@@ -140,7 +140,7 @@ class EventRequestApprovalsDatabridge:
     ) -> list[DBEventRequestApprovalResponse]:
         """Get all pending approvals for a user"""
         try:
-            response = (
+            response = await (
                 self.event_request_approvals.select("*")
                 .eq("user_id", user_id)
                 .eq("status", "pending")
@@ -168,7 +168,7 @@ class EventRequestApprovalsDatabridge:
             if status != "pending":
                 update_data["responded_at"] = datetime.now().isoformat()
 
-            response = (
+            response = await (
                 self.event_request_approvals.update(update_data)
                 .eq("id", approval_id)
                 .execute()
@@ -184,7 +184,7 @@ class EventRequestApprovalsDatabridge:
     async def delete_event_request_approval(self, *, approval_id: str) -> bool:
         """Delete an event request approval"""
         try:
-            response = (
+            response = await (
                 self.event_request_approvals.delete().eq("id", approval_id).execute()
             )
             return response.data is not None and len(response.data) > 0
@@ -195,7 +195,7 @@ class EventRequestApprovalsDatabridge:
     async def delete_approvals_by_event_request(self, *, event_request_id: str) -> bool:
         """Delete all approvals for a specific event request"""
         try:
-            response = (
+            response = await (
                 self.event_request_approvals.delete()
                 .eq("event_request_id", event_request_id)
                 .execute()
@@ -210,7 +210,7 @@ class EventRequestApprovalsDatabridge:
     ) -> DBEventRequestApprovalResponse | None:
         """Check if an approval already exists for user and event request"""
         try:
-            response = (
+            response = await (
                 self.event_request_approvals.select("*")
                 .eq("event_request_id", event_request_id)
                 .eq("user_id", user_id)
@@ -231,7 +231,7 @@ class EventRequestApprovalsDatabridge:
         """Check if all required approvals for an event request are complete"""
         try:
             # Get all required approvals for this event request
-            response = (
+            response = await (
                 self.event_request_approvals.select("*")
                 .eq("event_request_id", event_request_id)
                 .eq("required", True)
@@ -1,5 +1,5 @@
 from ..settings.database import get_supabase_admin_client
-from supabase import Client
+from supabase import AsyncClient
 from pydantic import BaseModel
 from datetime import datetime
 import logging
@@ -41,7 +41,7 @@ class DBEventRequestWithApprovalsResponse(BaseModel):
     approval_status: str
     requested_approvals: int
     completed_count: int
-    total_count: int
+    total_count: int | None
 
 
 class DBEventRequestApprovalResponse(BaseModel):
@@ -73,8 +73,14 @@ class DBEventRequestWithApproversResponse(BaseModel):
     approvers: list[DBEventRequestApprovalResponse]
 
 
+class DBEventRequestApproverEmailResponse(BaseModel):
+    user_id: str
+    email: str
+    required: bool
+
+
 class EventRequestsDatabridge:
-    def __init__(self, supabase: Client):
+    def __init__(self, supabase: AsyncClient):
         self.supabase = supabase
         self.event_requests = self.supabase.table("event_requests")
 
@@ -106,7 +112,7 @@ class EventRequestsDatabridge:
                 "created_by": created_by,
             }
 
-            response = self.event_requests.insert(data).execute()
+            response = await self.event_requests.insert(data).execute()
             if not response.data:
                 return None
 
@@ -121,7 +127,7 @@ class EventRequestsDatabridge:
     ) -> DBEventRequestResponse | None:
         """Get a specific event request by ID"""
         try:
-            response = (
+            response = await (
                 self.event_requests.select("*")
                 .eq("id", event_request_id)
                 .single()
@@ -155,7 +161,7 @@ class EventRequestsDatabridge:
             # Note: Date filtering on JSONB fields would require more complex queries
             # For now, we'll filter in the application layer if needed
 
-            response = query.order("created_at", desc=True).execute()
+            response = await query.order("created_at", desc=True).execute()
             if not response.data:
                 return []
 
@@ -186,7 +192,7 @@ class EventRequestsDatabridge:
             # Note: Date filtering on JSONB fields would require more complex queries
             # For now, we'll filter in the application layer if needed
 
-            response = query.order("created_at", desc=True).execute()
+            response = await query.order("created_at", desc=True).execute()
             if not response.data:
                 return []
 
@@ -232,7 +238,7 @@ class EventRequestsDatabridge:
             if notes is not None:
                 update_data["notes"] = notes
 
-            response = (
+            response = await (
                 self.event_requests.update(update_data)
                 .eq("id", event_request_id)
                 .execute()
@@ -248,7 +254,7 @@ class EventRequestsDatabridge:
     async def delete_event_request(self, *, event_request_id: str) -> bool:
         """Delete an event request"""
         try:
-            response = self.event_requests.delete().eq("id", event_request_id).execute()
+            response = await self.event_requests.delete().eq("id", event_request_id).execute()
             return response.data is not None and len(response.data) > 0
         except Exception as e:
             logger.info(f"Error deleting event request: {e}")
@@ -259,7 +265,7 @@ class EventRequestsDatabridge:
     ) -> DBEventRequestResponse | None:
         """Get an event request by Google Calendar event ID"""
         try:
-            response = (
+            response = await (
                 self.event_requests.select("*")
                 .eq("google_event_id", google_event_id)
                 .single()
@@ -280,16 +286,26 @@ class EventRequestsDatabridge:
         status: str | None = None,
         skip: int = 0,
         take: int = 50,
+        cursor: tuple[datetime, str] | None = None,
+        include_total: bool = True,
     ) -> list[DBEventRequestWithApprovalsResponse]:
-        """List event requests with approval status aggregation using SQL function"""
+        """
+        List event requests with approval status aggregation using SQL function
+
+        Rows are ordered newest first by (created_at, id); `cursor` returns only
+        rows after that position, and total_count is null unless `include_total`
+        """
         try:
-            response = self.supabase.rpc(
+            response = await self.supabase.rpc(
                 "list_event_requests_with_approvals",
                 {
                     "p_user_id": user_id,
                     "p_status": status,
                     "p_skip": skip,
                     "p_take": take,
+                    "p_cursor_created_at": cursor[0].isoformat() if cursor else None,
+                    "p_cursor_id": cursor[1] if cursor else None,
+                    "p_include_total": include_total,
                 },
             ).execute()
 
@@ -309,7 +325,7 @@ class EventRequestsDatabridge:
         """Get a specific event request with all its approvers and approval data"""
         try:
             # Get the event request
-            event_response = (
+            event_response = await (
                 self.event_requests.select("*")
                 .eq("id", event_request_id)
                 .single()
@@ -320,7 +336,7 @@ class EventRequestsDatabridge:
                 return None
 
             # Get all approvals for this event request
-            approvals_response = (
+            approvals_response = await (
                 self.supabase.table("event_request_approvals")
                 .select("*")
                 .eq("event_request_id", event_request_id)
@@ -342,3 +358,22 @@ class EventRequestsDatabridge:
         except Exception as e:
             logger.info(f"Error fetching event request with approvers: {e}")
             return None
+
+    async def get_event_request_approver_emails(
+        self, *, event_request_id: str
+    ) -> list[DBEventRequestApproverEmailResponse]:
+        """Get the approvers of an event request with their email addresses"""
+        try:
+            response = await self.supabase.rpc(
+                "get_event_request_approver_emails",
+                {"p_event_request_id": event_request_id},
+            ).execute()
+            if not response.data:
+                return []
+
+            return [
+                DBEventRequestApproverEmailResponse(**item) for item in response.data
+            ]
+        except Exception as e:
+            logger.info(f"Error fetching event request approver emails: {e}")
+            return []
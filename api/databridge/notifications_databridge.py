@@ -1,5 +1,5 @@
 from api.settings.database import get_supabase_admin_client
-from supabase import Client
+from supabase import AsyncClient
 from pydantic import BaseModel
 from datetime import datetime
 from typing import Any
@@ -22,13 +22,15 @@ class DBNotificationResponse(BaseModel):
 
 class DBNotificationsListResponse(BaseModel):
     notifications: list[DBNotificationResponse]
-    total_count: int
+    total_count: int | None
+    has_more: bool = False
 
 
 class NotificationsDatabridge:
-    def __init__(self, supabase: Client):
+    def __init__(self, supabase: AsyncClient):
         self.supabase = supabase
         self.notifications = self.supabase.table("notifications")
+        self.notification_counters = self.supabase.table("notification_counters")
 
     async def create_notification(
         self,
@@ -47,7 +49,7 @@ class NotificationsDatabridge:
                 "payload": payload or {},
             }
 
-            response = self.notifications.insert(data).execute()
+            response = await self.notifications.insert(data).execute()
             if not response.data:
                 return None
 
@@ -57,12 +59,41 @@ class NotificationsDatabridge:
             logger.error(f"Error creating notification: {e}")
             return None
 
+    async def create_notifications_batch(
+        self,
+        *,
+        user_ids: list[str],
+        title: str,
+        message: str,
+        payload: dict[str, Any] | None = None,
+    ) -> list[DBNotificationResponse]:
+        """Create the same notification for several users in one insert"""
+        try:
+            data = [
+                {
+                    "user_id": user_id,
+                    "title": title,
+                    "message": message,
+                    "payload": payload or {},
+                }
+                for user_id in user_ids
+            ]
+
+            response = await self.notifications.insert(data).execute()
+            if not response.data:
+                return []
+
+            return [DBNotificationResponse(**item) for item in response.data]
+        except Exception as e:
+            logger.error(f"Error creating notifications batch: {e}")
+            return []
+
     async def get_notification_by_id(
         self, *, notification_id: str
     ) -> DBNotificationResponse | None:
         """Get a specific notification by ID"""
         try:
-            response = (
+            response = await (
                 self.notifications.select("*")
                 .eq("id", notification_id)
                 .execute()
@@ -84,38 +115,48 @@ class NotificationsDatabridge:
         is_deleted: bool | None = None,
         skip: int = 0,
         take: int = 50,
+        cursor: tuple[datetime, str] | None = None,
+        include_total: bool = True,
     ) -> DBNotificationsListResponse:
-        """Get notifications for a user with optional filters and pagination"""
+        """
+        Get notifications for a user with optional filters and pagination
+
+        Rows are ordered newest first by (created_at, id). When `cursor` is set
+        only rows after that position are returned (keyset pagination); the
+        total count is fetched in the same query only when `include_total` is set.
+        """
         try:
-            query = self.notifications.select("*").eq("user_id", user_id)
+            query = self.notifications.select(
+                "*", count="exact" if include_total else None
+            ).eq("user_id", user_id)
 
             # Apply filters
             if is_read is not None:
                 query = query.eq("is_read", is_read)
             if is_deleted is not None:
                 query = query.eq("is_deleted", is_deleted)
+            if cursor is not None:
+                created_at, id = cursor
+                query = query.or_(
+                    f'created_at.lt."{created_at.isoformat()}",'
+                    f'and(created_at.eq."{created_at.isoformat()}",id.lt.{id})'
+                )
+
+            # Apply pagination, fetching one extra row to tell if there are more
+            query = (
+                query.order("created_at", desc=True)
+                .order("id", desc=True)
+                .range(skip, skip + take)
+            )
 
-            # Apply pagination
-            query = query.range(skip, skip + take - 1).order("created_at", desc=True)
-
-            response = query.execute()
-            if not response.data:
-                return DBNotificationsListResponse(notifications=[], total_count=0)
-
-            notifications = [DBNotificationResponse(**item) for item in response.data]
-
-            # Get total count with same filters
-            count_query = self.notifications.select("id", count="exact").eq("user_id", user_id)
-            if is_read is not None:
-                count_query = count_query.eq("is_read", is_read)
-            if is_deleted is not None:
-                count_query = count_query.eq("is_deleted", is_deleted)
-
-            count_response = count_query.execute()
-            total_count = count_response.count if count_response.count else 0
+            response = await query.execute()
+            rows = response.data or []
+            notifications = [DBNotificationResponse(**item) for item in rows[:take]]
 
             return DBNotificationsListResponse(
-                notifications=notifications, total_count=total_count
+                notifications=notifications,
+                total_count=(response.count or 0) if include_total else None,
+                has_more=len(rows) > take,
             )
         except Exception as e:
             logger.error(f"Error fetching user notifications: {e}")
@@ -137,7 +178,7 @@ class NotificationsDatabridge:
             if is_deleted is not None:
                 update_data["is_deleted"] = is_deleted
 
-            response = (
+            response = await (
                 self.notifications.update(update_data)
                 .eq("id", notification_id)
                 .execute()
@@ -153,7 +194,7 @@ class NotificationsDatabridge:
     async def delete_notification(self, *, notification_id: str) -> bool:
         """Delete a notification"""
         try:
-            response = self.notifications.delete().eq("id", notification_id).execute()
+            response = await self.notifications.delete().eq("id", notification_id).execute()
             return response.data is not None and len(response.data) > 0
         except Exception as e:
             logger.error(f"Error deleting notification: {e}")
@@ -162,7 +203,7 @@ class NotificationsDatabridge:
     async def mark_all_as_read(self, *, user_id: str) -> int:
         """Mark all notifications as read for a user"""
         try:
-            response = (
+            response = await (
                 self.notifications.update({"is_read": True, "updated_at": datetime.now().isoformat()})
                 .eq("user_id", user_id)
                 .eq("is_read", False)
@@ -172,3 +213,19 @@ class NotificationsDatabridge:
         except Exception as e:
             logger.error(f"Error marking all notifications as read: {e}")
             return 0
+
+    async def get_unread_count(self, *, user_id: str) -> int | None:
+        """Get the trigger-maintained unread notification count for a user"""
+        try:
+            response = await (
+                self.notification_counters.select("unread_count")
+                .eq("user_id", user_id)
+                .execute()
+            )
+            if not response.data:
+                return 0
+
+            return response.data[0]["unread_count"]
+        except Exception as e:
+            logger.error(f"Error fetching unread notification count: {e}")
+            return None
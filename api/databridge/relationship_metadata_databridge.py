@@ -1,5 +1,5 @@
 from ..settings.database import get_supabase_admin_client
-from supabase import Client
+from supabase import AsyncClient
 from pydantic import BaseModel
 from datetime import datetime
 import logging
@@ -17,7 +17,7 @@ class DBRelationshipMetadataResponse(BaseModel):
 
 
 class RelationshipMetadataDatabridge:
-    def __init__(self, supabase: Client):
+    def __init__(self, supabase: AsyncClient):
         self.supabase = supabase
         self.relationship_metadata = self.supabase.table("relationship_metadata")
 
@@ -32,7 +32,7 @@ class RelationshipMetadataDatabridge:
                 "relationship_type": relationship_type,
             }
 
-            response = self.relationship_metadata.insert(data).execute()
+            response = await self.relationship_metadata.insert(data).execute()
             if not response.data:
                 return None
 
@@ -47,7 +47,7 @@ class RelationshipMetadataDatabridge:
     ) -> DBRelationshipMetadataResponse | None:
         """Get specific relationship metadata by ID"""
         try:
-            response = (
+            response = await (
                 self.relationship_metadata.select("*")
                 .eq("id", metadata_id)
                 .single()
@@ -77,7 +77,7 @@ class RelationshipMetadataDatabridge:
             if relationship_type:
                 query = query.eq("relationship_type", relationship_type)
 
-            response = query.execute()
+            response = await query.execute()
             if not response.data:
                 return []
 
@@ -91,7 +91,7 @@ class RelationshipMetadataDatabridge:
     ) -> list[DBRelationshipMetadataResponse]:
         """Get all metadata for a specific relationship"""
         try:
-            response = (
+            response = await (
                 self.relationship_metadata.select("*")
                 .eq("relationship_id", relationship_id)
                 .execute()
@@ -114,7 +114,7 @@ class RelationshipMetadataDatabridge:
                 "updated_at": datetime.now().isoformat(),
             }
 
-            response = (
+            response = await (
                 self.relationship_metadata.update(update_data)
                 .eq("id", metadata_id)
                 .execute()
@@ -130,7 +130,7 @@ class RelationshipMetadataDatabridge:
     async def delete_relationship_metadata(self, *, metadata_id: str) -> bool:
         """Delete relationship metadata"""
         try:
-            response = (
+            response = await (
                 self.relationship_metadata.delete().eq("id", metadata_id).execute()
             )
             return response.data is not None and len(response.data) > 0
@@ -143,7 +143,7 @@ class RelationshipMetadataDatabridge:
     ) -> bool:
         """Delete all metadata for a specific relationship"""
         try:
-            response = (
+            response = await (
                 self.relationship_metadata.delete()
                 .eq("relationship_id", relationship_id)
                 .execute()
@@ -158,7 +158,7 @@ class RelationshipMetadataDatabridge:
     ) -> DBRelationshipMetadataResponse | None:
         """Check if metadata already exists for user and relationship"""
         try:
-            response = (
+            response = await (
                 self.relationship_metadata.select("*")
                 .eq("user_id", user_id)
                 .eq("relationship_id", relationship_id)
@@ -1,5 +1,5 @@
 from ..settings.database import get_supabase_admin_client
-from supabase import Client
+from supabase import AsyncClient
 from pydantic import BaseModel
 from datetime import datetime
 import logging
@@ -32,7 +32,7 @@ class DBRelationshipRequestResponseWithUser(BaseModel):
 
 
 class RelationshipRequestsDatabridge:
-    def __init__(self, supabase: Client):
+    def __init__(self, supabase: AsyncClient):
         self.supabase = supabase
         self.relationship_requests = self.supabase.table("relationship_requests")
 
@@ -47,7 +47,7 @@ class RelationshipRequestsDatabridge:
                 "status": "pending",
             }
 
-            response = self.relationship_requests.insert(data).execute()
+            response = await self.relationship_requests.insert(data).execute()
             if not response.data:
                 return None
 
@@ -62,7 +62,7 @@ class RelationshipRequestsDatabridge:
     ) -> DBRelationshipRequestResponse | None:
         """Get a specific relationship request by ID"""
         try:
-            response = self.supabase.rpc(
+            response = await self.supabase.rpc(
                 "get_relationship_request_with_user", {"p_request_id": request_id}
             ).execute()
 
@@ -97,7 +97,7 @@ class RelationshipRequestsDatabridge:
     ) -> list[DBRelationshipRequestResponse]:
         """Get all relationship requests sent by a user"""
         try:
-            response = self.supabase.rpc(
+            response = await self.supabase.rpc(
                 "get_sent_relationship_requests",
                 {"p_requester_id": requester_id, "p_status": status},
             ).execute()
@@ -136,7 +136,7 @@ class RelationshipRequestsDatabridge:
     ) -> list[DBRelationshipRequestResponseWithUser]:
         """Get all relationship requests received by a user (by email)"""
         try:
-            response = self.supabase.rpc(
+            response = await self.supabase.rpc(
                 "get_received_relationship_requests",
                 {"p_requested_email": user_email, "p_status": status},
             ).execute()
@@ -177,7 +177,7 @@ class RelationshipRequestsDatabridge:
             # First update the record
             update_data = {"status": status, "updated_at": datetime.now().isoformat()}
 
-            response = (
+            response = await (
                 self.relationship_requests.update(update_data)
                 .eq("id", request_id)
                 .execute()
@@ -194,7 +194,7 @@ class RelationshipRequestsDatabridge:
     async def delete_relationship_request(self, *, request_id: str) -> bool:
         """Delete a relationship request"""
         try:
-            response = (
+            response = await (
                 self.relationship_requests.delete().eq("id", request_id).execute()
             )
             return response.data is not None and len(response.data) > 0
@@ -207,7 +207,7 @@ class RelationshipRequestsDatabridge:
     ) -> DBRelationshipRequestResponse | None:
         """Check if a relationship request already exists"""
         try:
-            response = (
+            response = await (
                 self.relationship_requests.select("*")
                 .eq("requester_id", requester_id)
                 .eq("requested_email", requested_email)
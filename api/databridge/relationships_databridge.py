@@ -1,5 +1,5 @@
 from ..settings.database import get_supabase_admin_client
-from supabase import Client
+from supabase import AsyncClient
 from pydantic import BaseModel
 from datetime import datetime
 import logging
@@ -28,11 +28,11 @@ class DBRelationshipWithUserResponse(BaseModel):
 
 class DBRelationshipsListResponse(BaseModel):
     relationships: list[DBRelationshipWithUserResponse]
-    total_count: int
+    total_count: int | None
 
 
 class RelationshipsDatabridge:
-    def __init__(self, supabase: Client):
+    def __init__(self, supabase: AsyncClient):
         self.supabase = supabase
         self.relationships = self.supabase.table("relationships")
 
@@ -41,7 +41,7 @@ class RelationshipsDatabridge:
     ) -> list[DBRelationshipWithUserResponse]:
         """Search for relationships by query"""
         try:
-            response = self.supabase.rpc(
+            response = await self.supabase.rpc(
                 "search_relationships", {"p_query": query, "p_user_id": user_id}
             ).execute()
             if not response.data:
@@ -58,7 +58,7 @@ class RelationshipsDatabridge:
         try:
             data = {"user_id_1": user_id_1, "user_id_2": user_id_2}
 
-            response = self.relationships.insert(data).execute()
+            response = await self.relationships.insert(data).execute()
             if not response.data:
                 return None
 
@@ -73,7 +73,7 @@ class RelationshipsDatabridge:
     ) -> DBRelationshipResponse | None:
         """Get a specific relationship by ID (legacy method for backward compatibility)"""
         try:
-            response = (
+            response = await (
                 self.relationships.select("*")
                 .eq("id", relationship_id)
                 .single()
@@ -92,7 +92,7 @@ class RelationshipsDatabridge:
     ) -> DBRelationshipWithUserResponse | None:
         """Get a specific relationship by ID with other user data"""
         try:
-            response = self.supabase.rpc(
+            response = await self.supabase.rpc(
                 "get_relationship_by_id_with_user",
                 {
                     "p_relationship_id": relationship_id,
@@ -117,7 +117,7 @@ class RelationshipsDatabridge:
                 f"user_id_1.eq.{user_id},user_id_2.eq.{user_id}"
             )
 
-            response = query.execute()
+            response = await query.execute()
             if not response.data:
                 return []
 
@@ -127,28 +127,44 @@ class RelationshipsDatabridge:
             return []
 
     async def get_user_relationships_with_users(
-        self, *, user_id: str, skip: int = 0, take: int = 10
+        self,
+        *,
+        user_id: str,
+        skip: int = 0,
+        take: int = 10,
+        cursor: tuple[datetime, str] | None = None,
+        include_total: bool = True,
     ) -> DBRelationshipsListResponse:
-        """Get relationships for a user with other user data and pagination"""
+        """
+        Get relationships for a user with other user data and pagination
+
+        Rows are ordered newest first by (created_at, id); `cursor` returns only
+        rows after that position, and total_count is None unless `include_total`
+        """
         try:
-            response = self.supabase.rpc(
+            response = await self.supabase.rpc(
                 "get_user_relationships",
                 {
                     "p_user_id": user_id,
                     "p_skip": skip,
                     "p_take": take,
+                    "p_cursor_created_at": cursor[0].isoformat() if cursor else None,
+                    "p_cursor_id": cursor[1] if cursor else None,
+                    "p_include_total": include_total,
                 },
             ).execute()
 
             if not response.data:
-                return DBRelationshipsListResponse(relationships=[], total_count=0)
+                return DBRelationshipsListResponse(
+                    relationships=[], total_count=0 if include_total else None
+                )
 
             relationships = []
-            total_count = 0
+            total_count = None
 
             for item in response.data:
                 relationships.append(DBRelationshipWithUserResponse(**item))
-                total_count = item.get("total_count", 0)
+                total_count = item.get("total_count")
 
             return DBRelationshipsListResponse(
                 relationships=relationships, total_count=total_count
@@ -164,7 +180,7 @@ class RelationshipsDatabridge:
         try:
             update_data = {"updated_at": datetime.now().isoformat()}
 
-            response = (
+            response = await (
                 self.relationships.update(update_data)
                 .eq("id", relationship_id)
                 .execute()
@@ -180,7 +196,7 @@ class RelationshipsDatabridge:
     async def delete_relationship(self, *, relationship_id: str) -> bool:
         """Delete a relationship"""
         try:
-            response = self.relationships.delete().eq("id", relationship_id).execute()
+            response = await self.relationships.delete().eq("id", relationship_id).execute()
             return response.data is not None and len(response.data) > 0
         except Exception as e:
             logger.info(f"Error deleting relationship: {e}")
@@ -191,7 +207,7 @@ class RelationshipsDatabridge:
     ) -> DBRelationshipResponse | None:
         """Check if a relationship already exists between two users"""
         try:
-            response = (
+            response = await (
                 self.relationships.select("*")
                 .or_(
                     f"and(user_id_1.eq.{user_id_1},user_id_2.eq.{user_id_2}),"
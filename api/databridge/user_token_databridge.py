@@ -1,6 +1,9 @@
 from ..settings.database import get_supabase_admin_client
-from supabase import Client
+from ..settings.config import config
+from ..core.cache import TTLCache
+from supabase import AsyncClient
 from pydantic import BaseModel
+from datetime import datetime
 import logging
 
 logger = logging.getLogger(__name__)
@@ -9,17 +12,32 @@ logger = logging.getLogger(__name__)
 class DBUserTokenResponse(BaseModel):
     google_access_token: str
     google_refresh_token: str
+    google_token_expires_at: datetime | None = None
+
+
+# Shared by every databridge instance (they are created per request)
+_user_tokens_cache: TTLCache[DBUserTokenResponse] = TTLCache(
+    name="user_tokens",
+    max_entries=config.google.token_cache_max_entries,
+    ttl_seconds=config.google.token_cache_ttl_seconds,
+)
 
 
 class UserTokenDatabridge:
-    def __init__(self, supabase: Client):
+    def __init__(self, supabase: AsyncClient):
         self.supabase = supabase
         self.user_tokens = self.supabase.table("user_tokens")
 
     async def get_user_tokens(self, *, user_id: str) -> DBUserTokenResponse | None:
+        """Get a user's Google tokens, served from the in-process cache when fresh"""
+        cached = _user_tokens_cache.get(user_id)
+        if cached is not None:
+            return cached
         try:
-            response = (
-                self.user_tokens.select("google_access_token, google_refresh_token")
+            response = await (
+                self.user_tokens.select(
+                    "google_access_token, google_refresh_token, google_token_expires_at"
+                )
                 .eq("id", user_id)
                 .single()
                 .execute()
@@ -28,10 +46,47 @@ class UserTokenDatabridge:
                 return None
 
             _data = response.data
-            return DBUserTokenResponse(
+            tokens = DBUserTokenResponse(
                 google_access_token=_data["google_access_token"],
                 google_refresh_token=_data["google_refresh_token"],
+                google_token_expires_at=_data.get("google_token_expires_at"),
             )
+            _user_tokens_cache.set(user_id, tokens)
+            return tokens
         except Exception as e:
             logger.info(f"Error fetching user tokens: {e}")
             return None
+
+    async def update_user_tokens(
+        self,
+        *,
+        user_id: str,
+        google_access_token: str,
+        google_refresh_token: str,
+        google_token_expires_at: datetime | None,
+    ) -> bool:
+        """Write back refreshed Google tokens (drops the cached row)"""
+        try:
+            response = await (
+                self.user_tokens.update(
+                    {
+                        "google_access_token": google_access_token,
+                        "google_refresh_token": google_refresh_token,
+                        "google_token_expires_at": (
+                            google_token_expires_at.isoformat()
+                            if google_token_expires_at
+                            else None
+                        ),
+                        "updated_at": datetime.now().isoformat(),
+                    }
+                )
+                .eq("id", user_id)
+                .execute()
+            )
+            return bool(response.data)
+        except Exception as e:
+            logger.error(f"Error updating user tokens: {e}")
+            return False
+        finally:
+            # after the write, so a concurrent read can't cache the old row again
+            _user_tokens_cache.invalidate(user_id)
@@ -7,7 +7,7 @@ Dependencies are organized by layer: databridges and services.
 
 from fastapi import Depends
 from .settings.database import get_supabase_admin_client
-from supabase import Client
+from supabase import AsyncClient
 
 # Import all databridges
 from .databridge.relationships_databridge import RelationshipsDatabridge
@@ -19,6 +19,7 @@ from .databridge.event_request_approvals_databridge import (
 )
 from .databridge.user_token_databridge import UserTokenDatabridge
 from .databridge.notifications_databridge import NotificationsDatabridge
+from .databridge.calendar_sync_databridge import CalendarSyncDatabridge
 
 # Import all services
 from .services.relationships_service import RelationshipsService
@@ -30,51 +31,60 @@ from .services.google_events_service import GoogleEventsService
 from .services.emails_service import EmailsService
 from .services.llm_service import LLMService
 from .services.notifications_service import NotificationsService
+from .services.calendar_sync_service import CalendarSyncService
+from .services.google_token_service import GoogleTokenService
 
 
 # Databridge Dependencies
 def get_relationships_databridge(
-    supabase: Client = Depends(get_supabase_admin_client),
+    supabase: AsyncClient = Depends(get_supabase_admin_client),
 ) -> RelationshipsDatabridge:
     """Dependency to get relationships databridge instance"""
     return RelationshipsDatabridge(supabase=supabase)
 
 
 def get_relationship_metadata_databridge(
-    supabase: Client = Depends(get_supabase_admin_client),
+    supabase: AsyncClient = Depends(get_supabase_admin_client),
 ) -> RelationshipMetadataDatabridge:
     """Dependency to get relationship metadata databridge instance"""
     return RelationshipMetadataDatabridge(supabase=supabase)
 
 
 def get_relationship_requests_databridge(
-    supabase: Client = Depends(get_supabase_admin_client),
+    supabase: AsyncClient = Depends(get_supabase_admin_client),
 ) -> RelationshipRequestsDatabridge:
     """Dependency to get relationship requests databridge instance"""
     return RelationshipRequestsDatabridge(supabase=supabase)
 
 
 def get_event_requests_databridge(
-    supabase: Client = Depends(get_supabase_admin_client),
+    supabase: AsyncClient = Depends(get_supabase_admin_client),
 ) -> EventRequestsDatabridge:
     """Dependency to get event requests databridge instance"""
     return EventRequestsDatabridge(supabase=supabase)
 
 
 def get_event_request_approvals_databridge(
-    supabase: Client = Depends(get_supabase_admin_client),
+    supabase: AsyncClient = Depends(get_supabase_admin_client),
 ) -> EventRequestApprovalsDatabridge:
     """Dependency to get event request approvals databridge instance"""
     return EventRequestApprovalsDatabridge(supabase=supabase)
 
 
 def get_user_token_databridge(
-    supabase: Client = Depends(get_supabase_admin_client),
+    supabase: AsyncClient = Depends(get_supabase_admin_client),
 ) -> UserTokenDatabridge:
     """Dependency to get user token databridge instance"""
     return UserTokenDatabridge(supabase=supabase)
 
 
+def get_calendar_sync_databridge(
+    supabase: AsyncClient = Depends(get_supabase_admin_client),
+) -> CalendarSyncDatabridge:
+    """Dependency to get calendar sync databridge instance"""
+    return CalendarSyncDatabridge(supabase=supabase)
+
+
 # Service Dependencies
 def get_relationships_service(
     databridge: RelationshipsDatabridge = Depends(get_relationships_databridge),
@@ -104,6 +114,13 @@ def get_relationship_requests_service(
     )
     
 
+def get_google_token_service(
+    user_token_databridge: UserTokenDatabridge = Depends(get_user_token_databridge),
+) -> GoogleTokenService:
+    """Dependency to get google token service instance"""
+    return GoogleTokenService(user_token_databridge=user_token_databridge)
+
+
 def get_llm_service() -> LLMService:
     """Dependency to get LLM service instance"""
     return LLMService()
@@ -118,13 +135,19 @@ def get_event_requests_service(
     databridge: EventRequestsDatabridge = Depends(get_event_requests_databridge),
     llm_service: LLMService = Depends(get_llm_service),
     relationships_service: RelationshipsService = Depends(get_relationships_service),
+    google_token_service: GoogleTokenService = Depends(get_google_token_service),
 ) -> EventRequestsService:
     """Dependency to get event requests service instance"""
-    return EventRequestsService(databridge=databridge, llm_service=llm_service, relationships_service=relationships_service)
+    return EventRequestsService(
+        databridge=databridge,
+        llm_service=llm_service,
+        relationships_service=relationships_service,
+        google_token_service=google_token_service,
+    )
 
 
 def get_notifications_databridge(
-    supabase: Client = Depends(get_supabase_admin_client),
+    supabase: AsyncClient = Depends(get_supabase_admin_client),
 ) -> NotificationsDatabridge:
     """Dependency to get notifications databridge instance"""
     return NotificationsDatabridge(supabase=supabase)
@@ -147,11 +170,22 @@ def get_event_request_approvals_service(
     return EventRequestApprovalsService(databridge=databridge, notification_service=notification_service)
 
 
+def get_calendar_sync_service(
+    databridge: CalendarSyncDatabridge = Depends(get_calendar_sync_databridge),
+) -> CalendarSyncService:
+    """Dependency to get calendar sync service instance"""
+    return CalendarSyncService(databridge=databridge)
+
+
 def get_google_events_service(
-    user_token_databridge: UserTokenDatabridge = Depends(get_user_token_databridge),
+    google_token_service: GoogleTokenService = Depends(get_google_token_service),
+    calendar_sync_service: CalendarSyncService = Depends(get_calendar_sync_service),
 ) -> GoogleEventsService:
     """Dependency to get google events service instance"""
-    return GoogleEventsService(user_token_databridge=user_token_databridge)
+    return GoogleEventsService(
+        google_token_service=google_token_service,
+        calendar_sync_service=calendar_sync_service,
+    )
 
 
 def get_emails_service() -> EmailsService:
@@ -5,6 +5,9 @@ from fastapi.templating import Jinja2Templates
 from fastapi import Request
 from .settings.config import config
 from .routers.v1 import v1_router
+from .settings.database import init_supabase_clients, close_supabase_clients
+from .services.emails_service import email_queue
+from contextlib import asynccontextmanager
 import api.settings.auth as auth
 from api.settings.config import config
 from mangum import Mangum
@@ -15,8 +18,20 @@ logging.basicConfig(level=logging.INFO)
 log = logging.getLogger(__name__)
 log.info("Starting AmIA API...")
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Mangum runs with lifespan="off", so on Lambda the clients are created on
+    # first use instead
+    await init_supabase_clients()
+    yield
+    # send anything still queued before shutting down
+    await email_queue.close()
+    await close_supabase_clients()
+
+
 app = FastAPI(
     title="AmIA API",
+    lifespan=lifespan,
     description="A comprehensive recipe and meal planning API",
     version="1.0.0",
     openapi_tags=[],
@@ -45,6 +60,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Session-Id"],
 )
 
 app.include_router(v1_router)
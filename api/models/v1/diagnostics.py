@@ -0,0 +1,39 @@
+from pydantic import BaseModel
+from api.core.cache import CacheStats
+from api.core.llm_gateway import LLMGatewayStats
+from api.core.semantic_cache import SemanticCacheStats
+from api.core.tier_metrics import TierStats
+
+
+# ============================================================================
+# RESPONSE MODELS
+# ============================================================================
+
+
+class CacheDiagnosticsResponse(BaseModel):
+    """Response model for in-process cache counters"""
+
+    status: str = "success"
+    caches: list[CacheStats]
+    semantic_caches: list[SemanticCacheStats]
+
+
+class TierDiagnosticsResponse(BaseModel):
+    """Response model for routed-call tier counters"""
+
+    status: str = "success"
+    tiers: list[TierStats]
+
+
+class LLMUsageDiagnosticsResponse(BaseModel):
+    """Response model for LLM gateway load and usage"""
+
+    status: str = "success"
+    gateway: LLMGatewayStats
+
+
+class SecretsRefreshResponse(BaseModel):
+    """Response model for a secrets refresh"""
+
+    status: str = "success"
+    message: str
@@ -1,4 +1,5 @@
 from pydantic import BaseModel
+from api.core.email_queue import EmailStatus
 
 
 class SendEmailRequest(BaseModel):
@@ -9,4 +10,11 @@ class SendEmailRequest(BaseModel):
 
 class SendEmailResponse(BaseModel):
     message: str
+    # look up delivery with GET /emails/{handle}
+    handle: str
     message_id: str | None = None
+
+
+class EmailStatusResponse(BaseModel):
+    status: str = "success"
+    email: EmailStatus
@@ -1,6 +1,6 @@
 from pydantic import BaseModel, Field
 from datetime import datetime, timezone, timedelta
-from typing import Literal
+from typing import Any, Literal
 import api.models.v1.event_request_approvals as era_models
 
 
@@ -165,6 +165,12 @@ class ListEventRequestsWithApprovalsRequest(BaseModel):
         description="Number of records to return (max 100)",
         example=25,
     )
+    cursor: str | None = Field(
+        None, description="Cursor from a previous page's next_cursor"
+    )
+    include_total: bool | None = Field(
+        None, description="Compute total_count (defaults to first page only)"
+    )
 
 
 class DeleteEventRequestRequest(BaseModel):
@@ -217,6 +223,16 @@ class SmartParseEvent(BaseModel):
         example=[{"user_id": "user-123", "required": True}],
     )
 
+class SmartParseFieldUpdate(BaseModel):
+    """One field of a smart parse, streamed as soon as the model has written it"""
+
+    field: str = Field(description="SmartParseEvent field name", example="title")
+    value: Any = Field(
+        description="Field value, as it will appear in the final event request",
+        example="Dinner with Sam",
+    )
+
+
 class SmartParseEventRequestResponse(BaseModel):
     """Response model for smart parse event request"""
     status: str = "success"
@@ -325,9 +341,12 @@ class EventRequestsWithApprovalsListResponse(BaseModel):
     status: str = "success"
     event_requests: list[EventRequestWithApprovalsData]
     count: int
-    total_count: int
+    # only computed when requested (by default on the first page)
+    total_count: int | None
     skip: int
     take: int
+    # pass as `cursor` to get the next page; None on the last page
+    next_cursor: str | None = None
     filters: dict[str, str | int] | None = None
 
 
@@ -359,4 +378,35 @@ class EventRequestWithApproversResponse(BaseModel):
 
     status: str = "success"
     event_request: EventRequestWithApproversData
-    message: str | None = None
\ No newline at end of file
+    message: str | None = None
+
+class BusyPeriodData(BaseModel):
+    """A time range in which an approver is busy"""
+
+    start: datetime = Field(description="Start of the busy period")
+    end: datetime = Field(description="End of the busy period")
+
+
+class ApproverAvailabilityData(BaseModel):
+    """Free/busy status of one approver for an event request's time window"""
+
+    user_id: str = Field(description="UUID of the approver")
+    email: str = Field(description="Approver email address")
+    required: bool = Field(description="Whether this approval is required")
+    availability: Literal["free", "busy", "unknown"] = Field(
+        description="'unknown' if the approver's calendar could not be read"
+    )
+    busy: list[BusyPeriodData] = Field(
+        default_factory=list, description="Busy periods overlapping the event"
+    )
+
+
+class EventRequestAvailabilityResponse(BaseModel):
+    """Response model for approver availability of an event request"""
+
+    status: str = "success"
+    event_request_id: str
+    time_min: datetime
+    time_max: datetime
+    approvers: list[ApproverAvailabilityData]
+    all_free: bool = Field(description="Whether every approver is known to be free")
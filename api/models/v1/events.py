@@ -1,7 +1,7 @@
-from pydantic import BaseModel, Field
-from typing import Any
+from pydantic import BaseModel, Field, model_validator
+from typing import Any, Literal
 from datetime import datetime
-from ...proxy.models.google_models import CalendarEvent, CalendarInfo
+from ...proxy.models.google_models import BatchEventResult, CalendarEvent, CalendarInfo
 
 
 # ============================================================================
@@ -240,6 +240,43 @@ class MoveEventRequest(BaseModel):
     send_notifications: bool = True
 
 
+class BatchEventOperationRequest(BaseModel):
+    """One event mutation within a batch request"""
+
+    method: Literal["create", "update", "delete", "move"] = Field(
+        description="Operation to perform", example="create"
+    )
+    calendar_id: str = Field("primary", description="Calendar ID (source calendar for moves)")
+    event_id: str | None = Field(
+        None, description="Event ID (required for update, delete and move)"
+    )
+    event_data: EventData | None = Field(
+        None, description="Event data (required for create and update)"
+    )
+    destination_calendar_id: str | None = Field(
+        None, description="Destination calendar ID (required for move)"
+    )
+    send_notifications: bool = Field(True, description="Send notifications to attendees")
+
+    @model_validator(mode="after")
+    def check_required_fields(self) -> "BatchEventOperationRequest":
+        if self.method != "create" and not self.event_id:
+            raise ValueError(f"event_id is required for {self.method}")
+        if self.method in ("create", "update") and self.event_data is None:
+            raise ValueError(f"event_data is required for {self.method}")
+        if self.method == "move" and not self.destination_calendar_id:
+            raise ValueError("destination_calendar_id is required for move")
+        return self
+
+
+class BatchEventsRequest(BaseModel):
+    """Request model for mutating many events in one call"""
+
+    operations: list[BatchEventOperationRequest] = Field(
+        min_length=1, max_length=500, description="Operations to perform"
+    )
+
+
 class TodayEventsRequest(BaseModel):
     """Request model for getting today's events"""
 
@@ -273,6 +310,13 @@ class EventListResponse(BaseModel):
     period: str | None = None
 
 
+class EventStreamError(BaseModel):
+    """Trailing NDJSON line emitted when an event stream fails part way through"""
+
+    status: str = "error"
+    detail: str
+
+
 class EventResponse(BaseModel):
     """Response model for single event operations"""
 
@@ -353,3 +397,12 @@ class CalendarListResponse(BaseModel):
     status: str = "success"
     calendars: list[CalendarInfo]
     count: int
+
+
+class BatchEventsResponse(BaseModel):
+    """Response model for batch event operations"""
+
+    status: str = "success"
+    results: list[BatchEventResult]
+    succeeded: int
+    failed: int
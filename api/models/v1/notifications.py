@@ -55,6 +55,12 @@ class GetNotificationsRequest(BaseModel):
     take: int = Field(
         default=50, ge=1, le=100, description="Number of records to take (max 100)"
     )
+    cursor: str | None = Field(
+        None, description="Cursor from a previous page's next_cursor"
+    )
+    include_total: bool | None = Field(
+        None, description="Compute total_count (defaults to first page only)"
+    )
 
 
 class MarkAllAsReadRequest(BaseModel):
@@ -105,9 +111,12 @@ class NotificationsListResponse(BaseModel):
     status: str = "success"
     notifications: list[NotificationData]
     count: int
-    total_count: int
+    # only computed when requested (by default on the first page)
+    total_count: int | None
     skip: int
     take: int
+    # pass as `cursor` to get the next page; None on the last page
+    next_cursor: str | None = None
     filters: dict[str, str | bool] | None = None
 
 
@@ -119,6 +128,15 @@ class NotificationCreateResponse(BaseModel):
     message: str = "Notification created successfully"
 
 
+class NotificationsBatchCreateResponse(BaseModel):
+    """Response model for creating a notification for several users"""
+
+    status: str = "success"
+    notifications: list[NotificationData]
+    count: int
+    message: str = "Notifications created successfully"
+
+
 class NotificationUpdateResponse(BaseModel):
     """Response model for notification updates"""
 
@@ -140,3 +158,10 @@ class MarkAllAsReadResponse(BaseModel):
     status: str = "success"
     message: str = "All notifications marked as read"
     updated_count: int = Field(description="Number of notifications updated")
+
+
+class UnreadCountResponse(BaseModel):
+    """Response model for the unread notification count"""
+
+    status: str = "success"
+    unread_count: int = Field(description="Number of unread, undeleted notifications")
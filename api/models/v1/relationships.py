@@ -31,6 +31,12 @@ class GetRelationshipsRequest(BaseModel):
     take: int = Field(
         default=10, ge=1, le=100, description="Number of records to take (max 100)"
     )
+    cursor: str | None = Field(
+        None, description="Cursor from a previous page's next_cursor"
+    )
+    include_total: bool | None = Field(
+        None, description="Compute total_count (defaults to first page only)"
+    )
 
 
 class DeleteRelationshipRequest(BaseModel):
@@ -105,9 +111,12 @@ class RelationshipsWithUsersListResponse(BaseModel):
 
     status: str = "success"
     relationships: list[RelationshipWithUserData]
-    total_count: int
+    # only computed when requested (by default on the first page)
+    total_count: int | None
     skip: int
     take: int
+    # pass as `cursor` to get the next page; None on the last page
+    next_cursor: str | None = None
 
 
 class RelationshipDeleteResponse(BaseModel):
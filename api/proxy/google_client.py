@@ -14,7 +14,7 @@ Usage Examples:
     @with_token_refresh
     async def get_user_info(client: GoogleApiClient):
         service = client.build_service("oauth2", "v2")
-        return service.userinfo().get().execute()
+        return await client.execute(service.userinfo().get())
     
     # Usage
     client = await create_google_client(access_token, refresh_token)
@@ -27,14 +27,16 @@ Usage Examples:
         
         try:
             service = client.build_service("calendar", "v3")
-            events = service.events().list(calendarId="primary").execute()
+            events = await client.execute(service.events().list(calendarId="primary"))
             return events.get("items", [])
         except HttpError as error:
             if error.resp.status == 401:
                 if await client.refresh_tokens():
                     # Retry the operation
                     service = client.build_service("calendar", "v3")
-                    events = service.events().list(calendarId="primary").execute()
+                    events = await client.execute(
+                        service.events().list(calendarId="primary")
+                    )
                     return events.get("items", [])
             return []
 
@@ -44,31 +46,130 @@ Usage Examples:
         @with_token_refresh
         async def _get_data_with_client(self, client: GoogleApiClient):
             service = client.build_service("calendar", "v3")
-            return service.events().list(calendarId="primary").execute()
+            return await client.execute(service.events().list(calendarId="primary"))
         
         async def get_data(self, access_token: str, refresh_token: str):
             client = await create_google_client(access_token, refresh_token)
             return await self._get_data_with_client(client)
 
+Requests must go through `GoogleApiClient.execute` rather than calling
+`.execute()` directly: googleapiclient is blocking, so `execute` runs the request
+on a bounded thread pool (see `config.google.transport_max_concurrency`) where
+each worker thread keeps its own keep-alive connection to Google.
+
 The decorator automatically handles:
 - 401 authentication errors
 - Token refresh attempts
 - Retry logic after successful refresh
 - Proper error logging
 """
+import asyncio
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from typing import Dict, Any, Callable, TypeVar, Optional, Tuple
 from functools import wraps
-from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
+from google_auth_httplib2 import AuthorizedHttp
+from googleapiclient.discovery import Resource, build
 from googleapiclient.errors import HttpError
+from googleapiclient.http import HttpRequest, build_http
+from httplib2 import Http
 from ..settings.config import config
+from .google_token_manager import token_manager
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# Process-wide cache of discovery services keyed by (service_name, version).
+# Building a service parses the full discovery document, so it is done once per
+# process and every request binds the cached resource to its own credentials.
+_discovery_services: dict[tuple[str, str], Resource] = {}
+_discovery_services_lock = threading.Lock()
+
+
+def get_discovery_service(service_name: str, version: str) -> Resource:
+    """
+    Get the process-wide discovery service, building it on first use
+
+    The service is built from the static discovery document bundled with
+    googleapiclient, so no network fetch is needed. The returned resource is
+    unauthenticated and must be bound with `bind_service` before use.
+    """
+    key = (service_name, version)
+    service = _discovery_services.get(key)
+    if service is None:
+        with _discovery_services_lock:
+            service = _discovery_services.get(key)
+            if service is None:
+                service = build(
+                    service_name,
+                    version,
+                    http=build_http(),
+                    static_discovery=True,
+                    cache_discovery=False,
+                )
+                _discovery_services[key] = service
+                logger.info(f"Built discovery service {service_name} {version}")
+    return service
+
+
+def bind_service(service: Resource, *, http: Any) -> Resource:
+    """
+    Create a copy of a cached discovery service that sends requests through `http`
+
+    Uses the resource's pickle hooks so only the dynamic methods are recreated;
+    the parsed discovery document and schemas are shared with the cached service.
+    """
+    state = service.__getstate__()
+    state["_http"] = http
+    state["_credentials_validated"] = False
+    bound = Resource.__new__(Resource)
+    bound.__setstate__(state)
+    return bound
+
+
+def clear_discovery_services() -> None:
+    """Drop all cached discovery services (the next call rebuilds them)"""
+    with _discovery_services_lock:
+        _discovery_services.clear()
+
+
+# Blocking googleapiclient requests run on this executor so they never stall the
+# event loop. Its size caps concurrent Google requests for the whole process.
+_transport_executor: ThreadPoolExecutor | None = None
+_transport_executor_lock = threading.Lock()
+_transport_local = threading.local()
+
+
+def get_transport_executor() -> ThreadPoolExecutor:
+    """Get the process-wide executor used for Google API requests"""
+    global _transport_executor
+    if _transport_executor is None:
+        with _transport_executor_lock:
+            if _transport_executor is None:
+                _transport_executor = ThreadPoolExecutor(
+                    max_workers=config.google.transport_max_concurrency,
+                    thread_name_prefix="google-api",
+                )
+    return _transport_executor
+
+
+def _thread_http() -> Http:
+    """
+    Get the httplib2 transport for the current thread
+
+    httplib2.Http is not thread-safe, so each executor worker owns one and reuses
+    it across requests, which keeps connections to Google alive between calls.
+    """
+    http = getattr(_transport_local, "http", None)
+    if http is None:
+        http = build_http()
+        _transport_local.http = http
+    return http
+
 
 class GoogleTokens:
     """Container for Google OAuth tokens"""
@@ -124,6 +225,9 @@ class GoogleApiClient:
         """
         Refresh the access token using the refresh token
 
+        Goes through the shared token manager, so a token another request has
+        already refreshed is reused and concurrent refreshes make one call.
+
         Returns:
             True if refresh was successful, False otherwise
         """
@@ -132,31 +236,58 @@ class GoogleApiClient:
                 logger.error("No refresh token available")
                 return False
 
-            credentials = self._create_credentials()
-            request = Request()
-            credentials.refresh(request)
+            token = await token_manager.refresh(
+                refresh_token=self.tokens.refresh_token,
+                stale_access_token=self.tokens.access_token,
+            )
 
             # Update tokens
-            self.tokens.access_token = credentials.token
-            if credentials.refresh_token:
-                self.tokens.refresh_token = credentials.refresh_token
+            self.tokens.access_token = token.access_token
+            self.tokens.refresh_token = token.refresh_token
 
             # Reset credentials to force recreation with new token
             self._credentials = None
-
-            logger.info("Successfully refreshed Google access token")
             return True
 
         except Exception as e:
             logger.error(f"Error refreshing Google access token: {str(e)}")
             return False
 
-    def build_service(self, service_name: str, version: str):
-        """Build a Google API service client"""
-        return build(service_name, version, credentials=self.credentials)
+    def authorized_http(self) -> AuthorizedHttp:
+        """
+        Create an HTTP transport that signs requests with this client's credentials
+
+        It never refreshes on a 401 itself: that would happen on the worker thread,
+        outside the token manager, so the new token would be neither shared nor
+        stored. Callers refresh through `refresh_tokens` instead.
+        """
+        return AuthorizedHttp(
+            self.credentials, http=_thread_http(), refresh_status_codes=()
+        )
+
+    def build_service(self, service_name: str, version: str) -> Resource:
+        """Get a Google API service client bound to this client's credentials"""
+        return bind_service(
+            get_discovery_service(service_name, version), http=self.authorized_http()
+        )
+
+    async def execute(self, request: HttpRequest) -> Any:
+        """
+        Execute a Google API request without blocking the event loop
+
+        The request runs on the shared transport executor using the worker
+        thread's keep-alive connection. HttpError is raised as with `.execute()`.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            get_transport_executor(), self._execute_blocking, request
+        )
+
+    def _execute_blocking(self, request: HttpRequest) -> Any:
+        """Execute a request on the calling (worker) thread's transport"""
+        return request.execute(http=self.authorized_http())
 
 
-# TODO: Remove, this isn't needed since google handles this for us
 def with_token_refresh(func: Callable[..., T]) -> Callable[..., T]:
     """
     Decorator that automatically handles token refresh for Google API calls.
@@ -228,17 +359,34 @@ def with_token_refresh(func: Callable[..., T]) -> Callable[..., T]:
 
 
 async def create_google_client(
-    access_token: str, refresh_token: str | None = None
+    access_token: str,
+    refresh_token: str | None = None,
+    expires_at: datetime | None = None,
 ) -> GoogleApiClient:
     """
     Factory function to create a GoogleApiClient
 
+    Uses the newest access token the process knows for this grant and
+    refreshes it first if it is about to expire.
+
     Args:
         access_token: Google access token
         refresh_token: Google refresh token (optional)
+        expires_at: When the access token expires, if known
 
     Returns:
         GoogleApiClient instance
     """
+    try:
+        token = await token_manager.get_valid_token(
+            access_token=access_token,
+            refresh_token=refresh_token,
+            expires_at=expires_at,
+        )
+        if token is not None:
+            access_token, refresh_token = token.access_token, token.refresh_token
+    except Exception as e:
+        # fall back to the given token; a 401 retries the refresh
+        logger.warning(f"Proactive Google token refresh failed: {str(e)}")
     tokens = GoogleTokens(access_token, refresh_token)
     return GoogleApiClient(tokens)
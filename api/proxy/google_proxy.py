@@ -1,8 +1,19 @@
+import asyncio
 import logging
-from typing import Any
+import time
+from typing import Any, AsyncIterator
 from datetime import datetime, timedelta
+from googleapiclient.errors import HttpError
 from .google_client import GoogleApiClient, with_token_refresh, create_google_client
-from .models.google_models import CalendarEvent, CalendarInfo
+from .models.google_models import (
+    BatchEventOperation,
+    BatchEventResult,
+    CalendarEvent,
+    CalendarFreeBusy,
+    CalendarInfo,
+    EventsSyncResult,
+)
+from ..settings.config import config
 
 logger = logging.getLogger(__name__)
 
@@ -29,9 +40,8 @@ async def _get_calendar_events_with_client(
     time_max = end_of_week.isoformat() + "Z"
 
     # Call the Calendar API
-    events_result = (
-        service.events()
-        .list(
+    events_result = await client.execute(
+        service.events().list(
             calendarId="primary",
             timeMin=time_min,
             timeMax=time_max,
@@ -39,7 +49,6 @@ async def _get_calendar_events_with_client(
             singleEvents=True,
             orderBy="startTime",
         )
-        .execute()
     )
 
     events = events_result.get("items", [])
@@ -91,27 +100,48 @@ async def get_google_calendar_events(
 # ============================================================================
 
 
-@with_token_refresh
-async def _list_events_with_client(
+# Google caps events.list pages at 2500 items; 250 is the API's own default
+EVENTS_PAGE_SIZE = 250
+
+
+def _parse_event(event: dict[str, Any]) -> CalendarEvent:
+    """Parse a raw Calendar API event, falling back to minimal data on failure"""
+    try:
+        return CalendarEvent(**event)
+    except Exception as e:
+        logger.warning(f"Failed to parse event {event.get('id')}: {str(e)}")
+        # Fallback to basic event with minimal data
+        return CalendarEvent(
+            id=event.get("id"),
+            summary=event.get("summary", "No title"),
+            description=event.get("description"),
+            status=event.get("status"),
+        )
+
+
+async def _iter_events_with_client(
     client: GoogleApiClient,
     calendar_id: str = "primary",
     time_min: str | None = None,
     time_max: str | None = None,
-    max_results: int = 250,
+    max_results: int | None = 250,
     single_events: bool = True,
     order_by: str = "startTime",
     query: str | None = None,
     show_deleted: bool = False,
-) -> list[CalendarEvent] | None:
+    page_size: int = EVENTS_PAGE_SIZE,
+) -> AsyncIterator[CalendarEvent]:
     """
-    Internal function to list calendar events with flexible parameters
+    Internal generator that follows nextPageToken and yields events page by page
+
+    Stops after `max_results` events (or when pages run out if None). A 401 is
+    retried once after refreshing the token, resuming from the same page.
     """
     service = client.build_service("calendar", "v3")
 
     # Build parameters
     params = {
         "calendarId": calendar_id,
-        "maxResults": max_results,
         "singleEvents": single_events,
         "showDeleted": show_deleted,
     }
@@ -125,30 +155,113 @@ async def _list_events_with_client(
     if query:
         params["q"] = query
 
-    events_result = service.events().list(**params).execute()
-    events = events_result.get("items", [])
+    yielded = 0
+    page_token: str | None = None
+    refreshed = False
+    while max_results is None or yielded < max_results:
+        params["maxResults"] = (
+            page_size if max_results is None else min(page_size, max_results - yielded)
+        )
+        if page_token:
+            params["pageToken"] = page_token
 
-    # Format events for response
-    formatted_events = []
-    for event in events:
         try:
-            formatted_event = CalendarEvent(**event)
-            formatted_events.append(formatted_event)
-        except Exception as e:
-            logger.warning(f"Failed to parse event {event.get('id')}: {str(e)}")
-            # Fallback to basic event with minimal data
-            formatted_event = CalendarEvent(
-                id=event.get("id"),
-                summary=event.get("summary", "No title"),
-                description=event.get("description"),
-                status=event.get("status"),
-            )
-            formatted_events.append(formatted_event)
+            events_result = await client.execute(service.events().list(**params))
+        except HttpError as error:
+            if error.resp.status != 401 or refreshed:
+                raise
+            logger.warning("Received 401 error while paging events, refreshing token")
+            if not await client.refresh_tokens():
+                raise
+            refreshed = True
+            service = client.build_service("calendar", "v3")
+            continue
+
+        for event in events_result.get("items", []):
+            yield _parse_event(event)
+            yielded += 1
+            if max_results is not None and yielded >= max_results:
+                break
+
+        page_token = events_result.get("nextPageToken")
+        if not page_token:
+            break
+
+    logger.info(f"Streamed {yielded} events")
+
+
+@with_token_refresh
+async def _list_events_with_client(
+    client: GoogleApiClient,
+    calendar_id: str = "primary",
+    time_min: str | None = None,
+    time_max: str | None = None,
+    max_results: int = 250,
+    single_events: bool = True,
+    order_by: str = "startTime",
+    query: str | None = None,
+    show_deleted: bool = False,
+) -> list[CalendarEvent] | None:
+    """
+    Internal function to list calendar events with flexible parameters
+    """
+    formatted_events = [
+        event
+        async for event in _iter_events_with_client(
+            client,
+            calendar_id,
+            time_min,
+            time_max,
+            max_results,
+            single_events=single_events,
+            order_by=order_by,
+            query=query,
+            show_deleted=show_deleted,
+        )
+    ]
 
     logger.info(f"Retrieved {len(formatted_events)} events")
     return formatted_events
 
 
+async def iter_events(
+    access_token: str,
+    refresh_token: str,
+    calendar_id: str = "primary",
+    time_min: str | None = None,
+    time_max: str | None = None,
+    max_results: int | None = 250,
+    query: str | None = None,
+) -> AsyncIterator[CalendarEvent]:
+    """
+    Stream calendar events, following page tokens as pages arrive
+
+    Callers may stop iterating early; no further pages are requested then.
+    Unlike `list_events`, errors are raised to the caller instead of returning None.
+
+    Args:
+        access_token: Google access token
+        refresh_token: Google refresh token
+        calendar_id: Calendar ID to query (default: "primary")
+        time_min: Lower bound (exclusive) for event start time (RFC3339 format)
+        time_max: Upper bound (exclusive) for event end time (RFC3339 format)
+        max_results: Maximum number of events to yield (None for all)
+        query: Free text search query
+
+    Yields:
+        Calendar events in API order
+    """
+    client = await create_google_client(access_token, refresh_token)
+    try:
+        async for event in _iter_events_with_client(
+            client, calendar_id, time_min, time_max, max_results, query=query
+        ):
+            yield event
+    except Exception as e:
+        logger.error(f"Error streaming calendar events: {str(e)}")
+        raise
+
+
 async def list_events(
     access_token: str,
     refresh_token: str,
@@ -183,6 +296,86 @@ async def list_events(
         return None
 
 
+@with_token_refresh
+async def _sync_events_with_client(
+    client: GoogleApiClient,
+    calendar_id: str = "primary",
+    sync_token: str | None = None,
+    time_min: str | None = None,
+) -> EventsSyncResult | None:
+    """
+    Internal function to run a full or incremental events sync
+
+    Follows every page; the nextSyncToken is only returned on the last one.
+    """
+    service = client.build_service("calendar", "v3")
+
+    # syncToken cannot be combined with timeMin/timeMax/orderBy/q, so the
+    # lower bound only applies to the initial full sync
+    params = {
+        "calendarId": calendar_id,
+        "maxResults": 2500,
+        "singleEvents": True,
+    }
+    if sync_token:
+        params["syncToken"] = sync_token
+    elif time_min:
+        params["timeMin"] = time_min
+
+    events: list[CalendarEvent] = []
+    while True:
+        try:
+            events_result = await client.execute(service.events().list(**params))
+        except HttpError as error:
+            if error.resp.status == 410:
+                logger.info(f"Sync token for calendar {calendar_id} expired")
+                return EventsSyncResult(full_resync_required=True)
+            raise
+
+        events.extend(_parse_event(event) for event in events_result.get("items", []))
+
+        page_token = events_result.get("nextPageToken")
+        if not page_token:
+            break
+        params["pageToken"] = page_token
+
+    logger.info(
+        f"Synced {len(events)} events ({'incremental' if sync_token else 'full'})"
+    )
+    return EventsSyncResult(
+        events=events, next_sync_token=events_result.get("nextSyncToken")
+    )
+
+
+async def sync_events(
+    access_token: str,
+    refresh_token: str,
+    calendar_id: str = "primary",
+    sync_token: str | None = None,
+    time_min: str | None = None,
+) -> EventsSyncResult | None:
+    """
+    Pull calendar changes using Google's incremental sync
+
+    Args:
+        access_token: Google access token
+        refresh_token: Google refresh token
+        calendar_id: Calendar ID (default: "primary")
+        sync_token: nextSyncToken from the previous sync, None for a full sync
+        time_min: Lower bound for a full sync (RFC3339 format), ignored otherwise
+
+    Returns:
+        Changed events (cancelled ones are deletions) and the next sync token,
+        a result with full_resync_required set if the token expired, or None if failed
+    """
+    try:
+        client = await create_google_client(access_token, refresh_token)
+        return await _sync_events_with_client(client, calendar_id, sync_token, time_min)
+    except Exception as e:
+        logger.error(f"Error syncing calendar events: {str(e)}")
+        return None
+
+
 @with_token_refresh
 async def _get_event_with_client(
     client: GoogleApiClient, event_id: str, calendar_id: str = "primary"
@@ -192,7 +385,9 @@ async def _get_event_with_client(
     """
     service = client.build_service("calendar", "v3")
 
-    event = service.events().get(calendarId=calendar_id, eventId=event_id).execute()
+    event = await client.execute(
+        service.events().get(calendarId=calendar_id, eventId=event_id)
+    )
 
     # Format event for response
     try:
@@ -246,14 +441,12 @@ async def _create_event_with_client(
     """
     service = client.build_service("calendar", "v3")
 
-    created_event = (
-        service.events()
-        .insert(
+    created_event = await client.execute(
+        service.events().insert(
             calendarId=calendar_id,
             body=event_data,
             sendNotifications=send_notifications,
         )
-        .execute()
     )
 
     # Convert to CalendarEvent model
@@ -314,15 +507,13 @@ async def _update_event_with_client(
     """
     service = client.build_service("calendar", "v3")
 
-    updated_event = (
-        service.events()
-        .update(
+    updated_event = await client.execute(
+        service.events().update(
             calendarId=calendar_id,
             eventId=event_id,
             body=event_data,
             sendNotifications=send_notifications,
         )
-        .execute()
     )
 
     # Convert to CalendarEvent model
@@ -384,9 +575,13 @@ async def _delete_event_with_client(
     """
     service = client.build_service("calendar", "v3")
 
-    service.events().delete(
-        calendarId=calendar_id, eventId=event_id, sendNotifications=send_notifications
-    ).execute()
+    await client.execute(
+        service.events().delete(
+            calendarId=calendar_id,
+            eventId=event_id,
+            sendNotifications=send_notifications,
+        )
+    )
 
     logger.info(f"Deleted event: {event_id}")
     return True
@@ -465,7 +660,7 @@ async def _list_calendars_with_client(
     """
     service = client.build_service("calendar", "v3")
 
-    calendars_result = service.calendarList().list().execute()
+    calendars_result = await client.execute(service.calendarList().list())
     calendars = calendars_result.get("items", [])
 
     # Format calendars for response
@@ -509,6 +704,115 @@ async def list_calendars(
         return None
 
 
+# freebusy.query accepts at most 50 calendars per request
+FREEBUSY_MAX_CALENDARS = 50
+
+# (refresh_token, calendar_id, time_min, time_max) -> (expires_at, result)
+_freebusy_cache: dict[tuple[str, str, str, str], tuple[float, CalendarFreeBusy]] = {}
+
+
+@with_token_refresh
+async def _query_freebusy_with_client(
+    client: GoogleApiClient,
+    calendar_ids: list[str],
+    time_min: str,
+    time_max: str,
+) -> dict[str, CalendarFreeBusy]:
+    """
+    Internal function to query free/busy for many calendars
+
+    Chunks of FREEBUSY_MAX_CALENDARS are sent concurrently.
+    """
+    service = client.build_service("calendar", "v3")
+
+    chunks = [
+        calendar_ids[i : i + FREEBUSY_MAX_CALENDARS]
+        for i in range(0, len(calendar_ids), FREEBUSY_MAX_CALENDARS)
+    ]
+    responses = await asyncio.gather(
+        *(
+            client.execute(
+                service.freebusy().query(
+                    body={
+                        "timeMin": time_min,
+                        "timeMax": time_max,
+                        "items": [{"id": calendar_id} for calendar_id in chunk],
+                    }
+                )
+            )
+            for chunk in chunks
+        )
+    )
+
+    results = {}
+    for response in responses:
+        for calendar_id, calendar in response.get("calendars", {}).items():
+            results[calendar_id] = CalendarFreeBusy(**calendar)
+
+    logger.info(f"Queried free/busy for {len(results)} calendars")
+    return results
+
+
+async def query_freebusy(
+    access_token: str,
+    refresh_token: str,
+    calendar_ids: list[str],
+    time_min: str,
+    time_max: str,
+) -> dict[str, CalendarFreeBusy] | None:
+    """
+    Get busy periods for many calendars in one round trip
+
+    Results are cached per calendar and window for
+    `config.google.freebusy_cache_ttl_seconds`, so only uncached calendars are
+    sent to Google.
+
+    Args:
+        access_token: Google access token
+        refresh_token: Google refresh token
+        calendar_ids: Calendar IDs or email addresses to query
+        time_min: Start of the window (RFC3339 format)
+        time_max: End of the window (RFC3339 format)
+
+    Returns:
+        Free/busy by calendar ID (calendars Google can't share carry errors),
+        or None if failed
+    """
+    now = time.monotonic()
+    results: dict[str, CalendarFreeBusy] = {}
+    missing = []
+    for calendar_id in dict.fromkeys(calendar_ids):
+        cached = _freebusy_cache.get((refresh_token, calendar_id, time_min, time_max))
+        if cached and cached[0] > now:
+            results[calendar_id] = cached[1]
+        else:
+            missing.append(calendar_id)
+
+    if not missing:
+        return results
+
+    try:
+        client = await create_google_client(access_token, refresh_token)
+        fetched = await _query_freebusy_with_client(client, missing, time_min, time_max)
+    except Exception as e:
+        logger.error(f"Error querying free/busy: {str(e)}")
+        return None
+
+    for key, (expires_at, _) in list(_freebusy_cache.items()):
+        if expires_at <= now:
+            del _freebusy_cache[key]
+    expires_at = now + config.google.freebusy_cache_ttl_seconds
+    for calendar_id, calendar in fetched.items():
+        # errors (e.g. a calendar not shared yet) are not worth pinning
+        if not calendar.errors:
+            _freebusy_cache[(refresh_token, calendar_id, time_min, time_max)] = (
+                expires_at,
+                calendar,
+            )
+        results[calendar_id] = calendar
+    return results
+
+
 @with_token_refresh
 async def _quick_add_event_with_client(
     client: GoogleApiClient,
@@ -521,12 +825,10 @@ async def _quick_add_event_with_client(
     """
     service = client.build_service("calendar", "v3")
 
-    created_event = (
-        service.events()
-        .quickAdd(
+    created_event = await client.execute(
+        service.events().quickAdd(
             calendarId=calendar_id, text=text, sendNotifications=send_notifications
         )
-        .execute()
     )
 
     # Convert to CalendarEvent model
@@ -587,15 +889,13 @@ async def _move_event_with_client(
     """
     service = client.build_service("calendar", "v3")
 
-    moved_event = (
-        service.events()
-        .move(
+    moved_event = await client.execute(
+        service.events().move(
             calendarId=source_calendar_id,
             eventId=event_id,
             destination=destination_calendar_id,
             sendNotifications=send_notifications,
         )
-        .execute()
     )
 
     # Convert to CalendarEvent model
@@ -649,6 +949,140 @@ async def move_event(
         return None
 
 
+# Google's /batch endpoint accepts at most 50 sub-requests per call
+BATCH_MAX_REQUESTS = 50
+
+
+def _batch_sub_request(service: Any, operation: BatchEventOperation) -> Any:
+    """Build the events() request for one batch operation"""
+    events = service.events()
+    if operation.method == "create":
+        return events.insert(
+            calendarId=operation.calendar_id,
+            body=operation.event_data,
+            sendNotifications=operation.send_notifications,
+        )
+    if operation.method == "update":
+        return events.update(
+            calendarId=operation.calendar_id,
+            eventId=operation.event_id,
+            body=operation.event_data,
+            sendNotifications=operation.send_notifications,
+        )
+    if operation.method == "delete":
+        return events.delete(
+            calendarId=operation.calendar_id,
+            eventId=operation.event_id,
+            sendNotifications=operation.send_notifications,
+        )
+    return events.move(
+        calendarId=operation.calendar_id,
+        eventId=operation.event_id,
+        destination=operation.destination_calendar_id,
+        sendNotifications=operation.send_notifications,
+    )
+
+
+async def _run_batch_with_client(
+    client: GoogleApiClient, operations: dict[int, BatchEventOperation]
+) -> dict[int, BatchEventResult]:
+    """Send operations (by index) as multipart batches of BATCH_MAX_REQUESTS"""
+    service = client.build_service("calendar", "v3")
+    results: dict[int, BatchEventResult] = {}
+
+    def on_response(request_id: str, response: Any, exception: Exception | None):
+        index = int(request_id)
+        if isinstance(exception, HttpError):
+            results[index] = BatchEventResult(
+                index=index,
+                success=False,
+                status_code=exception.resp.status,
+                error=exception.reason,
+            )
+        elif exception is not None:
+            results[index] = BatchEventResult(
+                index=index, success=False, error=str(exception)
+            )
+        elif operations[index].method == "delete":
+            results[index] = BatchEventResult(index=index, success=True, status_code=204)
+        else:
+            results[index] = BatchEventResult(
+                index=index,
+                success=True,
+                status_code=200,
+                event=_parse_event(response or {}),
+            )
+
+    indexes = list(operations)
+    batches = []
+    for i in range(0, len(indexes), BATCH_MAX_REQUESTS):
+        batch = service.new_batch_http_request(callback=on_response)
+        for index in indexes[i : i + BATCH_MAX_REQUESTS]:
+            batch.add(
+                _batch_sub_request(service, operations[index]), request_id=str(index)
+            )
+        batches.append(batch)
+
+    await asyncio.gather(*(client.execute(batch) for batch in batches))
+    return results
+
+
+async def _batch_events_with_client(
+    client: GoogleApiClient, operations: list[BatchEventOperation]
+) -> list[BatchEventResult]:
+    """
+    Internal function to run many event mutations through Google's /batch endpoint
+
+    Sub-requests that fail with 401 are retried once after a token refresh.
+    """
+    pending = dict(enumerate(operations))
+    results = await _run_batch_with_client(client, pending)
+
+    unauthorized = {
+        index: operation
+        for index, operation in pending.items()
+        if results[index].status_code == 401
+    }
+    if unauthorized and await client.refresh_tokens():
+        logger.info(f"Retrying {len(unauthorized)} batch requests after token refresh")
+        results.update(await _run_batch_with_client(client, unauthorized))
+
+    succeeded = sum(result.success for result in results.values())
+    logger.info(f"Batch of {len(operations)} event requests: {succeeded} succeeded")
+    return [results[index] for index in range(len(operations))]
+
+
+async def batch_events(
+    access_token: str,
+    refresh_token: str,
+    operations: list[BatchEventOperation],
+) -> list[BatchEventResult] | None:
+    """
+    Create, update, delete and move many events in as few round trips as possible
+
+    Operations are sent as multipart /batch requests of up to
+    BATCH_MAX_REQUESTS sub-requests each; Google runs sub-requests
+    independently, so one failing doesn't affect the others.
+
+    Args:
+        access_token: Google access token
+        refresh_token: Google refresh token
+        operations: Event mutations to perform
+
+    Returns:
+        One result per operation, in the same order, or None if the batch
+        could not be sent
+    """
+    if not operations:
+        return []
+    try:
+        client = await create_google_client(access_token, refresh_token)
+        return await _batch_events_with_client(client, operations)
+    except Exception as e:
+        logger.error(f"Error running events batch: {str(e)}")
+        return None
+
+
 # ============================================================================
 # HELPER FUNCTIONS FOR COMMON USE CASES
 # ============================================================================
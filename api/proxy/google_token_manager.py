@@ -0,0 +1,188 @@
+"""
+Process-wide cache of Google access tokens with single-flight refresh
+
+Tokens are keyed by refresh token, which identifies a user's Google grant without
+needing a user ID at the proxy layer. Every `GoogleApiClient` goes through the
+shared `token_manager`, so:
+
+- a token refreshed by one request is reused by every later request in the
+  process instead of each one starting stale, taking a 401 and refreshing again
+- tokens are refreshed proactively once they are within
+  `config.google.token_refresh_margin_seconds` of expiring
+- concurrent refreshes of the same grant collapse into one call to Google
+"""
+
+import asyncio
+import logging
+import threading
+from datetime import datetime, timedelta, timezone
+from google.oauth2.credentials import Credentials
+from pydantic import BaseModel
+from ..settings.config import config
+
+logger = logging.getLogger(__name__)
+
+
+class CachedAccessToken(BaseModel):
+    """An access token with its expiry (None when unknown)"""
+
+    access_token: str
+    refresh_token: str
+    expires_at: datetime | None = None
+
+    def expires_within(self, margin: timedelta) -> bool:
+        return self.expires_at is not None and self.expires_at - margin <= datetime.now(
+            timezone.utc
+        )
+
+
+def _refresh_blocking(refresh_token: str) -> CachedAccessToken:
+    """Exchange a refresh token for a new access token (blocking HTTP call)"""
+    credentials = Credentials(
+        token=None,
+        refresh_token=refresh_token,
+        token_uri="https://oauth2.googleapis.com/token",
+        client_id=config.google.client_id,
+        client_secret=config.google.client_secret,
+        scopes=config.google.scopes.split(),
+    )
+    # imported here because it pulls in `requests`, which only refreshes need
+    from google.auth.transport.requests import Request
+
+    credentials.refresh(Request())
+    # google-auth reports expiry as a naive UTC datetime
+    expires_at = (
+        credentials.expiry.replace(tzinfo=timezone.utc) if credentials.expiry else None
+    )
+    return CachedAccessToken(
+        access_token=credentials.token,
+        refresh_token=credentials.refresh_token or refresh_token,
+        expires_at=expires_at,
+    )
+
+
+class GoogleTokenManager:
+    """Caches access tokens per refresh token and deduplicates refreshes"""
+
+    def __init__(self):
+        self._tokens: dict[str, CachedAccessToken] = {}
+        self._inflight: dict[str, asyncio.Future[CachedAccessToken]] = {}
+        # refresh token -> access token already written back to storage
+        self._persisted: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def refresh_margin(self) -> timedelta:
+        return timedelta(seconds=config.google.token_refresh_margin_seconds)
+
+    def get_cached(self, refresh_token: str) -> CachedAccessToken | None:
+        """Get the newest known token for a grant, if any"""
+        return self._tokens.get(refresh_token)
+
+    def remember(self, token: CachedAccessToken) -> None:
+        """Record a token unless the cache already holds one that expires later"""
+        with self._lock:
+            cached = self._tokens.get(token.refresh_token)
+            if cached is None or (
+                token.expires_at is not None
+                and (cached.expires_at is None or token.expires_at > cached.expires_at)
+            ):
+                self._tokens[token.refresh_token] = token
+
+    async def get_valid_token(
+        self,
+        *,
+        access_token: str,
+        refresh_token: str | None,
+        expires_at: datetime | None = None,
+    ) -> CachedAccessToken | None:
+        """
+        Get a usable access token for a grant
+
+        Prefers a newer cached token over the one passed in and refreshes when
+        the best known token is about to expire. Returns None without a refresh
+        token; when the expiry is unknown the token is used as is and a 401
+        triggers the refresh instead.
+        """
+        if not refresh_token:
+            return None
+        self.remember(
+            CachedAccessToken(
+                access_token=access_token,
+                refresh_token=refresh_token,
+                expires_at=expires_at,
+            )
+        )
+        token = self._tokens[refresh_token]
+        if token.expires_within(self.refresh_margin):
+            logger.info("Google access token about to expire, refreshing proactively")
+            return await self.refresh(refresh_token=refresh_token)
+        return token
+
+    async def refresh(
+        self, *, refresh_token: str, stale_access_token: str | None = None
+    ) -> CachedAccessToken:
+        """
+        Refresh a grant's access token, sharing one in-flight refresh per grant
+
+        If `stale_access_token` was rejected but another request has already
+        replaced it with a token that is still valid, that token is returned
+        without calling Google.
+
+        Raises:
+            google.auth.exceptions.RefreshError: If Google rejects the refresh token
+        """
+        cached = self._tokens.get(refresh_token)
+        if (
+            stale_access_token
+            and cached
+            and cached.access_token != stale_access_token
+            and not cached.expires_within(self.refresh_margin)
+        ):
+            return cached
+
+        inflight = self._inflight.get(refresh_token)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future: asyncio.Future[CachedAccessToken] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._inflight[refresh_token] = future
+        try:
+            token = await asyncio.to_thread(_refresh_blocking, refresh_token)
+            with self._lock:
+                self._tokens[refresh_token] = token
+                self._tokens[token.refresh_token] = token
+            future.set_result(token)
+            logger.info("Successfully refreshed Google access token")
+            return token
+        except Exception as e:
+            future.set_exception(e)
+            # mark it retrieved so a refresh with no followers doesn't log a warning
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(refresh_token, None)
+
+    def claim_persist(self, token: CachedAccessToken) -> bool:
+        """
+        Whether the caller should write this token back to storage
+
+        Returns True once per access token so concurrent requests don't all
+        persist the same refresh.
+        """
+        with self._lock:
+            if self._persisted.get(token.refresh_token) == token.access_token:
+                return False
+            self._persisted[token.refresh_token] = token.access_token
+            return True
+
+    def clear(self) -> None:
+        """Forget every cached token"""
+        with self._lock:
+            self._tokens.clear()
+            self._persisted.clear()
+
+
+token_manager = GoogleTokenManager()
@@ -1,6 +1,6 @@
 from pydantic import BaseModel, Field
 from datetime import datetime
-from typing import Any
+from typing import Any, Literal
 
 
 class EventDateTime(BaseModel):
@@ -141,6 +141,58 @@ class CalendarInfo(BaseModel):
         populate_by_name = True
 
 
+class EventsSyncResult(BaseModel):
+    """Result of a full or incremental (syncToken) events sync"""
+
+    # includes cancelled events, which mark deletions during incremental syncs
+    events: list[CalendarEvent] = []
+    next_sync_token: str | None = None
+    # the sync token expired (HTTP 410); the caller must discard its store and resync
+    full_resync_required: bool = False
+
+
+class BusyPeriod(BaseModel):
+    """Represents a busy time range from the FreeBusy API"""
+
+    start: datetime
+    end: datetime
+
+
+class FreeBusyError(BaseModel):
+    """Represents why a calendar's free/busy could not be returned"""
+
+    domain: str | None = None
+    reason: str | None = None
+
+
+class CalendarFreeBusy(BaseModel):
+    """Represents free/busy information for one calendar"""
+
+    busy: list[BusyPeriod] = []
+    errors: list[FreeBusyError] = []
+
+
+class BatchEventOperation(BaseModel):
+    """One create/update/delete/move sub-request of an events batch"""
+
+    method: Literal["create", "update", "delete", "move"]
+    calendar_id: str = "primary"
+    event_id: str | None = None  # required for update, delete and move
+    event_data: dict[str, Any] | None = None  # required for create and update
+    destination_calendar_id: str | None = None  # required for move
+    send_notifications: bool = True
+
+
+class BatchEventResult(BaseModel):
+    """Outcome of one sub-request of an events batch"""
+
+    index: int
+    success: bool
+    status_code: int | None = None
+    event: CalendarEvent | None = None  # None for deletes and failures
+    error: str | None = None
+
+
 class EventListResponse(BaseModel):
     """Response model for event list operations"""
 
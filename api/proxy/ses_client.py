@@ -0,0 +1,106 @@
+"""
+AWS SES client used by the email queue
+
+`create_ses_client` returns a boto3 SES client, or with `EMAIL__BACKEND=stub`
+a `StubSESClient` that implements the same calls in process so the queue can
+be exercised locally and in tests without sending real email.
+"""
+
+import threading
+import time
+import uuid
+from typing import Any
+from botocore.exceptions import ClientError
+from ..settings.config import config
+
+
+class StubSESClient:
+    """In-process stand-in for the SES template and bulk send calls"""
+
+    def __init__(self, *, latency_seconds: float = 0.0, throttle_calls: int = 0):
+        # each send call sleeps this long, like a round trip to SES
+        self.latency_seconds = latency_seconds
+        # the next this many send calls are rejected with a Throttling error
+        self.throttle_calls = throttle_calls
+        self.templates: dict[str, dict[str, str]] = {}
+        self.sent: list[dict[str, Any]] = []
+        self.send_calls = 0
+        self._lock = threading.Lock()
+
+    def get_template(self, *, TemplateName: str) -> dict[str, Any]:
+        template = self.templates.get(TemplateName)
+        if template is None:
+            raise ClientError(
+                {
+                    "Error": {
+                        "Code": "TemplateDoesNotExist",
+                        "Message": f"Template {TemplateName} does not exist",
+                    }
+                },
+                "GetTemplate",
+            )
+        return {"Template": template}
+
+    def create_template(self, *, Template: dict[str, str]) -> dict[str, Any]:
+        self.templates[Template["TemplateName"]] = Template
+        return {}
+
+    def update_template(self, *, Template: dict[str, str]) -> dict[str, Any]:
+        self.templates[Template["TemplateName"]] = Template
+        return {}
+
+    def send_bulk_templated_email(
+        self,
+        *,
+        Source: str,
+        Template: str,
+        DefaultTemplateData: str,
+        Destinations: list[dict[str, Any]],
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        time.sleep(self.latency_seconds)
+        with self._lock:
+            self.send_calls += 1
+            if self.throttle_calls > 0:
+                self.throttle_calls -= 1
+                raise ClientError(
+                    {
+                        "Error": {
+                            "Code": "Throttling",
+                            "Message": "Maximum sending rate exceeded.",
+                        }
+                    },
+                    "SendBulkTemplatedEmail",
+                )
+            self.get_template(TemplateName=Template)
+
+            statuses = []
+            for destination in Destinations:
+                message_id = str(uuid.uuid4())
+                self.sent.append(
+                    {
+                        "message_id": message_id,
+                        "source": Source,
+                        "template": Template,
+                        "destination": destination["Destination"],
+                        "data": destination.get("ReplacementTemplateData")
+                        or DefaultTemplateData,
+                    }
+                )
+                statuses.append({"Status": "Success", "MessageId": message_id})
+            return {"Status": statuses}
+
+
+_stub_client: StubSESClient | None = None
+
+
+def create_ses_client() -> Any:
+    """Create the SES client for the configured email backend"""
+    global _stub_client
+    if config.email.backend == "stub":
+        if _stub_client is None:
+            _stub_client = StubSESClient()
+        return _stub_client
+    import boto3
+
+    return boto3.client("ses", region_name=config.email.region)
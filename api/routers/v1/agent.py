@@ -1,11 +1,19 @@
-from autogen_agentchat.messages import BaseAgentEvent, ChatMessage
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException
 from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
 from pydantic import BaseModel, Field
-from api.core.amia import get_amia_agent
+from api.core.amia import (
+    AgentSessionBusyError,
+    AgentSessionNotFoundError,
+    agent_pool,
+)
 from api.services.google_events_service import GoogleEventsService
 from api.dependencies import get_google_events_service
+from api.settings.auth import get_current_user_id
 from fastapi import Depends
+import logging
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/agent", tags=["Agent"])
 
@@ -15,6 +23,9 @@ class ChatMessage(BaseModel):
 
 class ChatWithAmiaRequest(BaseModel):
     messages: list[ChatMessage]
+    # the X-Session-Id of an earlier reply, to send only the new messages;
+    # without one, send the whole conversation
+    session_id: str | None = None
     metdata: dict | None = Field(default_factory=dict)
     context: str | None = Field(default_factory=dict)
 
@@ -22,13 +33,81 @@ class ChatWithAmiaRequest(BaseModel):
 @router.post("/commands/chat")
 async def chat_with_amia(
     request: ChatWithAmiaRequest,
+    user_id: str = Depends(get_current_user_id),
     google_events_service: GoogleEventsService = Depends(get_google_events_service)
 ) -> StreamingResponse:
-    agent = await get_amia_agent(context=request.context, metdata=request.metdata, google_events_service=google_events_service)
-    _iter = agent.run_stream(task=request.messages[-1].content)
+    """
+    Chat with AMIA, streaming the reply
+
+    The agent is kept between turns (see `AgentPool`), so a follow-up turn only
+    adds the new messages to the conversation it already holds. The reply's
+    X-Session-Id header names the session.
+
+    Raises:
+        HTTPException: 410 if `session_id` has expired (or lives on another
+            container), so the client resends the whole conversation; 409 if
+            the chat is still answering the previous turn
+    """
+    messages = [(message.role, message.content) for message in request.messages]
+    if not messages:
+        raise HTTPException(status_code=400, detail="No messages to reply to")
+    try:
+        session, new_messages = agent_pool.checkout(
+            user_id=user_id,
+            session_id=request.session_id,
+            messages=messages,
+            google_events_service=google_events_service,
+        )
+    except AgentSessionNotFoundError as e:
+        raise HTTPException(status_code=410, detail=str(e))
+    except AgentSessionBusyError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    # the session is busy until released: by the stream once it starts, or here
+    # if anything fails (or the response is dropped) before it does
+    started = False
+
+    def release_unstarted() -> None:
+        if not started:
+            agent_pool.release(
+                session, user_id=user_id, messages=new_messages, reply=None
+            )
+
+    try:
+        from autogen_agentchat.messages import BaseAgentEvent, TextMessage
+
+        task = [
+            TextMessage(content=content, source=role) for role, content in new_messages
+        ]
+    except Exception:
+        release_unstarted()
+        raise
+
     async def streamer():
-        async for event in _iter:
-            if isinstance(event, BaseAgentEvent):
-                if event.type == "ModelClientStreamingChunkEvent":
-                    yield event.content
-    return StreamingResponse(streamer(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+        nonlocal started
+        started = True
+        chunks: list[str] = []
+        reply = None
+        try:
+            async for event in session.agent.run_stream(task=task):
+                if isinstance(event, BaseAgentEvent):
+                    if event.type == "ModelClientStreamingChunkEvent":
+                        chunks.append(event.content)
+                        yield event.content
+            reply = "".join(chunks)
+        except Exception as e:
+            logger.error(f"Error in AMIA chat for user {user_id}: {e}")
+            raise
+        finally:
+            agent_pool.release(
+                session,
+                user_id=user_id,
+                messages=new_messages,
+                reply=reply,
+            )
+    return StreamingResponse(
+        streamer(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Session-Id": session.id},
+        # runs after the response, including when the client left before it started
+        background=BackgroundTask(release_unstarted),
+    )
@@ -1,4 +1,16 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
+from ...core.cache import get_cache_stats
+from ...core.llm_gateway import llm_gateway
+from ...core.semantic_cache import get_semantic_cache_stats
+from ...core.tier_metrics import get_tier_stats
+from ...models.v1.diagnostics import (
+    CacheDiagnosticsResponse,
+    LLMUsageDiagnosticsResponse,
+    SecretsRefreshResponse,
+    TierDiagnosticsResponse,
+)
+from ...settings.auth import require_admin
+from ...settings.secrets import secrets_manager
 import logging
 
 logger = logging.getLogger(__name__)
@@ -9,3 +21,71 @@ router = APIRouter(prefix="/diagnostics", tags=["Diagnostics"])
 @router.get("/health")
 async def get_diagnostics():
     return {"message": "Healthy"}
+
+
+@router.get(
+    "/caches",
+    response_model=CacheDiagnosticsResponse,
+    dependencies=[Depends(require_admin)],
+)
+async def get_cache_diagnostics() -> CacheDiagnosticsResponse:
+    """
+    Get hit/miss counters for the in-process caches
+
+    Returns:
+        Size, hit and miss counts for each cache in this process, and the
+        dollars saved by the LLM response caches
+    """
+    return CacheDiagnosticsResponse(
+        caches=get_cache_stats(), semantic_caches=get_semantic_cache_stats()
+    )
+
+
+@router.get(
+    "/llm-tiers",
+    response_model=TierDiagnosticsResponse,
+    dependencies=[Depends(require_admin)],
+)
+async def get_tier_diagnostics() -> TierDiagnosticsResponse:
+    """
+    Get per-tier counters for routed LLM calls (e.g. auto-fill)
+
+    Returns:
+        Calls, accept rate, latency percentiles and cost for each tier
+    """
+    return TierDiagnosticsResponse(tiers=get_tier_stats())
+
+
+@router.get(
+    "/llm-usage",
+    response_model=LLMUsageDiagnosticsResponse,
+    dependencies=[Depends(require_admin)],
+)
+async def get_llm_usage_diagnostics() -> LLMUsageDiagnosticsResponse:
+    """
+    Get LLM gateway load and per-model usage for this process
+
+    Returns:
+        Calls in flight, calls refused by the per-user and process-wide limits,
+        and calls, tokens, latency percentiles and cost by purpose and model
+    """
+    return LLMUsageDiagnosticsResponse(gateway=llm_gateway.stats())
+
+
+@router.post(
+    "/secrets/refresh",
+    response_model=SecretsRefreshResponse,
+    dependencies=[Depends(require_admin)],
+)
+async def refresh_secrets() -> SecretsRefreshResponse:
+    """
+    Re-fetch the secret bundle after a rotation, rebuilding the clients that use it
+
+    Only this process is refreshed (see `api.settings.secrets`).
+
+    Returns:
+        Confirmation that the bundle was reloaded
+    """
+    await secrets_manager.refresh_async()
+    logger.info("Secrets refreshed")
+    return SecretsRefreshResponse(message="Secrets refreshed")
@@ -3,16 +3,42 @@ from fastapi import APIRouter, Depends
 import api.models.v1.emails as emails
 from ...dependencies import get_emails_service
 from ...services.emails_service import EmailsService
+from ...settings.auth import get_current_user_id
 
 router = APIRouter(prefix="/emails", tags=["Emails"])
 
 
-@router.post("", response_model=emails.SendEmailResponse)
+@router.post("", response_model=emails.SendEmailResponse, status_code=202)
 async def send_email(
     request: emails.SendEmailRequest,
+    user_id: str = Depends(get_current_user_id),
     service: EmailsService = Depends(get_emails_service),
 ) -> emails.SendEmailResponse:
-    """Send an email via AWS SES"""
+    """
+    Queue an email to be sent via AWS SES and return its handle
+
+    On Lambda the email is sent before the response is returned, since the
+    container may be frozen right after it.
+    """
     return await service.send_email(
-        to=request.to, subject=request.subject, body=request.body
+        to=request.to,
+        subject=request.subject,
+        body=request.body,
+        requested_by=user_id,
     )
+
+
+@router.get("/{handle}", response_model=emails.EmailStatusResponse)
+async def get_email_status(
+    handle: str,
+    user_id: str = Depends(get_current_user_id),
+    service: EmailsService = Depends(get_emails_service),
+) -> emails.EmailStatusResponse:
+    """
+    Get the delivery status of a queued email
+
+    Statuses are kept in the process that queued the email, so on Lambda a
+    lookup can miss on another container (404); the send response already
+    carries the final status there.
+    """
+    return await service.get_email_status(handle=handle, user_id=user_id)
@@ -1,5 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from datetime import datetime
+from typing import Any, AsyncIterator, Dict
+import json
 
 from ...settings.auth import get_current_user_id, get_current_user
 from ...dependencies import (
@@ -8,9 +11,12 @@ from ...dependencies import (
 )
 from ...services.event_requests_service import EventRequestsService
 from ...services.event_request_approvals_service import EventRequestApprovalsService
+from ...services.notifications_service import User
 from ...models.v1.event_requests import (
     CreateEventRequestRequest,
+    SmartParseEvent,
     SmartParseEventRequestRequest,
+    SmartParseFieldUpdate,
     UpdateEventRequestRequest,
     EventRequestResponse,
     EventRequestWithApproversResponse,
@@ -20,6 +26,7 @@ from ...models.v1.event_requests import (
     EventRequestUpdateResponse,
     EventRequestDeleteResponse,
     SmartParseEventRequestResponse,
+    EventRequestAvailabilityResponse,
 )
 import logging
 
@@ -44,10 +51,66 @@ async def auto_fill_event_request(
     return SmartParseEventRequestResponse(event_request=_parsed)
 
 
+async def _sse_auto_fill(
+    items: AsyncIterator[SmartParseFieldUpdate | SmartParseEvent],
+    user_id: str,
+) -> AsyncIterator[str]:
+    """Write the parse as server-sent events: fields as they arrive, then the result"""
+    try:
+        async for item in items:
+            if isinstance(item, SmartParseFieldUpdate):
+                yield f"event: field\ndata: {item.model_dump_json()}\n\n"
+            else:
+                _response = SmartParseEventRequestResponse(event_request=item)
+                yield f"event: result\ndata: {_response.model_dump_json()}\n\n"
+    except HTTPException as e:
+        yield f"event: error\ndata: {json.dumps({'detail': e.detail})}\n\n"
+    except Exception as e:
+        # the status line is already sent, so errors are reported in the stream
+        logger.error(f"Error streaming auto-fill for user {user_id}: {e}")
+        yield f"event: error\ndata: {json.dumps({'detail': 'Failed to parse event request'})}\n\n"
+
+
+@router.post("/commands/auto-fill/stream")
+async def stream_auto_fill_event_request(
+    request: SmartParseEventRequestRequest,
+    user_id: str = Depends(get_current_user_id),
+    service: EventRequestsService = Depends(get_event_requests_service),
+) -> StreamingResponse:
+    """
+    Auto-fill an event request by description, streaming fields as they are parsed
+
+    Each field is sent as a `field` event (`{"field": ..., "value": ...}`) as soon
+    as the model has written it, in the order title, location, description,
+    start_date, end_date, importance_level, notes, approvers. The validated event
+    request follows as a `result` event with the same body as
+    `POST /event-requests/commands/auto-fill`; failures are sent as an `error` event.
+
+    Fields only arrive incrementally from a host that streams responses (uvicorn,
+    or Lambda with response streaming). Behind Mangum on plain Lambda the whole
+    response is buffered, so every `field` event arrives together with the
+    `result`.
+
+    Returns:
+        `text/event-stream` response that closes after the `result` or `error` event
+
+    Raises:
+        HTTPException: 429 (with Retry-After) if the user is over their AI limits
+    """
+    _items = await service.stream_auto_fill_event_request(
+        request=request, user_id=user_id
+    )
+    return StreamingResponse(
+        _sse_auto_fill(_items, user_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.post("", response_model=EventRequestCreateResponse)
 async def create_event_request(
     request: CreateEventRequestRequest,
-    user_id: str = Depends(get_current_user_id),
+    user: Dict[str, Any] = Depends(get_current_user),
     service: EventRequestsService = Depends(get_event_requests_service),
     event_request_approvals_service: EventRequestApprovalsService = Depends(
         get_event_request_approvals_service
@@ -59,6 +122,7 @@ async def create_event_request(
     Returns:
         Created event request data
     """
+    user_id = user["user_id"]
     _event_request = await service.create_event_request(
         google_event_id=request.google_event_id,
         title=request.title,
@@ -70,11 +134,22 @@ async def create_event_request(
         notes=request.notes,
         created_by=user_id,
     )
+    # approvers are notified as coming from the requester
+    requested_by = (
+        User(
+            id=user_id,
+            email=user["email"],
+            name=(user.get("claims") or {}).get("user_metadata", {}).get("full_name"),
+        )
+        if user.get("email")
+        else None
+    )
     try:
         if request.approvers:
             _approvers = await event_request_approvals_service.create_event_request_approvals_batch(
                 event_request_id=_event_request.event_request.id,
                 approvals_request=request.approvers,
+                requested_by=requested_by,
             )
     except Exception as e:
         # rollback the event request
@@ -154,6 +229,12 @@ async def list_event_requests_with_approvals(
     take: int = Query(
         50, ge=1, le=100, description="Number of records to return (max 100)"
     ),
+    cursor: str | None = Query(
+        None, description="Cursor from a previous page's next_cursor"
+    ),
+    include_total: bool | None = Query(
+        None, description="Compute total_count (defaults to first page only)"
+    ),
     user_id: str = Depends(get_current_user_id),
     service: EventRequestsService = Depends(get_event_requests_service),
 ) -> EventRequestsWithApprovalsListResponse:
@@ -166,7 +247,8 @@ async def list_event_requests_with_approvals(
       'no_approvals' if no approval requests exist
     - requested_approvals: total number of approval requests
     - completed_count: number of completed (non-pending) approvals
-    - Pagination support with skip/take and total_count
+    - Pagination with skip/take or keyset `cursor`/next_cursor; total_count
+      is computed on the first page unless include_total says otherwise
 
     Returns:
         List of event requests with approval status information
@@ -176,6 +258,8 @@ async def list_event_requests_with_approvals(
         status=status,
         skip=skip,
         take=take,
+        cursor=cursor,
+        include_total=include_total,
     )
 
 
@@ -213,6 +297,24 @@ async def get_event_request_with_approvers(
     return await service.get_event_request_with_approvers(event_request_id=event_request_id)
 
 
+@router.get("/{event_request_id}/availability", response_model=EventRequestAvailabilityResponse)
+async def get_event_request_availability(
+    event_request_id: str,
+    user_id: str = Depends(get_current_user_id),
+    service: EventRequestsService = Depends(get_event_requests_service),
+) -> EventRequestAvailabilityResponse:
+    """
+    Get the busy/free status of all approvers for the event request's time window
+
+    Returns:
+        Each approver's availability ('free', 'busy' or 'unknown') with the
+        busy periods that overlap the event
+    """
+    return await service.get_approver_availability(
+        event_request_id=event_request_id, user_id=user_id
+    )
+
+
 @router.get("/google/{google_event_id}", response_model=EventRequestResponse)
 async def get_event_request_by_google_id(
     google_event_id: str,
@@ -1,5 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, Body
-from typing import Any
+from fastapi.responses import StreamingResponse
+from typing import Any, AsyncIterator
+import logging
 
 from api.settings.config import config
 from ...settings.auth import get_current_user_id
@@ -7,6 +9,7 @@ from ...dependencies import get_google_events_service
 from ...services.google_events_service import GoogleEventsService
 from ...models.v1.events import (
     EventListResponse,
+    EventStreamError,
     EventResponse,
     EventDeleteResponse,
     EventUpdateResponse,
@@ -18,12 +21,26 @@ from ...models.v1.events import (
     UpcomingEventsResponse,
     CalendarListResponse,
     EventData,
+    BatchEventsRequest,
+    BatchEventsResponse,
 )
+from ...proxy.models.google_models import CalendarEvent
 
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/google/events", tags=["Google Events"])
 
 
+async def _ndjson_events(events: AsyncIterator[CalendarEvent]) -> AsyncIterator[str]:
+    """Serialize streamed events as NDJSON, ending with an error line on failure"""
+    try:
+        async for event in events:
+            yield event.model_dump_json(by_alias=True) + "\n"
+    except Exception as e:
+        logger.error(f"Event stream failed: {str(e)}")
+        yield EventStreamError(detail="Failed to retrieve events").model_dump_json() + "\n"
+
+
 @router.get("/week", response_model=EventListResponse)
 async def get_current_week_events(
     user_id: str = Depends(get_current_user_id),
@@ -59,6 +76,9 @@ async def list_calendar_events(
         250, ge=1, le=2500, description="Maximum number of events"
     ),
     query: str | None = Query(None, description="Text search query"),
+    stream: bool = Query(
+        False, description="Stream events as NDJSON while pages are fetched"
+    ),
     user_id: str = Depends(get_current_user_id),
     events_service: GoogleEventsService = Depends(get_google_events_service),
 ) -> EventListResponse:
@@ -71,8 +91,25 @@ async def list_calendar_events(
         - time_max: End time filter (RFC3339 format)
         - max_results: Maximum events to return (1-2500)
         - query: Free text search
+        - stream: Return `application/x-ndjson` with one event per line, written
+          as each page arrives. A failure mid-stream ends with an error line.
     """
     try:
+        if stream:
+            events_stream = await events_service.stream_calendar_events(
+                user_id=user_id,
+                calendar_id=calendar_id,
+                time_min=time_min,
+                time_max=time_max,
+                max_results=max_results,
+                query=query,
+            )
+            return StreamingResponse(
+                _ndjson_events(events_stream),
+                media_type="application/x-ndjson",
+                headers={"Cache-Control": "no-cache"},
+            )
+
         events = await events_service.list_calendar_events(
             user_id=user_id,
             calendar_id=calendar_id,
@@ -171,6 +208,41 @@ async def create_calendar_event(
         raise HTTPException(status_code=404, detail=str(e))
 
 
+@router.post("/batch", response_model=BatchEventsResponse)
+async def batch_calendar_events(
+    request: BatchEventsRequest,
+    user_id: str = Depends(get_current_user_id),
+    events_service: GoogleEventsService = Depends(get_google_events_service),
+) -> BatchEventsResponse:
+    """
+    Create, update, delete and move many events in one call
+
+    Operations are sent to Google in batches of up to 50 and succeed or fail
+    independently; check each result rather than the overall status.
+
+    Request Body Example:
+    {
+        "operations": [
+            {"method": "create", "event_data": {"summary": "Standup", "start": {...}, "end": {...}}},
+            {"method": "delete", "event_id": "abc123"},
+            {"method": "move", "event_id": "def456", "destination_calendar_id": "team@group.calendar.google.com"}
+        ]
+    }
+    """
+    try:
+        results = await events_service.batch_calendar_events(
+            user_id=user_id, operations=request.operations
+        )
+        succeeded = sum(result.success for result in results)
+
+        return BatchEventsResponse(
+            results=results, succeeded=succeeded, failed=len(results) - succeeded
+        )
+
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
 @router.put("/{event_id}", response_model=EventUpdateResponse)
 async def update_calendar_event(
     event_id: str,
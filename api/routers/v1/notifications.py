@@ -1,14 +1,40 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 from datetime import datetime
+from typing import AsyncIterator
 
 from api.settings.auth import get_current_user_id
 from api.dependencies import get_notifications_service
 from api.services.notifications_service import NotificationsService
+from api.core.notification_hub import notification_hub
+from api.settings.config import config
 import api.models.v1.notifications as models
 
 router = APIRouter(prefix="/notifications", tags=["Notifications"])
 
 
+async def _sse_notifications(request: Request, user_id: str) -> AsyncIterator[str]:
+    """Write the user's new notifications as server-sent events until they disconnect"""
+    with notification_hub.subscribe(user_id) as subscription:
+        # tell EventSource clients how soon to reconnect after a drop
+        yield "retry: 5000\n\n"
+        while not await request.is_disconnected():
+            notification = await subscription.next(
+                timeout=config.notifications.stream_heartbeat_seconds
+            )
+            if subscription.overflowed:
+                # the client reconnects and re-fetches the list to catch up
+                break
+            if notification is None:
+                yield ": keep-alive\n\n"
+                continue
+            yield (
+                f"id: {notification.id}\n"
+                "event: notification\n"
+                f"data: {notification.model_dump_json()}\n\n"
+            )
+
+
 @router.post("", response_model=models.NotificationCreateResponse)
 async def create_notification(
     request: models.CreateNotificationRequest,
@@ -37,6 +63,12 @@ async def get_user_notifications(
     take: int = Query(
         50, ge=1, le=100, description="Number of records to return (max 100)"
     ),
+    cursor: str | None = Query(
+        None, description="Cursor from a previous page's next_cursor"
+    ),
+    include_total: bool | None = Query(
+        None, description="Compute total_count (defaults to first page only)"
+    ),
     user_id: str = Depends(get_current_user_id),
     service: NotificationsService = Depends(get_notifications_service),
 ) -> models.NotificationsListResponse:
@@ -52,6 +84,55 @@ async def get_user_notifications(
         is_deleted=is_deleted,
         skip=skip,
         take=take,
+        cursor=cursor,
+        include_total=include_total,
+    )
+
+
+@router.get("/unread-count", response_model=models.UnreadCountResponse)
+async def get_unread_count(
+    user_id: str = Depends(get_current_user_id),
+    service: NotificationsService = Depends(get_notifications_service),
+) -> models.UnreadCountResponse:
+    """
+    Get the number of unread notifications for the current user
+
+    Returns:
+        Unread notification count
+    """
+    return await service.get_unread_count(user_id=user_id)
+
+
+@router.get("/stream")
+async def stream_notifications(
+    request: Request,
+    user_id: str = Depends(get_current_user_id),
+) -> StreamingResponse:
+    """
+    Stream new notifications for the current user as server-sent events
+
+    Each notification created after connecting is sent as a `notification`
+    event whose data is the notification JSON; idle streams get a comment
+    heartbeat. Use `GET /notifications` for anything created before connecting.
+
+    Only notifications created by this process are sent, so run the API as a
+    single long-lived process to use it; it is off on Lambda (see
+    `NOTIFICATIONS__STREAM_ENABLED`), where clients poll `/unread-count`.
+
+    Returns:
+        `text/event-stream` response that stays open until the client disconnects
+
+    Raises:
+        HTTPException: 404 if streaming is disabled
+    """
+    if not config.notifications.stream_enabled:
+        raise HTTPException(
+            status_code=404, detail="Notification streaming is not available"
+        )
+    return StreamingResponse(
+        _sse_notifications(request, user_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
 
 
@@ -44,6 +44,12 @@ async def create_relationship(
 async def get_user_relationships(
     skip: int = Query(0, ge=0, description="Number of records to skip for pagination"),
     take: int = Query(10, ge=1, description="Number of records to take (max 100)"),
+    cursor: str | None = Query(
+        None, description="Cursor from a previous page's next_cursor"
+    ),
+    include_total: bool | None = Query(
+        None, description="Compute total_count (defaults to first page only)"
+    ),
     user_id: str = Depends(get_current_user_id),
     service: RelationshipsService = Depends(get_relationships_service),
 ) -> RelationshipsWithUsersListResponse:
@@ -57,6 +63,8 @@ async def get_user_relationships(
         user_id=user_id,
         skip=skip,
         take=take,
+        cursor=cursor,
+        include_total=include_total,
     )
 
 
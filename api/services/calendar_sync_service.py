@@ -0,0 +1,150 @@
+import logging
+from datetime import datetime, timedelta, timezone
+from ..core.availability import to_utc
+from ..databridge.calendar_sync_databridge import CalendarSyncDatabridge
+from ..proxy.google_proxy import sync_events
+from ..proxy.models.google_models import CalendarEvent
+from ..settings.config import config
+
+logger = logging.getLogger(__name__)
+
+
+def _iso(value: datetime | None) -> str | None:
+    return value.isoformat() if value else None
+
+
+class CalendarSyncService:
+    """
+    Keeps a local copy of each user's Google Calendar in sync using syncToken
+
+    The first sync pulls every event from `config.google.sync_lookback_days` ago
+    onwards; later syncs only pull changes. An expired token (HTTP 410) falls
+    back to a full sync, which replaces the stored events.
+    """
+
+    def __init__(self, databridge: CalendarSyncDatabridge):
+        self.databridge: CalendarSyncDatabridge = databridge
+
+    async def sync_calendar(
+        self,
+        *,
+        user_id: str,
+        access_token: str,
+        refresh_token: str,
+        calendar_id: str = "primary",
+        force: bool = False,
+    ) -> None:
+        """
+        Bring the local store up to date with Google
+
+        Skipped when the last sync is newer than `config.google.sync_min_interval_seconds`
+        unless `force` is set.
+
+        Raises:
+            ValueError: If the sync fails
+        """
+        now = datetime.now(timezone.utc)
+        state = await self.databridge.get_sync_state(
+            user_id=user_id, calendar_id=calendar_id
+        )
+        if (
+            not force
+            and state
+            and state.sync_token
+            and state.last_synced_at
+            and now - state.last_synced_at
+            < timedelta(seconds=config.google.sync_min_interval_seconds)
+        ):
+            return
+
+        full_sync_min = (
+            now - timedelta(days=config.google.sync_lookback_days)
+        ).isoformat()
+        sync_token = state.sync_token if state else None
+
+        result = await sync_events(
+            access_token=access_token,
+            refresh_token=refresh_token,
+            calendar_id=calendar_id,
+            sync_token=sync_token,
+            time_min=full_sync_min,
+        )
+        if result is not None and result.full_resync_required:
+            logger.info(f"Full resync of calendar {calendar_id} for user {user_id}")
+            sync_token = None
+            result = await sync_events(
+                access_token=access_token,
+                refresh_token=refresh_token,
+                calendar_id=calendar_id,
+                time_min=full_sync_min,
+            )
+
+        if result is None or result.full_resync_required:
+            raise ValueError("Failed to sync calendar events")
+
+        deleted_ids = [
+            event.id for event in result.events if event.status == "cancelled"
+        ]
+        stored_events = [
+            {
+                "event_id": event.id,
+                "start_time": _iso(to_utc(event.start)),
+                "end_time": _iso(to_utc(event.end)),
+                "data": event.model_dump(mode="json", by_alias=True, exclude_none=True),
+            }
+            for event in result.events
+            if event.id and event.status != "cancelled"
+        ]
+
+        if not await self.databridge.upsert_events(
+            user_id=user_id,
+            calendar_id=calendar_id,
+            events=stored_events,
+            updated_at=now,
+        ) or not await self.databridge.delete_events(
+            user_id=user_id, calendar_id=calendar_id, event_ids=deleted_ids
+        ):
+            raise ValueError("Failed to store synced calendar events")
+
+        # A full sync replaces the store: events it didn't write were deleted
+        # while unsynced. Dropped after the upsert, so readers never see an
+        # empty store and a failed write leaves the old events in place.
+        if not sync_token and not await self.databridge.delete_events_updated_before(
+            user_id=user_id, calendar_id=calendar_id, updated_before=now
+        ):
+            raise ValueError("Failed to remove stale calendar events")
+
+        await self.databridge.upsert_sync_state(
+            user_id=user_id,
+            calendar_id=calendar_id,
+            sync_token=result.next_sync_token,
+            last_synced_at=now,
+        )
+        logger.info(
+            f"Synced calendar {calendar_id} for user {user_id}: "
+            f"{len(stored_events)} upserted, {len(deleted_ids)} deleted"
+            f"{'' if sync_token else ' (full sync)'}"
+        )
+
+    async def get_events_in_range(
+        self,
+        *,
+        user_id: str,
+        calendar_id: str,
+        time_min: datetime,
+        time_max: datetime,
+    ) -> list[CalendarEvent] | None:
+        """Get stored events overlapping the window, or None if the store can't be read"""
+        db_events = await self.databridge.get_events_in_range(
+            user_id=user_id,
+            calendar_id=calendar_id,
+            time_min=time_min,
+            time_max=time_max,
+        )
+        if db_events is None:
+            return None
+        return [CalendarEvent(**db_event.data) for db_event in db_events]
+
+    async def invalidate(self, *, user_id: str, calendar_id: str) -> None:
+        """Force the next read of this calendar to pull changes from Google"""
+        await self.databridge.mark_stale(user_id=user_id, calendar_id=calendar_id)
@@ -1,8 +1,8 @@
-import boto3
-from botocore.exceptions import ClientError
 from fastapi import HTTPException
 
 import api.models.v1.emails as emails
+from api.core.email_queue import EmailQueue
+from api.settings.config import config
 
 
 def create_email_template(subject: str, body: str) -> str:
@@ -247,54 +247,65 @@ def create_email_template(subject: str, body: str) -> str:
 </html>"""
 
 
+# SES template built once from the layout above; SES fills in each email's
+# subject and (HTML) body, so queued emails don't carry the full layout
+EMAIL_TEMPLATE = {
+    "TemplateName": config.email.template_name,
+    "SubjectPart": "{{{subject}}}",
+    "HtmlPart": create_email_template("{{subject}}", "{{{body}}}"),
+    "TextPart": "{{{body}}}",
+}
+
+email_queue = EmailQueue(template=EMAIL_TEMPLATE)
+
+
 class EmailsService:
-    def __init__(self):
-        self.ses_client = boto3.client("ses", region_name="us-east-2")
-        self.source_email = "amia@amiavailable.com"
-        self.source_name = "AM/A"
+    def __init__(self, queue: EmailQueue = email_queue):
+        self.queue: EmailQueue = queue
 
     async def send_email(
-        self, *, to: list[str], subject: str, body: str
+        self,
+        *,
+        to: list[str],
+        subject: str,
+        body: str,
+        requested_by: str | None = None,
     ) -> emails.SendEmailResponse:
-        """Send an email using AWS SES with styled HTML template"""
-        try:
-            # Create styled HTML email
-            html_body = create_email_template(subject, body)
-
-            response = self.ses_client.send_email(
-                Source=f"{self.source_name} <{self.source_email}>",
-                Destination={"ToAddresses": to},
-                Message={
-                    "Subject": {"Data": subject},
-                    "Body": {
-                        "Html": {"Data": html_body},
-                        "Text": {"Data": body},  # Keep plain text as fallback
-                    },
-                },
-            )
+        """
+        Queue an email to be sent through AWS SES with the styled HTML template
 
-            message_id = response.get("MessageId")
-            return emails.SendEmailResponse(
-                message="Email sent successfully", message_id=message_id
-            )
+        With `EMAIL__SEND_BEFORE_RESPONSE` (the default on Lambda) the send is
+        awaited, so the email is out before the container can be frozen.
 
-        except ClientError as e:
-            error_code = e.response["Error"]["Code"]
-            error_message = e.response["Error"]["Message"]
-
-            if error_code == "MessageRejected":
-                raise HTTPException(
-                    status_code=400, detail=f"Email rejected: {error_message}"
-                )
-            elif error_code == "MailFromDomainNotVerified":
-                raise HTTPException(status_code=500, detail="Email domain not verified")
-            elif error_code == "ConfigurationSetDoesNotExist":
-                raise HTTPException(status_code=500, detail="Email configuration error")
-            else:
-                raise HTTPException(
-                    status_code=500, detail=f"Failed to send email: {error_message}"
-                )
-        except Exception as e:
+        Raises:
+            HTTPException: 502 if the email was awaited and failed
+        """
+        if not to:
+            raise HTTPException(status_code=400, detail="At least one recipient is required")
+
+        status = self.queue.enqueue(
+            to=to, subject=subject, body=body, requested_by=requested_by
+        )
+        if not config.email.send_before_response:
+            return emails.SendEmailResponse(message="Email queued", handle=status.handle)
+
+        await self.queue.flush()
+        status = self.queue.get_status(status.handle) or status
+        if status.status == "failed":
             raise HTTPException(
-                status_code=500, detail=f"Unexpected error sending email: {str(e)}"
+                status_code=502, detail=f"Failed to send email: {status.error}"
             )
+        return emails.SendEmailResponse(
+            message="Email sent", handle=status.handle, message_id=status.message_id
+        )
+
+    async def get_email_status(
+        self, *, handle: str, user_id: str
+    ) -> emails.EmailStatusResponse:
+        """Get the delivery status of a queued email"""
+        status = self.queue.get_status(handle)
+
+        if not status or status.requested_by != user_id:
+            raise HTTPException(status_code=404, detail="Email not found")
+
+        return emails.EmailStatusResponse(email=status)
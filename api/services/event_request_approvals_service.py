@@ -1,3 +1,4 @@
+import logging
 from fastapi import HTTPException
 from api.databridge.event_request_approvals_databridge import (
     EventRequestApprovalsDatabridge,
@@ -12,12 +13,24 @@ from api.models.v1.event_request_approvals import (
     EventRequestApprovalsListResponse,
     EventRequestApprovalResponse,
 )
+from api.services.notifications_service import (
+    NotificationsService,
+    EventRequestNotificationPayload,
+    User,
+)
 import api.models.v1.event_request_approvals as era_models
 
+logger = logging.getLogger(__name__)
+
 
 class EventRequestApprovalsService:
-    def __init__(self, databridge: EventRequestApprovalsDatabridge):
+    def __init__(
+        self,
+        databridge: EventRequestApprovalsDatabridge,
+        notification_service: NotificationsService,
+    ):
         self.databridge: EventRequestApprovalsDatabridge = databridge
+        self.notification_service: NotificationsService = notification_service
 
     def _convert_db_to_model(
         self, db_approval: DBEventRequestApprovalResponse
@@ -40,8 +53,14 @@ class EventRequestApprovalsService:
         *,
         event_request_id: str,
         approvals_request: list[era_models.EventRequestApprovalUser],
+        requested_by: User | None = None,
     ) -> EventRequestApprovalsBatchCreateResponse:
-        """Create a batch of event request approvals"""
+        """
+        Create a batch of event request approvals
+
+        When `requested_by` is given, every approver is notified of the new
+        request with a single notifications insert.
+        """
         db_approvals = await self.databridge.create_event_request_approvals_batch(
             event_request_id=event_request_id, approvals_request=approvals_request
         )
@@ -51,6 +70,20 @@ class EventRequestApprovalsService:
             self._convert_db_to_model(approval) for approval in db_approvals
         ]
 
+        if requested_by and approval_data_list:
+            try:
+                await self.notification_service.create_event_request_notifications(
+                    to_user_ids=[approval.user_id for approval in approval_data_list],
+                    payload=EventRequestNotificationPayload(
+                        event_request_id=event_request_id,
+                        update="created",
+                        user=requested_by,
+                    ),
+                )
+            except Exception as e:
+                # the approvals stand even if approvers couldn't be notified
+                logger.error(f"Error notifying approvers of event request {event_request_id}: {e}")
+
         return EventRequestApprovalsBatchCreateResponse(
             event_request_approvals=approval_data_list, count=len(approval_data_list)
         )
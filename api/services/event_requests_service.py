@@ -1,11 +1,15 @@
+import asyncio
+import logging
 from fastapi import HTTPException
 from datetime import datetime
+from typing import AsyncIterator
 from ..databridge.event_requests_databridge import (
     EventRequestsDatabridge,
     DBEventRequestResponse,
     DBEventRequestWithApprovalsResponse,
     DBEventRequestWithApproversResponse,
     DBEventRequestApprovalResponse,
+    DBEventRequestApproverEmailResponse,
 )
 from ..models.v1.event_requests import (
     EventRequestData,
@@ -19,12 +23,27 @@ from ..models.v1.event_requests import (
     EventRequestsWithApprovalsListResponse,
     EventRequestResponse,
     EventRequestWithApproversResponse,
+    EventRequestAvailabilityResponse,
+    ApproverAvailabilityData,
+    BusyPeriodData,
     EventDateTime,
 )
+from ..core.availability import to_utc
+from ..core.event_parser import Contact
+from ..core.llm_gateway import LLMRateLimitError
+from ..core.pagination import InvalidCursorError, decode_cursor, encode_cursor
+from ..proxy.google_proxy import query_freebusy
+from ..proxy.models.google_models import (
+    CalendarFreeBusy,
+    EventDateTime as GoogleEventDateTime,
+)
 
 import api.models.v1.event_requests as models
 from api.services.llm_service import LLMService
 from api.services.relationships_service import RelationshipsService
+from api.services.google_token_service import GoogleTokenService
+
+logger = logging.getLogger(__name__)
 
 
 class EventRequestsService:
@@ -33,8 +52,10 @@ class EventRequestsService:
         databridge: EventRequestsDatabridge,
         llm_service: LLMService,
         relationships_service: RelationshipsService,
+        google_token_service: GoogleTokenService,
     ):
         self.databridge: EventRequestsDatabridge = databridge
+        self.google_token_service: GoogleTokenService = google_token_service
         self.relationships_service: RelationshipsService = relationships_service
         self.llm_service: LLMService = llm_service
 
@@ -145,28 +166,89 @@ class EventRequestsService:
             ],
         )
 
+    async def _auto_fill_contacts(self, *, user_id: str) -> list[Contact]:
+        """
+        All of the user's relationships, the people an auto-filled request can
+        name (the LLM context is pruned to those mentioned, see LLMService)
+        """
+        _relationships = (
+            await self.relationships_service.get_all_user_relationships_with_users(
+                user_id=user_id
+            )
+        )
+        return [
+            Contact(
+                id=relationship.other_user.id,
+                name=relationship.other_user.full_name,
+            )
+            for relationship in _relationships
+            if relationship.other_user.full_name
+        ]
+
+    @staticmethod
+    def _rate_limited(e: LLMRateLimitError) -> HTTPException:
+        return HTTPException(
+            status_code=429,
+            detail=str(e),
+            headers={"Retry-After": str(max(1, round(e.retry_after_seconds)))},
+        )
+
     async def auto_fill_event_request(
         self,
         *,
         request: models.SmartParseEventRequestRequest,
         user_id: str,
     ) -> models.SmartParseEvent:
-        """Auto-fill an event request by description/request"""
-        _relationships = (
-            await self.relationships_service.get_user_relationships_with_users(
-                user_id=user_id
+        """
+        Auto-fill an event request by description/request
+
+        Raises:
+            HTTPException: 429 if the user (or the service) is over its LLM limits
+        """
+        _contacts = await self._auto_fill_contacts(user_id=user_id)
+        try:
+            return await self.llm_service.smart_parse_event_request(
+                request, contacts=_contacts, user_id=user_id
             )
-        )
-        # format the current date as long format (wednesday, september 18, 2025 - 12:00 pm)
-        _current_date = request.current_date.strftime("%A, %B %d, %Y - %I:%M %p")
-        _context = f"The current date is {_current_date}"
-        _context += f"\nThe user has the following relationships: {[
-            {
-                "id": relationship.other_user.id,
-                "name": relationship.other_user.full_name,
-            } for relationship in _relationships.relationships
-        ]}"
-        return await self.llm_service.smart_parse_event_request(request, _context)
+        except LLMRateLimitError as e:
+            raise self._rate_limited(e)
+
+    async def stream_auto_fill_event_request(
+        self,
+        *,
+        request: models.SmartParseEventRequestRequest,
+        user_id: str,
+    ) -> AsyncIterator[models.SmartParseFieldUpdate | models.SmartParseEvent]:
+        """
+        Auto-fill an event request, returning an iterator of fields as they are
+        parsed and the event last
+
+        The relationships are fetched and the user's AI limits checked before
+        the iterator is returned, so a rate-limited request gets a 429 rather
+        than a stream that fails.
+
+        Raises:
+            HTTPException: 429 if the user is over their AI limits
+        """
+        _contacts = await self._auto_fill_contacts(user_id=user_id)
+        try:
+            _items = await self.llm_service.stream_smart_parse_event_request(
+                request, contacts=_contacts, user_id=user_id
+            )
+        except LLMRateLimitError as e:
+            raise self._rate_limited(e)
+        return self._stream_rate_limited(_items)
+
+    async def _stream_rate_limited(
+        self,
+        items: AsyncIterator[models.SmartParseFieldUpdate | models.SmartParseEvent],
+    ) -> AsyncIterator[models.SmartParseFieldUpdate | models.SmartParseEvent]:
+        """`items`, with limits hit mid-stream raised as a 429"""
+        try:
+            async for item in items:
+                yield item
+        except LLMRateLimitError as e:
+            raise self._rate_limited(e)
 
     async def create_event_request(
         self,
@@ -246,6 +328,145 @@ class EventRequestsService:
         request_data = self._convert_db_with_approvers_to_model(db_request)
         return EventRequestWithApproversResponse(event_request=request_data)
 
+    async def _query_approver_own_calendar(
+        self,
+        *,
+        approver: DBEventRequestApproverEmailResponse,
+        time_min: str,
+        time_max: str,
+    ) -> CalendarFreeBusy | None:
+        """Query an approver's primary calendar with their own Google tokens"""
+        token_data = await self.google_token_service.get_user_tokens(
+            user_id=approver.user_id
+        )
+        if not token_data:
+            return None
+        result = await query_freebusy(
+            access_token=token_data.google_access_token,
+            refresh_token=token_data.google_refresh_token,
+            calendar_ids=["primary"],
+            time_min=time_min,
+            time_max=time_max,
+        )
+        if not result or "primary" not in result or result["primary"].errors:
+            return None
+        return result["primary"]
+
+    async def get_approver_availability(
+        self, *, event_request_id: str, user_id: str
+    ) -> EventRequestAvailabilityResponse:
+        """
+        Get the free/busy status of every approver during an event request
+
+        All approvers are queried in one FreeBusy call using the current user's
+        Google account. Approvers whose calendars aren't shared with the current
+        user fall back to a query with their own tokens (run concurrently).
+
+        Raises:
+            HTTPException: If the event request doesn't exist, the current user
+                is neither its requester nor an approver, its dates are invalid,
+                or the current user hasn't connected Google
+        """
+        db_request = await self.databridge.get_event_request_by_id(
+            event_request_id=event_request_id
+        )
+        if not db_request:
+            raise HTTPException(status_code=404, detail="Event request not found")
+
+        approvers = await self.databridge.get_event_request_approver_emails(
+            event_request_id=event_request_id
+        )
+        # approvers' calendars are read with their own tokens, so only the
+        # people on the request may see them
+        if db_request.created_by != user_id and user_id not in {
+            approver.user_id for approver in approvers
+        }:
+            raise HTTPException(
+                status_code=403,
+                detail="You don't have permission to view this event request",
+            )
+
+        start = to_utc(GoogleEventDateTime(**db_request.start_date))
+        end = to_utc(GoogleEventDateTime(**db_request.end_date))
+        if start is None or end is None or start >= end:
+            raise HTTPException(
+                status_code=400, detail="Event request has an invalid time window"
+            )
+        time_min, time_max = start.isoformat(), end.isoformat()
+
+        calendars: dict[str, CalendarFreeBusy] = {}
+        if approvers:
+            token_data = await self.google_token_service.get_user_tokens(
+                user_id=user_id
+            )
+            if not token_data:
+                raise HTTPException(
+                    status_code=400,
+                    detail="No Google tokens found for user. Please connect your Google account.",
+                )
+            calendars = (
+                await query_freebusy(
+                    access_token=token_data.google_access_token,
+                    refresh_token=token_data.google_refresh_token,
+                    calendar_ids=[approver.email for approver in approvers],
+                    time_min=time_min,
+                    time_max=time_max,
+                )
+                or {}
+            )
+
+        unresolved = [
+            approver
+            for approver in approvers
+            if approver.email not in calendars or calendars[approver.email].errors
+        ]
+        if unresolved:
+            logger.info(
+                f"Falling back to approvers' own calendars for {len(unresolved)} approvers"
+            )
+            fallbacks = await asyncio.gather(
+                *(
+                    self._query_approver_own_calendar(
+                        approver=approver, time_min=time_min, time_max=time_max
+                    )
+                    for approver in unresolved
+                )
+            )
+            for approver, fallback in zip(unresolved, fallbacks):
+                if fallback is not None:
+                    calendars[approver.email] = fallback
+
+        approver_availability = []
+        for approver in approvers:
+            calendar = calendars.get(approver.email)
+            if calendar is None or calendar.errors:
+                availability, busy = "unknown", []
+            else:
+                busy = [
+                    BusyPeriodData(start=period.start, end=period.end)
+                    for period in calendar.busy
+                ]
+                availability = "busy" if busy else "free"
+            approver_availability.append(
+                ApproverAvailabilityData(
+                    user_id=approver.user_id,
+                    email=approver.email,
+                    required=approver.required,
+                    availability=availability,
+                    busy=busy,
+                )
+            )
+
+        return EventRequestAvailabilityResponse(
+            event_request_id=event_request_id,
+            time_min=start,
+            time_max=end,
+            approvers=approver_availability,
+            all_free=all(
+                approver.availability == "free" for approver in approver_availability
+            ),
+        )
+
     async def get_user_event_requests(
         self,
         *,
@@ -499,26 +720,52 @@ class EventRequestsService:
         status: str | None = None,
         skip: int = 0,
         take: int = 50,
+        cursor: str | None = None,
+        include_total: bool | None = None,
     ) -> EventRequestsWithApprovalsListResponse:
-        """List event requests with approval status aggregation"""
+        """
+        List event requests with approval status aggregation
+
+        Pass the previous page's `next_cursor` as `cursor` to page without an
+        offset. The total count is only computed on the first page unless
+        `include_total` says otherwise.
+        """
+        try:
+            position = decode_cursor(cursor) if cursor else None
+        except InvalidCursorError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        if include_total is None:
+            include_total = cursor is None
+
+        # one extra row tells us whether there is another page
         db_requests = await self.databridge.list_event_requests_with_approvals(
             user_id=user_id,
             status=status,
             skip=skip,
-            take=take,
+            take=take + 1,
+            cursor=position,
+            include_total=include_total,
         )
 
         requests = [
-            self._convert_db_with_approvals_to_model(req) for req in db_requests
+            self._convert_db_with_approvals_to_model(req) for req in db_requests[:take]
         ]
 
         # Get total count from the first item if available
-        total_count = db_requests[0].total_count if db_requests else 0
+        if include_total:
+            total_count = db_requests[0].total_count if db_requests else 0
+        else:
+            total_count = None
 
         filters = {}
         if status:
             filters["status"] = status
 
+        next_cursor = None
+        if len(db_requests) > take:
+            last = db_requests[take - 1]
+            next_cursor = encode_cursor(created_at=last.created_at, id=last.id)
+
         return EventRequestsWithApprovalsListResponse(
             event_requests=requests,
             count=len(requests),
@@ -526,4 +773,5 @@ class EventRequestsService:
             skip=skip,
             take=take,
             filters=filters if filters else None,
+            next_cursor=next_cursor,
         )
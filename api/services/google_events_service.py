@@ -1,11 +1,12 @@
 import logging
-from typing import Any
-from datetime import datetime, timedelta
-from ..databridge.user_token_databridge import UserTokenDatabridge, DBUserTokenResponse
-from ..models.v1.events import EventData
+from typing import Any, AsyncIterator
+from datetime import datetime, timedelta, timezone
+from ..databridge.user_token_databridge import DBUserTokenResponse
+from ..models.v1.events import EventData, BatchEventOperationRequest
 from ..proxy.google_proxy import (
     get_google_calendar_events,
     list_events,
+    iter_events,
     get_event_details,
     create_event,
     update_event,
@@ -14,11 +15,19 @@ from ..proxy.google_proxy import (
     list_calendars,
     quick_add_event,
     move_event,
+    batch_events,
     get_events_for_date_range,
     get_today_events,
     get_upcoming_events,
 )
-from ..proxy.models.google_models import CalendarEvent, CalendarInfo
+from ..proxy.models.google_models import (
+    BatchEventOperation,
+    BatchEventResult,
+    CalendarEvent,
+    CalendarInfo,
+)
+from .calendar_sync_service import CalendarSyncService
+from .google_token_service import GoogleTokenService
 
 logger = logging.getLogger(__name__)
 
@@ -26,18 +35,58 @@ logger = logging.getLogger(__name__)
 class GoogleEventsService:
     """Service layer for handling calendar events business logic"""
 
-    def __init__(self, user_token_databridge: UserTokenDatabridge):
-        self.user_token_databridge = user_token_databridge
+    def __init__(
+        self,
+        google_token_service: GoogleTokenService,
+        calendar_sync_service: CalendarSyncService,
+    ):
+        self.google_token_service = google_token_service
+        self.calendar_sync_service = calendar_sync_service
 
     async def _get_user_tokens(self, *, user_id: str) -> DBUserTokenResponse:
         """Get user tokens with error handling"""
-        token_data = await self.user_token_databridge.get_user_tokens(user_id=user_id)
+        token_data = await self.google_token_service.get_user_tokens(user_id=user_id)
         if not token_data:
             raise ValueError(
                 "No Google tokens found for user. Please connect your Google account."
             )
         return token_data
 
+    async def _get_stored_events(
+        self,
+        *,
+        user_id: str,
+        token_data: DBUserTokenResponse,
+        calendar_id: str,
+        time_min: datetime,
+        time_max: datetime,
+    ) -> list[CalendarEvent] | None:
+        """
+        Answer a time window query from the synced local event store
+
+        Returns None if the sync or the store fails, so callers can fall back to
+        querying Google directly.
+        """
+        try:
+            await self.calendar_sync_service.sync_calendar(
+                user_id=user_id,
+                access_token=token_data.google_access_token,
+                refresh_token=token_data.google_refresh_token,
+                calendar_id=calendar_id,
+            )
+        except Exception as e:
+            logger.warning(
+                f"Calendar sync failed for user {user_id}, querying Google: {str(e)}"
+            )
+            return None
+
+        return await self.calendar_sync_service.get_events_in_range(
+            user_id=user_id,
+            calendar_id=calendar_id,
+            time_min=time_min,
+            time_max=time_max,
+        )
+
     async def get_current_week_events(self, *, user_id: str) -> list[CalendarEvent]:
         """
         Get calendar events for the current week
@@ -54,10 +103,23 @@ class GoogleEventsService:
         try:
             token_data = await self._get_user_tokens(user_id=user_id)
 
-            events = await get_google_calendar_events(
-                access_token=token_data.google_access_token,
-                refresh_token=token_data.google_refresh_token,
+            # Current week (Monday to Sunday) in UTC
+            now = datetime.now(timezone.utc)
+            start_of_week = (now - timedelta(days=now.weekday())).replace(
+                hour=0, minute=0, second=0, microsecond=0
+            )
+            events = await self._get_stored_events(
+                user_id=user_id,
+                token_data=token_data,
+                calendar_id="primary",
+                time_min=start_of_week,
+                time_max=start_of_week + timedelta(days=7),
             )
+            if events is None:
+                events = await get_google_calendar_events(
+                    access_token=token_data.google_access_token,
+                    refresh_token=token_data.google_refresh_token,
+                )
 
             if events is None:
                 raise ValueError("Failed to retrieve calendar events")
@@ -119,6 +181,45 @@ class GoogleEventsService:
             logger.error(f"Error listing events for user {user_id}: {str(e)}")
             raise
 
+    async def stream_calendar_events(
+        self,
+        *,
+        user_id: str,
+        calendar_id: str = "primary",
+        time_min: str | None = None,
+        time_max: str | None = None,
+        max_results: int = 250,
+        query: str | None = None,
+    ) -> AsyncIterator[CalendarEvent]:
+        """
+        Stream calendar events page by page as they arrive from Google
+
+        Args:
+            user_id: User identifier
+            calendar_id: Calendar ID to query
+            time_min: Lower bound for event start time (RFC3339 format)
+            time_max: Upper bound for event end time (RFC3339 format)
+            max_results: Maximum number of events
+            query: Free text search query
+
+        Returns:
+            Async iterator of calendar events
+
+        Raises:
+            ValueError: If user tokens not found
+        """
+        token_data = await self._get_user_tokens(user_id=user_id)
+
+        return iter_events(
+            access_token=token_data.google_access_token,
+            refresh_token=token_data.google_refresh_token,
+            calendar_id=calendar_id,
+            time_min=time_min,
+            time_max=time_max,
+            max_results=max_results,
+            query=query,
+        )
+
     async def get_event_by_id(
         self, *, user_id: str, event_id: str, calendar_id: str = "primary"
     ) -> CalendarEvent:
@@ -195,6 +296,9 @@ class GoogleEventsService:
             if created_event is None:
                 raise ValueError("Failed to create event")
 
+            await self.calendar_sync_service.invalidate(
+                user_id=user_id, calendar_id=calendar_id
+            )
             return created_event
 
         except Exception as e:
@@ -244,6 +348,9 @@ class GoogleEventsService:
             if updated_event is None:
                 raise ValueError("Event not found or update failed")
 
+            await self.calendar_sync_service.invalidate(
+                user_id=user_id, calendar_id=calendar_id
+            )
             return updated_event
 
         except Exception as e:
@@ -289,6 +396,9 @@ class GoogleEventsService:
             if not success:
                 raise ValueError("Event not found or delete failed")
 
+            await self.calendar_sync_service.invalidate(
+                user_id=user_id, calendar_id=calendar_id
+            )
             return success
 
         except Exception as e:
@@ -383,6 +493,9 @@ class GoogleEventsService:
             if created_event is None:
                 raise ValueError("Failed to create event")
 
+            await self.calendar_sync_service.invalidate(
+                user_id=user_id, calendar_id=calendar_id
+            )
             return created_event
 
         except Exception as e:
@@ -429,12 +542,79 @@ class GoogleEventsService:
             if moved_event is None:
                 raise ValueError("Event not found or move failed")
 
+            for _calendar_id in (source_calendar_id, destination_calendar_id):
+                await self.calendar_sync_service.invalidate(
+                    user_id=user_id, calendar_id=_calendar_id
+                )
             return moved_event
 
         except Exception as e:
             logger.error(f"Error moving event {event_id} for user {user_id}: {str(e)}")
             raise
 
+    async def batch_calendar_events(
+        self,
+        *,
+        user_id: str,
+        operations: list[BatchEventOperationRequest],
+    ) -> list[BatchEventResult]:
+        """
+        Create, update, delete and move many events in batched round trips
+
+        Args:
+            user_id: User identifier
+            operations: Event mutations to perform
+
+        Returns:
+            One result per operation, in order
+
+        Raises:
+            ValueError: If user tokens not found or the batch could not be sent
+        """
+        try:
+            token_data = await self._get_user_tokens(user_id=user_id)
+
+            results = await batch_events(
+                access_token=token_data.google_access_token,
+                refresh_token=token_data.google_refresh_token,
+                operations=[
+                    BatchEventOperation(
+                        method=operation.method,
+                        calendar_id=operation.calendar_id,
+                        event_id=operation.event_id,
+                        event_data=(
+                            operation.event_data.model_dump(
+                                by_alias=True, exclude_none=True
+                            )
+                            if operation.event_data
+                            else None
+                        ),
+                        destination_calendar_id=operation.destination_calendar_id,
+                        send_notifications=operation.send_notifications,
+                    )
+                    for operation in operations
+                ],
+            )
+
+            if results is None:
+                raise ValueError("Failed to run events batch")
+
+            changed_calendars = set()
+            for operation, result in zip(operations, results):
+                if result.success:
+                    changed_calendars.add(operation.calendar_id)
+                    if operation.destination_calendar_id:
+                        changed_calendars.add(operation.destination_calendar_id)
+            for _calendar_id in changed_calendars:
+                await self.calendar_sync_service.invalidate(
+                    user_id=user_id, calendar_id=_calendar_id
+                )
+            return results
+
+        except Exception as e:
+            logger.error(f"Error running events batch for user {user_id}: {str(e)}")
+            raise
+
     async def get_today_calendar_events(
         self, *, user_id: str, calendar_id: str = "primary"
     ) -> list[CalendarEvent]:
@@ -454,11 +634,22 @@ class GoogleEventsService:
         try:
             token_data = await self._get_user_tokens(user_id=user_id)
 
-            events = await get_today_events(
-                access_token=token_data.google_access_token,
-                refresh_token=token_data.google_refresh_token,
+            start_of_day = datetime.now(timezone.utc).replace(
+                hour=0, minute=0, second=0, microsecond=0
+            )
+            events = await self._get_stored_events(
+                user_id=user_id,
+                token_data=token_data,
                 calendar_id=calendar_id,
+                time_min=start_of_day,
+                time_max=start_of_day + timedelta(days=1),
             )
+            if events is None:
+                events = await get_today_events(
+                    access_token=token_data.google_access_token,
+                    refresh_token=token_data.google_refresh_token,
+                    calendar_id=calendar_id,
+                )
 
             if events is None:
                 raise ValueError("Failed to retrieve today's events")
@@ -489,12 +680,21 @@ class GoogleEventsService:
         try:
             token_data = await self._get_user_tokens(user_id=user_id)
 
-            events = await get_upcoming_events(
-                access_token=token_data.google_access_token,
-                refresh_token=token_data.google_refresh_token,
-                days_ahead=days_ahead,
+            now = datetime.now(timezone.utc)
+            events = await self._get_stored_events(
+                user_id=user_id,
+                token_data=token_data,
                 calendar_id=calendar_id,
+                time_min=now,
+                time_max=now + timedelta(days=days_ahead),
             )
+            if events is None:
+                events = await get_upcoming_events(
+                    access_token=token_data.google_access_token,
+                    refresh_token=token_data.google_refresh_token,
+                    days_ahead=days_ahead,
+                    calendar_id=calendar_id,
+                )
 
             if events is None:
                 raise ValueError("Failed to retrieve upcoming events")
@@ -0,0 +1,55 @@
+import logging
+from ..databridge.user_token_databridge import UserTokenDatabridge, DBUserTokenResponse
+from ..proxy.google_token_manager import token_manager
+
+logger = logging.getLogger(__name__)
+
+
+class GoogleTokenService:
+    """
+    Hands out usable Google tokens for a user
+
+    Tokens come from `user_tokens` but are checked against the process-wide
+    token manager, which refreshes them ahead of expiry. Any newer token
+    (refreshed here or after a 401 in the proxy) is written back once, so later
+    requests and other processes don't start from a stale token.
+    """
+
+    def __init__(self, user_token_databridge: UserTokenDatabridge):
+        self.user_token_databridge: UserTokenDatabridge = user_token_databridge
+
+    async def get_user_tokens(self, *, user_id: str) -> DBUserTokenResponse | None:
+        """Get a user's Google tokens, or None if they haven't connected Google"""
+        token_data = await self.user_token_databridge.get_user_tokens(user_id=user_id)
+        if not token_data:
+            return None
+
+        try:
+            token = await token_manager.get_valid_token(
+                access_token=token_data.google_access_token,
+                refresh_token=token_data.google_refresh_token,
+                expires_at=token_data.google_token_expires_at,
+            )
+        except Exception as e:
+            # the stored token may still work; a 401 retries the refresh
+            logger.warning(f"Proactive Google token refresh failed: {e}")
+            return token_data
+
+        if token is None or token.access_token == token_data.google_access_token:
+            return token_data
+
+        if token_manager.claim_persist(token):
+            saved = await self.user_token_databridge.update_user_tokens(
+                user_id=user_id,
+                google_access_token=token.access_token,
+                google_refresh_token=token.refresh_token,
+                google_token_expires_at=token.expires_at,
+            )
+            if saved:
+                logger.info(f"Persisted refreshed Google tokens for user {user_id}")
+
+        return DBUserTokenResponse(
+            google_access_token=token.access_token,
+            google_refresh_token=token.refresh_token,
+            google_token_expires_at=token.expires_at,
+        )
@@ -1,87 +1,706 @@
-import openai
-from openai.types.chat.chat_completion import ChatCompletion
+import re
+import math
+import asyncio
 import time
+import json
+import hashlib
 import logging
-from pydantic import BaseModel
+from functools import cache
+from datetime import datetime
+from pydantic import BaseModel, TypeAdapter, ValidationError
 from api.settings.config import config
-from api.models.v1.event_requests import SmartParseEventRequestRequest, SmartParseEvent
-from typing import Any 
+from api.settings.secrets import secrets_manager
+from api.core.semantic_cache import SemanticCache, normalize_text
+from api.core.event_parser import Contact, parse_event_text
+from api.core.tier_metrics import TierMetrics
+from api.core.llm_gateway import LLMRateLimitError, llm_gateway
+from api.models.v1.event_request_approvals import EventRequestApprovalUser
+from api.models.v1.event_requests import (
+    EventDateTime,
+    SmartParseEventRequestRequest,
+    SmartParseEvent,
+    SmartParseFieldUpdate,
+)
+from typing import Annotated, Any, AsyncIterator, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import openai
+    from openai.types.chat.chat_completion import ChatCompletion
+    from openai.types.create_embedding_response import CreateEmbeddingResponse
 
 logger = logging.getLogger(__name__)
 
-openai_client = openai.AsyncOpenAI(api_key=config.openai.api_key)
+
+@cache
+def get_openai_client() -> "openai.AsyncOpenAI":
+    """Shared OpenAI client, created (and the SDK imported) on first use"""
+    import openai
+
+    return openai.AsyncOpenAI(api_key=config.openai.api_key)
+
+
+# pick up a rotated API key on the next call
+secrets_manager.add_refresh_listener(get_openai_client.cache_clear)
+
+# parsed auto-fill responses, shared by every LLMService in the process
+smart_parse_cache: SemanticCache[SmartParseEvent] = SemanticCache(
+    name="smart_parse",
+    max_entries=config.llm.parse_cache_max_entries,
+    ttl_seconds=config.llm.parse_cache_ttl_seconds,
+    similarity_threshold=config.llm.parse_cache_similarity_threshold,
+)
+
+# the request fields the similarity tier compares
+_SMART_PARSE_TEXT_FIELDS = ("title", "location", "description", "notes")
+
+# auto-fill tiers, cheapest first (see LLMService._route_smart_parse)
+rules_tier = TierMetrics(name="smart_parse.rules")
+small_model_tier = TierMetrics(name="smart_parse.small_model")
+large_model_tier = TierMetrics(name="smart_parse.large_model")
+
+# models without a price, already warned about
+_unpriced_models: set[str] = set()
+
+# the values a model answer is judged on: dates and approvers, not the wording
+_DECISION_VALUES = re.compile(
+    r'"(?:date|date_time|user_id|required)"\s*:\s*("[^"]*"|true|false|null)'
+)
+
+
+@cache
+def _smart_parse_field_adapter(name: str) -> TypeAdapter:
+    """Validator for one SmartParseEvent field, including its constraints"""
+    field = SmartParseEvent.model_fields[name]
+    return TypeAdapter(Annotated[field.annotation, field])
+
+
+# static, so it is the start of every auto-fill prompt and can be cached by the provider
+SMART_PARSE_INSTRUCTIONS = """You are a helpful assistant that can parse event requests.
+
+The user message has three parts:
+<relationships> a table of the people the user knows, one "id<TAB>name" per line
+<current_date> the user's current local date and time
+<request> the event request as JSON; the user may have typed it all into one field
+
+Parse the request into the required format, filling out the other fields based on the contents of the request. (fields might be in the wrong place)
+Resolve relative dates and times ("tomorrow", "friday at 7") against the current date.
+If the user asks you to "ask someone" / "run it by someone", ONLY THEN add that user to the approvers list (with required set to true), using their id from the relationships table.
+ONLY if the user asks you to notify someone, then add that user to the approvers list (with required set to false).
+Use your discretion to determine whether the user is asking you to notify someone or ask them for permission / run it by someone.
+Do not add ANY information that isn't in the request. If the user doesn't specify something, leave it blank.
+"""
+
+# routes auto-fill calls to servers likely to hold the instructions above in cache
+SMART_PARSE_PROMPT_CACHE_KEY = "smart_parse_event_request"
+
+# words that make a request depend on the time of day, not just the date
+_TIME_RELATIVE_WORDS = {"now", "soon", "later", "hour", "hours", "minute", "minutes"}
+
 
 class LLMCosts(BaseModel):
     input_cost: float
     output_cost: float
     total_cost: float
+    prompt_tokens: int = 0
+    # prompt tokens served from the provider's prompt cache (billed at a discount)
+    cached_prompt_tokens: int = 0
+    completion_tokens: int = 0
 
 
 class LLMService:
 
-    # this is per million tokens
+    # this is per million tokens; dated snapshots fall back to their base model
     MODEL_COSTS = {
+        "gpt-4o": {
+            "input": 2.50,
+            "cached_input": 1.25,
+            "output": 10,
+        },
         "gpt-4o-2024-08-06": {
             "input": 2.50,
+            "cached_input": 1.25,
             "output": 10,
         },
         "gpt-4o-mini": {
             "input": .15,
+            "cached_input": .075,
+            "output": .60,
+        },
+        "gpt-4o-mini-2024-07-18": {
+            "input": .15,
+            "cached_input": .075,
             "output": .60,
         },
+        "text-embedding-3-small": {
+            "input": .02,
+            "output": 0,
+        },
     }
 
-    def __init__(self):
-        self.openai_client: openai.AsyncOpenAI = openai_client
+    @property
+    def openai_client(self) -> "openai.AsyncOpenAI":
+        return get_openai_client()
 
     
-    def _calculate_cost(self, response: ChatCompletion):
+    @classmethod
+    def _model_prices(cls, model: str) -> dict[str, float] | None:
+        """Prices for a model, or its longest priced prefix ("gpt-4o-mini-2025-..." -> "gpt-4o-mini")"""
+        if model in cls.MODEL_COSTS:
+            return cls.MODEL_COSTS[model]
+        prefixes = [name for name in cls.MODEL_COSTS if model.startswith(f"{name}-")]
+        if prefixes:
+            return cls.MODEL_COSTS[max(prefixes, key=len)]
+        if model not in _unpriced_models:
+            _unpriced_models.add(model)
+            logger.warning(f"No price for model {model}, recording its calls as free")
+        return None
+
+    def _calculate_cost(self, response: "ChatCompletion | CreateEmbeddingResponse"):
         _model = response.model
         _input_tokens = response.usage.prompt_tokens
-        _output_tokens = response.usage.completion_tokens
-        _input_cost = _input_tokens / 1000000 * self.MODEL_COSTS[_model]["input"]
-        _output_cost = _output_tokens / 1000000 * self.MODEL_COSTS[_model]["output"]
+        # embeddings have no completion or cached tokens
+        _output_tokens = getattr(response.usage, "completion_tokens", 0)
+        _details = getattr(response.usage, "prompt_tokens_details", None)
+        _cached_tokens = (_details.cached_tokens or 0) if _details else 0
+        _prices = self._model_prices(_model) or {"input": 0, "output": 0}
+        _input_cost = (
+            (_input_tokens - _cached_tokens) / 1000000 * _prices["input"]
+            + _cached_tokens / 1000000 * _prices.get("cached_input", _prices["input"])
+        )
+        _output_cost = _output_tokens / 1000000 * _prices["output"]
         return LLMCosts(
             input_cost = _input_cost,
             output_cost = _output_cost,
             total_cost = _input_cost + _output_cost,
+            prompt_tokens = _input_tokens,
+            cached_prompt_tokens = _cached_tokens,
+            completion_tokens = _output_tokens,
         )
         
 
 
-    async def smart_parse_event_request(
+    @staticmethod
+    def _smart_parse_text(request: SmartParseEventRequestRequest) -> str:
+        """The free-text parts of a request, normalized"""
+        return normalize_text(
+            " ".join(
+                value
+                for name in _SMART_PARSE_TEXT_FIELDS
+                if (value := getattr(request, name))
+            )
+        )
+
+    @staticmethod
+    def _date_bucket(current_date: datetime, text: str) -> str:
+        """
+        The part of the current date the answer depends on: the user's local day
+        (and UTC offset), or the hour when the request says "in an hour" etc.
+        """
+        offset = current_date.strftime("%z")
+        if _TIME_RELATIVE_WORDS.intersection(text.split()):
+            return current_date.strftime("%Y-%m-%dT%H") + offset
+        return current_date.strftime("%Y-%m-%d") + offset
+
+    async def _embed(self, text: str) -> list[float] | None:
+        """Embedding for the similarity tier, or None (the exact tier still works)"""
+        model = config.llm.parse_cache_embedding_model
+        try:
+            async with llm_gateway.call(model=model, purpose="parse_cache_embedding") as call:
+                response = await self.openai_client.embeddings.create(
+                    model=model, input=text
+                )
+                call.record(model=response.model, cost=self._calculate_cost(response))
+            return response.data[0].embedding
+        except Exception as e:
+            logger.warning(f"Embedding failed, skipping the similarity cache: {e}")
+            return None
+
+    def _smart_parse_cache_key(
         self, request: SmartParseEventRequestRequest, context: str
-    ) -> SmartParseEvent:
-        prompt = f"""<context>{context}</context>
-        <request>{request.model_dump_json()}</request>
-        <additional_instructions>
-Use the context to help you parse the request into the required format, filling out the other fields based on the contents of the request. (fields might be in the wrong place)</additional_instructions>
-If the user asks you to "ask someone" / "run it by someone", ONLY THEN add that user to the approvers list (with required set to true)
-ONLY if the user asks you to notify someone, then add that user to the approvers list (with required set to false).
-Use your discretion to determine whether the user is asking you to notify someone or ask them for permission / run it by someone.
-Do not add ANY information that isn't in the request. If the user doesn't specify something, leave it blank.
-"""
-        logger.info("Calling GPT-4o to parse event request")
-        _time = time.time()
-        response = await self.openai_client.beta.chat.completions.parse(
-            model="gpt-4o-2024-08-06",
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are a helpful assistant that can parse event requests.",
-                },
-                {"role": "user", "content": prompt},
-            ],
-            response_format=SmartParseEvent,
+    ) -> tuple[str, dict[str, Any]]:
+        """
+        Cache key for a request, and the partition/text for the similarity tier
+
+        The similarity tier only compares the free text, so the partition also
+        holds everything else the user filled in (dates, approvers, importance).
+        """
+        text = self._smart_parse_text(request)
+        fields = request.model_dump(mode="json", exclude={"current_date"})
+        for name, value in fields.items():
+            if isinstance(value, str):
+                fields[name] = normalize_text(value)
+        prefilled = {
+            name: value
+            for name, value in fields.items()
+            if name not in _SMART_PARSE_TEXT_FIELDS
+        }
+        partition = (
+            hashlib.sha256(context.encode()).hexdigest(),
+            self._date_bucket(request.current_date, text),
+            hashlib.sha256(json.dumps(prefilled, sort_keys=True).encode()).hexdigest(),
+        )
+        key = hashlib.sha256(
+            json.dumps([fields, *partition], sort_keys=True).encode()
+        ).hexdigest()
+        return key, {"partition": partition, "text": text, "embedding": None}
+
+    async def _cached_smart_parse(
+        self,
+        request: SmartParseEventRequestRequest,
+        contacts: list[Contact],
+        key: str,
+        lookup: dict[str, Any],
+    ) -> SmartParseEvent | None:
+        """
+        The cached or rule-based parse, or None if a model has to answer
+
+        The exact tier and the rule-based parser come first, so the embedding for
+        the similarity tier is only paid for when a model would otherwise be
+        called; it is kept in `lookup` for caching the model's answer.
+        """
+        hit = smart_parse_cache.get_exact(key)
+        if hit is None and config.llm.parse_router_enabled:
+            _object = self._rules_tier_parse(request, contacts)
+            if _object is not None:
+                smart_parse_cache.record_miss()
+                smart_parse_cache.set(key, _object.model_copy(deep=True), **lookup)
+                return _object
+        if hit is None:
+            if config.llm.parse_cache_semantic_enabled and lookup["text"]:
+                lookup["embedding"] = await self._embed(lookup["text"])
+            hit = smart_parse_cache.get_similar(**lookup)
+        if hit is None:
+            return None
+        _object, tier = hit
+        logger.info(f"Reused parsed event request ({tier} cache hit)")
+        return _object.model_copy(deep=True)
+
+    @staticmethod
+    def _smart_parse_context(
+        request: SmartParseEventRequestRequest, contacts: list[Contact]
+    ) -> str:
+        """
+        The user's relationships as a compact id/name table
+
+        Long lists are pruned to the people named in the request (by any part of
+        their name), since the model can only add someone the request mentions.
+        """
+        if len(contacts) > config.llm.parse_context_max_relationships:
+            words = set(
+                re.findall(
+                    r"\w+",
+                    " ".join(
+                        value
+                        for value in (request.title, request.description, request.notes)
+                        if value
+                    ).lower(),
+                )
+            )
+            contacts = [
+                contact
+                for contact in contacts
+                if words.intersection(re.findall(r"\w+", contact.name.lower()))
+            ]
+        rows = "\n".join(f"{contact.id}\t{contact.name}" for contact in contacts)
+        return f"<relationships>\n{rows}\n</relationships>"
+
+    def _smart_parse_messages(
+        self, request: SmartParseEventRequestRequest, context: str
+    ) -> list[dict[str, str]]:
+        # static instructions first, then per-user context, then what changes every call
+        # format the current date as long format (wednesday, september 18, 2025 - 12:00 pm)
+        _current_date = request.current_date.strftime("%A, %B %d, %Y - %I:%M %p")
+        _request = request.model_dump_json(exclude={"current_date"}, exclude_none=True)
+        return [
+            {"role": "system", "content": SMART_PARSE_INSTRUCTIONS},
+            {
+                "role": "user",
+                "content": f"{context}\n<current_date>{_current_date}</current_date>\n<request>{_request}</request>",
+            },
+        ]
+
+    @staticmethod
+    def _record(
+        tier: TierMetrics, started: float, cost: LLMCosts, *, accepted: bool
+    ) -> None:
+        """Record a completed model call (started at `time.perf_counter()`) on its tier"""
+        tier.record(
+            latency_seconds=time.perf_counter() - started,
+            cost=cost.total_cost,
+            accepted=accepted,
+            prompt_tokens=cost.prompt_tokens,
+            cached_prompt_tokens=cost.cached_prompt_tokens,
+            completion_tokens=cost.completion_tokens,
+        )
+
+    @staticmethod
+    def _log_usage(cost: LLMCosts) -> None:
+        logger.info(
+            f"Tokens - Prompt: {cost.prompt_tokens} ({cost.cached_prompt_tokens} cached), Completion: {cost.completion_tokens}"
         )
-        logger.info(f"Parsed event request in {time.time() - _time:.2f} seconds")
-        cost = self._calculate_cost(response)
         logger.info(f"Cost - Input: ${cost.input_cost:.6f}, Output: ${cost.output_cost:.6f}, Total: ${cost.total_cost:.6f}")
-        _object = response.choices[0].message.parsed
 
+    @staticmethod
+    def _strip_timezones(_object: SmartParseEvent) -> SmartParseEvent:
         # ensure that the start/end date isn't timezone aware
         if _object.start_date and _object.start_date.date_time:
             _object.start_date.date_time = _object.start_date.date_time.replace(tzinfo=None)
         if _object.end_date and _object.end_date.date_time:
             _object.end_date.date_time = _object.end_date.date_time.replace(tzinfo=None)
         return _object
+
+    @staticmethod
+    def _field_update(name: str, value: Any) -> SmartParseFieldUpdate | None:
+        """A completed field from the partial JSON, validated like the final object"""
+        adapter = _smart_parse_field_adapter(name)
+        try:
+            _value = adapter.validate_python(value)
+        except ValidationError:
+            # left for the final object to report
+            return None
+        if isinstance(_value, EventDateTime) and _value.date_time:
+            _value.date_time = _value.date_time.replace(tzinfo=None)
+        return SmartParseFieldUpdate(
+            field=name, value=adapter.dump_python(_value, mode="json")
+        )
+
+    @staticmethod
+    def _rule_parse(
+        request: SmartParseEventRequestRequest, contacts: list[Contact]
+    ) -> tuple[SmartParseEvent | None, float]:
+        """The rule-based parse of a one-line request, and its confidence"""
+        texts = [text for text in (request.title, request.description) if text]
+        # requests with several text fields, dates or approvers filled in are edits
+        if (
+            len(texts) != 1
+            or request.approvers
+            or request.start_date.date_time
+            or request.start_date.date
+        ):
+            return None, 0.0
+        parsed = parse_event_text(
+            texts[0], now=request.current_date, contacts=contacts
+        )
+        if parsed is None:
+            return None, 0.0
+        if parsed.reasons:
+            logger.info(f"Rule parse confidence {parsed.confidence:.2f}: {'; '.join(parsed.reasons)}")
+        _object = SmartParseEvent(
+            title=parsed.title,
+            location=request.location,
+            start_date=EventDateTime(date_time=parsed.start),
+            end_date=EventDateTime(date_time=parsed.end),
+            importance_level=request.importance_level,
+            notes=request.notes,
+            approvers=[
+                EventRequestApprovalUser(
+                    user_id=approver.user_id, required=approver.required
+                )
+                for approver in parsed.approvers
+            ],
+        )
+        return _object, parsed.confidence
+
+    def _rules_tier_parse(
+        self, request: SmartParseEventRequestRequest, contacts: list[Contact]
+    ) -> SmartParseEvent | None:
+        """The rule-based parse if it is confident enough, else None for the models"""
+        _time = time.perf_counter()
+        try:
+            _object, confidence = self._rule_parse(request, contacts)
+        except Exception as e:
+            # the models handle whatever the rules can't
+            logger.warning(f"Rule parse failed, escalating: {e}")
+            rules_tier.record(
+                latency_seconds=time.perf_counter() - _time, accepted=False, error=True
+            )
+            return None
+        accepted = confidence >= config.llm.parse_rules_min_confidence
+        rules_tier.record(latency_seconds=time.perf_counter() - _time, accepted=accepted)
+        if not accepted:
+            return None
+        logger.info("Parsed event request with rules")
+        return _object
+
+    @staticmethod
+    def _answer_confidence(
+        response: "ChatCompletion", _object: SmartParseEvent, contacts: list[Contact]
+    ) -> float:
+        """
+        Lowest token probability among the dates and approvers of a model answer,
+        or 0 for an answer that can't be right (unknown approver, end before start)
+        """
+        contact_ids = {contact.id for contact in contacts}
+        if any(approver.user_id not in contact_ids for approver in _object.approvers or []):
+            return 0.0
+        start, end = _object.start_date.date_time, _object.end_date.date_time
+        if start and end and end < start:
+            return 0.0
+
+        logprobs = response.choices[0].logprobs
+        if logprobs is None or not logprobs.content:
+            return 0.0
+        content = "".join(token.token for token in logprobs.content)
+        spans = [match.span(1) for match in _DECISION_VALUES.finditer(content)]
+        lowest, position = 0.0, 0
+        for token in logprobs.content:
+            token_end = position + len(token.token)
+            if any(start < token_end and position < end for start, end in spans):
+                lowest = min(lowest, token.logprob)
+            position = token_end
+        return math.exp(lowest)
+
+    async def _model_parse(
+        self,
+        model: str,
+        request: SmartParseEventRequestRequest,
+        context: str,
+        contacts: list[Contact],
+    ) -> tuple[SmartParseEvent, LLMCosts, float]:
+        """A model's parse of the request, its cost and its confidence"""
+        logger.info(f"Calling {model} to parse event request")
+        _time = time.time()
+        async with llm_gateway.call(model=model, purpose="smart_parse") as call:
+            response = await self.openai_client.beta.chat.completions.parse(
+                model=model,
+                messages=self._smart_parse_messages(request, context),
+                response_format=SmartParseEvent,
+                logprobs=True,
+                prompt_cache_key=SMART_PARSE_PROMPT_CACHE_KEY,
+            )
+            cost = self._calculate_cost(response)
+            call.record(model=response.model, cost=cost)
+        logger.info(f"Parsed event request in {time.time() - _time:.2f} seconds")
+        self._log_usage(cost)
+        _object = self._strip_timezones(response.choices[0].message.parsed)
+        return _object, cost, self._answer_confidence(response, _object, contacts)
+
+    async def _route_smart_parse(
+        self,
+        request: SmartParseEventRequestRequest,
+        context: str,
+        contacts: list[Contact],
+        user_id: str | None,
+    ) -> tuple[SmartParseEvent, float]:
+        """
+        The cheapest confident parse: the rule-based parser, then the small model,
+        and the large model only when neither is confident enough
+
+        Only the model tiers count against the user's LLM limits.
+
+        Returns:
+            The parsed event and what every tier tried cost together
+        """
+        if config.llm.parse_router_enabled:
+            _object = self._rules_tier_parse(request, contacts)
+            if _object is not None:
+                return _object, 0.0
+
+        async with llm_gateway.user_slot(user_id):
+            return await self._route_model_parse(request, context, contacts)
+
+    async def _route_model_parse(
+        self,
+        request: SmartParseEventRequestRequest,
+        context: str,
+        contacts: list[Contact],
+    ) -> tuple[SmartParseEvent, float]:
+        """The small model's parse if it is confident enough, else the large model's"""
+        total_cost = 0.0
+        if config.llm.parse_router_enabled:
+            _time = time.perf_counter()
+            try:
+                _object, cost, confidence = await self._model_parse(
+                    config.llm.parse_small_model, request, context, contacts
+                )
+            except LLMRateLimitError:
+                # the large model is behind the same limits
+                raise
+            except Exception as e:
+                logger.warning(f"Small model parse failed, escalating: {e}")
+                small_model_tier.record(
+                    latency_seconds=time.perf_counter() - _time,
+                    accepted=False,
+                    error=True,
+                )
+            else:
+                accepted = confidence >= config.llm.parse_small_min_confidence
+                self._record(small_model_tier, _time, cost, accepted=accepted)
+                total_cost += cost.total_cost
+                if accepted:
+                    return _object, total_cost
+                logger.info(f"Small model confidence {confidence:.2f}, escalating")
+
+        _time = time.perf_counter()
+        try:
+            _object, cost, _ = await self._model_parse(
+                config.llm.parse_large_model, request, context, contacts
+            )
+        except Exception:
+            large_model_tier.record(
+                latency_seconds=time.perf_counter() - _time, accepted=False, error=True
+            )
+            raise
+        self._record(large_model_tier, _time, cost, accepted=True)
+        return _object, total_cost + cost.total_cost
+
+    async def smart_parse_event_request(
+        self,
+        request: SmartParseEventRequestRequest,
+        *,
+        contacts: list[Contact],
+        user_id: str | None = None,
+    ) -> SmartParseEvent:
+        """
+        Parse a free-text event request, reusing the answer for the same request
+
+        `contacts` are all of the user's relationships, the people who can be
+        approvers (the model context is pruned to the ones the request names);
+        the date comes from `request.current_date`. Answers are cached by the
+        normalized request, the relationships sent and the date bucket, and with
+        `LLM__PARSE_CACHE_SEMANTIC_ENABLED` also matched by embedding similarity.
+        On a miss the request is routed through the cheapest confident tier.
+
+        Raises:
+            LLMRateLimitError: `user_id` (or the process) is over its LLM limits
+        """
+        context = self._smart_parse_context(request, contacts)
+        key, lookup = self._smart_parse_cache_key(request, context)
+        _object = await self._cached_smart_parse(request, contacts, key, lookup)
+        if _object is not None:
+            return _object
+
+        # the rule-based tier has already been tried
+        async with llm_gateway.user_slot(user_id):
+            _object, cost = await self._route_model_parse(request, context, contacts)
+        smart_parse_cache.set(key, _object.model_copy(deep=True), cost=cost, **lookup)
+        return _object
+
+    async def stream_smart_parse_event_request(
+        self,
+        request: SmartParseEventRequestRequest,
+        *,
+        contacts: list[Contact],
+        user_id: str | None = None,
+    ) -> AsyncIterator[SmartParseFieldUpdate | SmartParseEvent]:
+        """
+        Like `smart_parse_event_request`, but return an iterator of each field as
+        soon as the model has finished writing it, then the validated
+        `SmartParseEvent` last
+
+        Structured output writes the fields in schema order, so every field before
+        the one currently being written in the partial JSON is complete. A confident
+        rule-based parse is used as is; otherwise the large model is streamed
+        directly, since escalating from the small one would retract fields already
+        sent. The cache, the rules and the user's LLM limits are checked before
+        this returns, so a refusal comes before any field.
+
+        Raises:
+            LLMRateLimitError: `user_id` (or the process) is over its LLM limits;
+                from the iterator only if the limits fill up in between
+        """
+        context = self._smart_parse_context(request, contacts)
+        key, lookup = self._smart_parse_cache_key(request, context)
+        _object = await self._cached_smart_parse(request, contacts, key, lookup)
+        if _object is not None:
+            return self._stream_fields(_object, emitted=set())
+        llm_gateway.check_user(user_id)
+        return self._stream_model_parse(request, context, key, lookup, user_id)
+
+    @staticmethod
+    async def _stream_fields(
+        _object: SmartParseEvent, *, emitted: set[str]
+    ) -> AsyncIterator[SmartParseFieldUpdate | SmartParseEvent]:
+        """The fields not `emitted` yet, then the object"""
+        for name, value in _object.model_dump(mode="json").items():
+            if name not in emitted:
+                yield SmartParseFieldUpdate(field=name, value=value)
+        yield _object
+
+    async def _stream_model_parse(
+        self,
+        request: SmartParseEventRequestRequest,
+        context: str,
+        key: str,
+        lookup: dict[str, Any],
+        user_id: str | None,
+    ) -> AsyncIterator[SmartParseFieldUpdate | SmartParseEvent]:
+        """
+        Stream the large model's parse
+
+        The model is read into a queue by a separate task, so the gateway slot is
+        released once the model is done rather than when a slow client has read
+        everything.
+        """
+        queue: asyncio.Queue[SmartParseFieldUpdate | SmartParseEvent | None] = (
+            asyncio.Queue()
+        )
+        producer = asyncio.create_task(
+            self._read_model_parse(request, context, key, lookup, user_id, queue)
+        )
+        try:
+            while (item := await queue.get()) is not None:
+                yield item
+            # raises whatever ended the model stream early
+            await producer
+        finally:
+            producer.cancel()
+
+    async def _read_model_parse(
+        self,
+        request: SmartParseEventRequestRequest,
+        context: str,
+        key: str,
+        lookup: dict[str, Any],
+        user_id: str | None,
+        queue: asyncio.Queue[SmartParseFieldUpdate | SmartParseEvent | None],
+    ) -> None:
+        """Put the large model's fields on `queue` as they are parsed, then None"""
+        try:
+            model = config.llm.parse_large_model
+            logger.info(f"Streaming {model} parse of event request")
+            _time = time.time()
+            _started = time.perf_counter()
+            _emitted: set[str] = set()
+            async with llm_gateway.user_slot(user_id), llm_gateway.call(
+                model=model, purpose="smart_parse_stream"
+            ) as call:
+                async with self.openai_client.beta.chat.completions.stream(
+                    model=model,
+                    messages=self._smart_parse_messages(request, context),
+                    response_format=SmartParseEvent,
+                    stream_options={"include_usage": True},
+                    prompt_cache_key=SMART_PARSE_PROMPT_CACHE_KEY,
+                ) as stream:
+                    async for event in stream:
+                        if event.type != "content.delta" or not isinstance(
+                            event.parsed, dict
+                        ):
+                            continue
+                        for name in list(event.parsed)[:-1]:
+                            if name in _emitted or name not in SmartParseEvent.model_fields:
+                                continue
+                            update = self._field_update(name, event.parsed[name])
+                            if update is None:
+                                continue
+                            _emitted.add(name)
+                            if len(_emitted) == 1:
+                                logger.info(
+                                    f"First field parsed in {time.time() - _time:.2f} seconds"
+                                )
+                            queue.put_nowait(update)
+                    response = await stream.get_final_completion()
+                cost = self._calculate_cost(response)
+                call.record(model=response.model, cost=cost)
+            logger.info(f"Parsed event request in {time.time() - _time:.2f} seconds")
+            self._log_usage(cost)
+            self._record(large_model_tier, _started, cost, accepted=True)
+            _object = self._strip_timezones(response.choices[0].message.parsed)
+            smart_parse_cache.set(
+                key, _object.model_copy(deep=True), cost=cost.total_cost, **lookup
+            )
+            # the rest, including the last field, which is never complete mid-stream
+            async for item in self._stream_fields(_object, emitted=_emitted):
+                queue.put_nowait(item)
+        finally:
+            queue.put_nowait(None)
@@ -6,6 +6,8 @@ from api.databridge.notifications_databridge import (
     DBNotificationResponse,
     DBNotificationsListResponse,
 )
+from api.core.notification_hub import notification_hub
+from api.core.pagination import InvalidCursorError, decode_cursor, encode_cursor
 import api.models.v1.notifications as models
 from enum import Enum
 
@@ -53,8 +55,11 @@ class NotificationsService:
             updated_at=db_notification.updated_at,
         )
 
-    async def create_event_request_notification(self, to_user_id: str, payload: EventRequestNotificationPayload) -> models.NotificationCreateResponse:
-        """Create a new event request notification"""
+    @staticmethod
+    def _render_event_request_notification(
+        payload: EventRequestNotificationPayload,
+    ) -> tuple[str, str]:
+        """Build the title and message for an event request notification"""
         _user_name = f"{payload.user.name} ({payload.user.email})" if payload.user.name else payload.user.email
         if payload.update == "created":
             title = f"New Event Request"
@@ -67,15 +72,13 @@ class NotificationsService:
             message = f"{_user_name} has deleted their event request."
         else:
             raise ValueError("Invalid update type")
-        return await self.create_notification(
-            user_id=to_user_id,
-            title=title,
-            message=message,
-            payload=payload.model_dump(),
-        )
-    
-    async def create_relationship_notification(self, to_user_id: str, payload: RelationshipNotificationPayload) -> models.NotificationCreateResponse:
-        """Create a new relationship notification"""
+        return title, message
+
+    @staticmethod
+    def _render_relationship_notification(
+        payload: RelationshipNotificationPayload,
+    ) -> tuple[str, str]:
+        """Build the title and message for a relationship notification"""
         _user_name = f"{payload.user.name} ({payload.user.email})" if payload.user.name else payload.user.email
         if payload.update == "created":
             title = f"New Relationship Request"
@@ -85,6 +88,33 @@ class NotificationsService:
             message = f"{_user_name} has accepted your connection request."
         else:
             raise ValueError("Invalid update type")
+        return title, message
+
+    async def create_event_request_notification(self, to_user_id: str, payload: EventRequestNotificationPayload) -> models.NotificationCreateResponse:
+        """Create a new event request notification"""
+        title, message = self._render_event_request_notification(payload)
+        return await self.create_notification(
+            user_id=to_user_id,
+            title=title,
+            message=message,
+            payload=payload.model_dump(),
+        )
+
+    async def create_event_request_notifications(
+        self, *, to_user_ids: list[str], payload: EventRequestNotificationPayload
+    ) -> models.NotificationsBatchCreateResponse:
+        """Notify several users about the same event request in one insert"""
+        title, message = self._render_event_request_notification(payload)
+        return await self.create_notifications_batch(
+            user_ids=to_user_ids,
+            title=title,
+            message=message,
+            payload=payload.model_dump(),
+        )
+
+    async def create_relationship_notification(self, to_user_id: str, payload: RelationshipNotificationPayload) -> models.NotificationCreateResponse:
+        """Create a new relationship notification"""
+        title, message = self._render_relationship_notification(payload)
         return await self.create_notification(
             user_id=to_user_id,
             title=title,
@@ -121,8 +151,50 @@ class NotificationsService:
             )
 
         notification_data = self._convert_db_to_model(db_notification)
+        # push to the user's open notification streams
+        notification_hub.publish(notification_data)
         return models.NotificationCreateResponse(notification=notification_data)
 
+    async def create_notifications_batch(
+        self,
+        *,
+        user_ids: list[str],
+        title: str,
+        message: str,
+        payload: dict[str, any] | None = None,
+    ) -> models.NotificationsBatchCreateResponse:
+        """Create the same notification for several users in one insert"""
+        # Validate input
+        if not title or not title.strip():
+            raise HTTPException(status_code=400, detail="Title is required")
+        if not message or not message.strip():
+            raise HTTPException(status_code=400, detail="Message is required")
+
+        # one notification per user, in the order given
+        user_ids = list(dict.fromkeys(user_ids))
+        if not user_ids:
+            return models.NotificationsBatchCreateResponse(notifications=[], count=0)
+
+        db_notifications = await self.databridge.create_notifications_batch(
+            user_ids=user_ids,
+            title=title.strip(),
+            message=message.strip(),
+            payload=payload or {},
+        )
+
+        if not db_notifications:
+            raise HTTPException(
+                status_code=500, detail="Failed to create notifications"
+            )
+
+        notifications = [self._convert_db_to_model(n) for n in db_notifications]
+        # push to each user's open notification streams
+        for notification in notifications:
+            notification_hub.publish(notification)
+        return models.NotificationsBatchCreateResponse(
+            notifications=notifications, count=len(notifications)
+        )
+
     async def get_notification(
         self, *, notification_id: str, user_id: str
     ) -> models.NotificationResponse:
@@ -152,8 +224,16 @@ class NotificationsService:
         is_deleted: bool | None = None,
         skip: int = 0,
         take: int = 50,
+        cursor: str | None = None,
+        include_total: bool | None = None,
     ) -> models.NotificationsListResponse:
-        """Get notifications for a user with optional filters and pagination"""
+        """
+        Get notifications for a user with optional filters and pagination
+
+        Pass the previous page's `next_cursor` as `cursor` to page without an
+        offset. The total count is only computed on the first page unless
+        `include_total` says otherwise.
+        """
         # Validate pagination parameters
         if skip < 0:
             raise HTTPException(status_code=400, detail="Skip must be non-negative")
@@ -161,6 +241,12 @@ class NotificationsService:
             raise HTTPException(
                 status_code=400, detail="Take must be between 1 and 100"
             )
+        try:
+            position = decode_cursor(cursor) if cursor else None
+        except InvalidCursorError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        if include_total is None:
+            include_total = cursor is None
 
         db_result = await self.databridge.get_user_notifications(
             user_id=user_id,
@@ -168,6 +254,8 @@ class NotificationsService:
             is_deleted=is_deleted,
             skip=skip,
             take=take,
+            cursor=position,
+            include_total=include_total,
         )
 
         notifications = [
@@ -180,6 +268,11 @@ class NotificationsService:
         if is_deleted is not None:
             filters["is_deleted"] = is_deleted
 
+        next_cursor = None
+        if db_result.has_more:
+            last = notifications[-1]
+            next_cursor = encode_cursor(created_at=last.created_at, id=last.id)
+
         return models.NotificationsListResponse(
             notifications=notifications,
             count=len(notifications),
@@ -187,6 +280,7 @@ class NotificationsService:
             skip=skip,
             take=take,
             filters=filters if filters else None,
+            next_cursor=next_cursor,
         )
 
     async def update_notification(
@@ -265,3 +359,14 @@ class NotificationsService:
         """Mark all notifications as read for a user"""
         updated_count = await self.databridge.mark_all_as_read(user_id=user_id)
         return models.MarkAllAsReadResponse(updated_count=updated_count)
+
+    async def get_unread_count(self, *, user_id: str) -> models.UnreadCountResponse:
+        """Get the number of unread notifications for a user"""
+        unread_count = await self.databridge.get_unread_count(user_id=user_id)
+
+        if unread_count is None:
+            raise HTTPException(
+                status_code=500, detail="Failed to get unread notification count"
+            )
+
+        return models.UnreadCountResponse(unread_count=unread_count)
@@ -1,4 +1,5 @@
 from fastapi import HTTPException
+from ..core.pagination import InvalidCursorError, decode_cursor, encode_cursor
 from ..databridge.relationships_databridge import (
     RelationshipsDatabridge,
     DBRelationshipResponse,
@@ -131,24 +132,70 @@ class RelationshipsService:
         )
 
     async def get_user_relationships_with_users(
-        self, *, user_id: str, skip: int = 0, take: int = 10
+        self,
+        *,
+        user_id: str,
+        skip: int = 0,
+        take: int = 10,
+        cursor: str | None = None,
+        include_total: bool | None = None,
     ) -> RelationshipsWithUsersListResponse:
-        """Get relationships for a user with other user data and pagination"""
+        """
+        Get relationships for a user with other user data and pagination
+
+        Pass the previous page's `next_cursor` as `cursor` to page without an
+        offset. The total count is only computed on the first page unless
+        `include_total` says otherwise.
+        """
+        try:
+            position = decode_cursor(cursor) if cursor else None
+        except InvalidCursorError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        if include_total is None:
+            include_total = cursor is None
+
+        # one extra row tells us whether there is another page
         db_result = await self.databridge.get_user_relationships_with_users(
-            user_id=user_id, skip=skip, take=take
+            user_id=user_id,
+            skip=skip,
+            take=take + 1,
+            cursor=position,
+            include_total=include_total,
         )
 
         relationships = [
-            self._convert_db_with_user_to_model(rel) for rel in db_result.relationships
+            self._convert_db_with_user_to_model(rel)
+            for rel in db_result.relationships[:take]
         ]
 
+        next_cursor = None
+        if len(db_result.relationships) > take:
+            last = db_result.relationships[take - 1]
+            next_cursor = encode_cursor(created_at=last.created_at, id=last.id)
+
         return RelationshipsWithUsersListResponse(
             relationships=relationships,
             total_count=db_result.total_count,
             skip=skip,
             take=take,
+            next_cursor=next_cursor,
         )
 
+    async def get_all_user_relationships_with_users(
+        self, *, user_id: str, page_size: int = 200
+    ) -> list[RelationshipWithUserData]:
+        """Every relationship for a user with other user data, newest first"""
+        relationships: list[RelationshipWithUserData] = []
+        cursor = None
+        while True:
+            page = await self.get_user_relationships_with_users(
+                user_id=user_id, take=page_size, cursor=cursor, include_total=False
+            )
+            relationships.extend(page.relationships)
+            if page.next_cursor is None:
+                return relationships
+            cursor = page.next_cursor
+
     async def update_relationship(
         self, *, relationship_id: str, user_id: str
     ) -> RelationshipUpdateResponse:
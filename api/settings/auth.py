@@ -4,6 +4,7 @@ from typing import Optional, Dict, Any
 from fastapi import HTTPException, status, Depends, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from .database import get_supabase_admin_client
+from .jwt_verifier import JWTKeysUnavailable, jwt_verifier
 from .config import config
 
 import logging
@@ -34,18 +35,32 @@ async def verify_jwt(
     credentials: HTTPAuthorizationCredentials = Depends(HTTPBearer()),
 ) -> Dict[str, Any]:
     """
-    Verify JWT token using Supabase and cache user data in request state
+    Verify JWT token locally (signature, expiry, audience, issuer) against the
+    project's JWT secret/JWKS, falling back to Supabase Auth when no key
+    material is available
     """
+    token = credentials.credentials
     try:
-        token = credentials.credentials
-        cache_key = f"user_data_{token[:20]}"
-        if hasattr(request.state, cache_key):
-            return getattr(request.state, cache_key)
+        claims = await jwt_verifier.verify(token)
+        return {
+            "user_id": claims["sub"],
+            "email": claims.get("email"),
+            "claims": claims,
+        }
+    except jwt.InvalidTokenError as e:
+        logger.info(f"Rejected JWT: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid authentication token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    except JWTKeysUnavailable as e:
+        logger.warning(f"Verifying JWT with Supabase Auth: {e}")
 
+    try:
         # Use Supabase admin client to verify the token
-        supabase = get_supabase_admin_client()
-        # Verify the JWT token
-        response = supabase.auth.get_user(token)
+        supabase = await get_supabase_admin_client()
+        response = await supabase.auth.get_user(token)
         if not response.user:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -53,17 +68,12 @@ async def verify_jwt(
                 headers={"WWW-Authenticate": "Bearer"},
             )
 
-        user_data = {
+        return {
             "user_id": response.user.id,
             "email": response.user.email,
             "user": response.user,
         }
 
-        # Cache the user data in request state
-        setattr(request.state, cache_key, user_data)
-
-        return user_data
-
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -88,6 +98,23 @@ async def get_current_user_id(auth_data: Dict[str, Any] = Depends(verify_jwt)) -
     return auth_data["user_id"]
 
 
+async def require_admin(user_id: str = Depends(get_current_user_id)) -> str:
+    """
+    Get current authenticated user ID, if it is one of `DIAGNOSTICS__ADMIN_USER_IDS`
+    """
+    admins = {
+        admin.strip()
+        for admin in config.diagnostics.admin_user_ids.split(",")
+        if admin.strip()
+    }
+    if user_id not in admins:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You don't have permission to view diagnostics",
+        )
+    return user_id
+
+
 # Optional auth dependency (for endpoints that can work with or without auth)
 async def get_optional_user(
     request: Request,
@@ -1,10 +1,44 @@
 # configure environment variables to be parsed into an AppConfig
+import os
+from typing import Any, ClassVar
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 from .secrets import secrets_manager
 
 
-class GoogleConfig(BaseSettings):
+class SecretSettings(BaseSettings):
+    """
+    Settings with fields read from the secret bundle on first access
+
+    Resolving them lazily keeps the secrets provider (and, in prod, the
+    Secrets Manager call) out of the import. The environment value is the
+    default when the bundle doesn't have the secret.
+    """
+
+    # field name -> secret name in the bundle
+    secret_names: ClassVar[dict[str, str]] = {}
+    _secrets_loaded: bool = PrivateAttr(default=False)
+
+    def __getattribute__(self, name: str) -> Any:
+        if name in type(self).secret_names:
+            private = object.__getattribute__(self, "__pydantic_private__")
+            if private is not None and not private["_secrets_loaded"]:
+                self.load_secrets()
+        return super().__getattribute__(name)
+
+    def load_secrets(self) -> None:
+        """Read (or, after a refresh, re-read) the secret fields from the bundle"""
+        # marked first, so reading the current values below doesn't recurse
+        self._secrets_loaded = True
+        for field, secret in self.secret_names.items():
+            setattr(
+                self,
+                field,
+                secrets_manager.get_secret(name=secret, default=getattr(self, field)),
+            )
+
+
+class GoogleConfig(SecretSettings):
     model_config = SettingsConfigDict(extra="allow")
 
     client_id: str = Field(default="")
@@ -12,78 +46,192 @@ class GoogleConfig(BaseSettings):
     scopes: str = (
         "email profile openid https://www.googleapis.com/auth/gmail.modify https://www.googleapis.com/auth/calendar"
     )
-
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        # Use secrets manager for sensitive Google credentials
-        self.client_secret = secrets_manager.get_secret(
-            name="GOOGLE__CLIENT_SECRET", default=self.client_secret
-        )
-
-
-class OpenAIConfig(BaseSettings):
+    # max concurrent Google API requests per process (size of the transport pool)
+    transport_max_concurrency: int = Field(default=10)
+    # reads within this many seconds of the last calendar sync skip Google entirely
+    sync_min_interval_seconds: int = Field(default=30)
+    # how far back the initial full calendar sync reaches
+    sync_lookback_days: int = Field(default=30)
+    # how long freebusy.query results are reused for the same calendar and window
+    freebusy_cache_ttl_seconds: int = Field(default=60)
+    # access tokens are refreshed this long before they expire
+    token_refresh_margin_seconds: int = Field(default=300)
+    # in-process cache of user_tokens rows, so Google-backed requests skip the database
+    token_cache_max_entries: int = Field(default=1024)
+    token_cache_ttl_seconds: int = Field(default=60)
+
+    # Use secrets manager for sensitive Google credentials
+    secret_names: ClassVar[dict[str, str]] = {"client_secret": "GOOGLE__CLIENT_SECRET"}
+
+
+class OpenAIConfig(SecretSettings):
     model_config = SettingsConfigDict(extra="allow")
 
     api_key: str = Field(default="")
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        # Use secrets manager for OpenAI API key
-        self.api_key = secrets_manager.get_secret(
-            name="OPENAI__API_KEY", default=self.api_key
-        )
+    # Use secrets manager for OpenAI API key
+    secret_names: ClassVar[dict[str, str]] = {"api_key": "OPENAI__API_KEY"}
 
 
-class SupabaseConfig(BaseSettings):
+class SupabaseConfig(SecretSettings):
     model_config = SettingsConfigDict(extra="allow")
 
     url: str = Field(default="")
     anon_key: str = Field(default="")
     service_role_key: str = Field(default="")
+    # legacy HS256 signing secret; asymmetric keys are read from the project's JWKS
+    jwt_secret: str = Field(default="")
+    jwt_audience: str = Field(default="authenticated")
+    # how long the JWKS is trusted before it is fetched again
+    jwks_cache_ttl_seconds: int = Field(default=600)
+    # an unknown key ID triggers a refetch at most this often (key rotation)
+    jwks_min_refresh_seconds: int = Field(default=30)
+    # decoded claims are reused for this long per token (0 disables)
+    jwt_claims_cache_ttl_seconds: int = Field(default=30)
+    jwt_claims_cache_max_entries: int = Field(default=4096)
+
+    # Use secrets manager for sensitive Supabase keys
+    secret_names: ClassVar[dict[str, str]] = {
+        "anon_key": "SUPABASE__ANON_KEY",
+        "service_role_key": "SUPABASE__SERVICE_ROLE_KEY",
+        "jwt_secret": "SUPABASE__JWT_SECRET",
+    }
+
+
+class DatabaseConfig(SecretSettings):
+    model_config = SettingsConfigDict(extra="allow")
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        # Use secrets manager for sensitive Supabase keys
-        self.anon_key = secrets_manager.get_secret(
-            name="SUPABASE__ANON_KEY", default=self.anon_key
-        )
-        self.service_role_key = secrets_manager.get_secret(
-            name="SUPABASE__SERVICE_ROLE_KEY", default=self.service_role_key
-        )
+    username: str = Field(default="")
+    password: str = Field(default="")
 
+    # Use secrets manager for database credentials
+    secret_names: ClassVar[dict[str, str]] = {
+        "username": "DATABASE__USERNAME",
+        "password": "DATABASE__PASSWORD",
+    }
 
-class DatabaseConfig(BaseSettings):
+
+class NotificationsConfig(BaseSettings):
     model_config = SettingsConfigDict(extra="allow")
 
-    username: str = Field(default="")
-    password: str = Field(default="")
+    # the stream needs a long-lived process that sees every notification; off by
+    # default on Lambda, which buffers responses and runs a hub per container
+    stream_enabled: bool = Field(
+        default_factory=lambda: "AWS_LAMBDA_FUNCTION_NAME" not in os.environ
+    )
+
+    # a comment line is sent on idle notification streams this often to keep proxies from closing them
+    stream_heartbeat_seconds: int = Field(default=15)
+    # notifications buffered per stream; a client that falls this far behind is disconnected
+    stream_queue_size: int = Field(default=100)
+
+
+class EmailConfig(BaseSettings):
+    model_config = SettingsConfigDict(extra="allow")
+
+    # "ses" sends through AWS SES; "stub" records messages in process (local/tests)
+    backend: str = Field(default="ses")
+    region: str = Field(default="us-east-2")
+    source_email: str = Field(default="amia@amiavailable.com")
+    source_name: str = Field(default="AM/A")
+    # SES template holding the shared HTML layout, created on first send
+    template_name: str = Field(default="amia-default")
+    # max concurrent SendBulkTemplatedEmail calls
+    max_concurrency: int = Field(default=4)
+    # queued emails per SendBulkTemplatedEmail call (SES allows up to 50)
+    batch_size: int = Field(default=50)
+    # how long the dispatcher waits to fill a batch
+    batch_window_ms: int = Field(default=50)
+    # throttled sends are retried this many times with exponential backoff
+    max_retries: int = Field(default=5)
+    retry_base_delay_seconds: float = Field(default=0.5)
+    # how long a queued email's status can be looked up
+    status_ttl_seconds: int = Field(default=3600)
+    # wait for the send before responding; on by default on Lambda, which freezes
+    # the container (and the background dispatcher) once the response is returned
+    send_before_response: bool = Field(
+        default_factory=lambda: "AWS_LAMBDA_FUNCTION_NAME" in os.environ
+    )
+
+
+class LLMConfig(BaseSettings):
+    model_config = SettingsConfigDict(extra="allow")
+
+    # auto-fill responses are reused for the same normalized request, relationships and day
+    parse_cache_ttl_seconds: int = Field(default=3600)
+    parse_cache_max_entries: int = Field(default=1024)
+    # second cache tier for near-identical phrasings (one embedding call per lookup)
+    parse_cache_semantic_enabled: bool = Field(default=False)
+    parse_cache_embedding_model: str = Field(default="text-embedding-3-small")
+    parse_cache_similarity_threshold: float = Field(default=0.95)
+    # auto-fill tries the rule-based parser, then the small model, then the large one
+    parse_router_enabled: bool = Field(default=True)
+    parse_small_model: str = Field(default="gpt-4o-mini-2024-07-18")
+    parse_large_model: str = Field(default="gpt-4o-2024-08-06")
+    # a tier's answer below this confidence escalates to the next tier
+    parse_rules_min_confidence: float = Field(default=0.8)
+    parse_small_min_confidence: float = Field(default=0.6)
+    # longer relationship lists are pruned to the people named in the request
+    parse_context_max_relationships: int = Field(default=25)
+    # limits on model calls, per process (each Lambda container has its own);
+    # calls over them wait up to the queue timeout
+    gateway_max_concurrency: int = Field(default=16)
+    gateway_calls_per_minute: int = Field(default=300)
+    gateway_burst: int = Field(default=30)
+    gateway_queue_timeout_seconds: float = Field(default=10)
+    # per-user limits on AI requests, also per process; requests over them get a 429
+    user_max_concurrency: int = Field(default=2)
+    user_calls_per_minute: int = Field(default=20)
+    user_burst: int = Field(default=5)
+
+
+class DiagnosticsConfig(BaseSettings):
+    model_config = SettingsConfigDict(extra="allow")
+
+    # comma-separated user IDs allowed to read the internal diagnostics endpoints
+    admin_user_ids: str = Field(default="")
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        # Use secrets manager for database credentials
-        self.username = secrets_manager.get_secret(
-            name="DATABASE__USERNAME", default=self.username
-        )
-        self.password = secrets_manager.get_secret(
-            name="DATABASE__PASSWORD", default=self.password
-        )
 
 class GroqConfig(BaseSettings):
     api_key: str = Field(default="")
 
 
+class AgentConfig(BaseSettings):
+    model_config = SettingsConfigDict(extra="allow")
+
+    # chat sessions keep their agent between turns until idle this long
+    session_idle_seconds: int = Field(default=1800)
+    max_sessions: int = Field(default=256)
+    # most recent messages the agent sends the model each turn
+    context_messages: int = Field(default=20)
+
+
 class AppConfig(BaseSettings):
     model_config = SettingsConfigDict(env_nested_delimiter="__", extra="allow")
 
     # API Keys
     openai: OpenAIConfig = Field(default_factory=OpenAIConfig)
     groq: GroqConfig = Field(default_factory=GroqConfig)
+    llm: LLMConfig = Field(default_factory=LLMConfig)
+    agent: AgentConfig = Field(default_factory=AgentConfig)
+    diagnostics: DiagnosticsConfig = Field(default_factory=DiagnosticsConfig)
 
     # Auth Configuration
     supabase: SupabaseConfig = Field(default_factory=SupabaseConfig)
     google: GoogleConfig = Field(default_factory=GoogleConfig)
     database: DatabaseConfig = Field(default_factory=DatabaseConfig)
+    notifications: NotificationsConfig = Field(default_factory=NotificationsConfig)
+    email: EmailConfig = Field(default_factory=EmailConfig)
     environment: str = Field(default="local")  # local, prod
 
 
 config = AppConfig()
+
+
+def _reload_secrets() -> None:
+    """Re-read secret-backed settings after the secret bundle is refreshed"""
+    for section in (config.google, config.openai, config.supabase, config.database):
+        section.load_secrets()
+
+
+secrets_manager.add_refresh_listener(_reload_secrets)
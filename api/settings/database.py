@@ -1,17 +1,73 @@
-from supabase import create_client, Client
+import asyncio
+from supabase import AsyncClient, create_async_client
 from .config import config
-from sqlalchemy import create_engine, text
+from .secrets import secrets_manager
 
-# Default client instance
-supabase: Client = create_client(config.supabase.url, config.supabase.anon_key)
-supabase_admin: Client = create_client(
-    config.supabase.url, config.supabase.service_role_key
-)
+# Clients are created once per process on first use (or at startup, see
+# `init_supabase_clients`) and shared by every request, so their HTTP
+# connection pools are reused instead of blocking the event loop per query.
+_supabase: AsyncClient | None = None
+_supabase_admin: AsyncClient | None = None
+_clients_lock = asyncio.Lock()
+_closing: set[asyncio.Task] = set()
 
 
-def get_supabase_client() -> Client:
-    return supabase
+async def init_supabase_clients() -> None:
+    """Create the shared Supabase clients if they don't exist yet"""
+    global _supabase, _supabase_admin
+    async with _clients_lock:
+        if _supabase is None:
+            _supabase = await create_async_client(
+                config.supabase.url, config.supabase.anon_key
+            )
+        if _supabase_admin is None:
+            _supabase_admin = await create_async_client(
+                config.supabase.url, config.supabase.service_role_key
+            )
 
 
-def get_supabase_admin_client() -> Client:
-    return supabase_admin
+async def close_supabase_clients() -> None:
+    """Close the shared clients' connection pools"""
+    global _supabase, _supabase_admin
+    async with _clients_lock:
+        for client in (_supabase, _supabase_admin):
+            if client is not None:
+                await client.postgrest.aclose()
+        _supabase = None
+        _supabase_admin = None
+
+
+async def get_supabase_client() -> AsyncClient:
+    if _supabase is None:
+        await init_supabase_clients()
+    return _supabase
+
+
+async def get_supabase_admin_client() -> AsyncClient:
+    if _supabase_admin is None:
+        await init_supabase_clients()
+    return _supabase_admin
+
+
+def _reset_supabase_clients() -> None:
+    """
+    Drop the shared clients after the secrets are refreshed, so the next
+    request creates them with the rotated keys, and close the old ones
+    """
+    global _supabase, _supabase_admin
+    stale = [client for client in (_supabase, _supabase_admin) if client is not None]
+    _supabase = None
+    _supabase_admin = None
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        # no loop to close them on; their pools go with them
+        return
+    for client in stale:
+        task = loop.create_task(client.postgrest.aclose())
+        _closing.add(task)
+        task.add_done_callback(_closing.discard)
+
+
+# registered after config's listener, so the keys are reloaded first
+secrets_manager.add_refresh_listener(_reset_supabase_clients)
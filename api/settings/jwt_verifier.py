@@ -0,0 +1,165 @@
+"""
+Local verification of Supabase access tokens
+
+Tokens are checked in process (signature, expiry, audience and issuer) instead
+of asking Supabase Auth on every request:
+
+- HS256 tokens are verified with the project's JWT secret (`SUPABASE__JWT_SECRET`)
+- asymmetric tokens (ES256/RS256) are verified against the project's JWKS, which
+  is cached for `jwks_cache_ttl_seconds` and refetched early when a token is
+  signed with an unknown key ID, so rotated keys are picked up
+- decoded claims are cached per token for `jwt_claims_cache_ttl_seconds`
+  (never beyond the token's expiry)
+"""
+
+import asyncio
+import hashlib
+import logging
+import time
+from typing import Any
+import httpx
+import jwt
+from ..core.cache import TTLCache
+from .config import config
+
+logger = logging.getLogger(__name__)
+
+ASYMMETRIC_ALGORITHMS = ("ES256", "RS256")
+
+
+class JWTKeysUnavailable(Exception):
+    """No key material is available to verify a token locally"""
+
+
+class SupabaseJWTVerifier:
+    """Verifies Supabase access tokens against a cached secret/JWKS"""
+
+    def __init__(self):
+        self._jwks: dict[str, jwt.PyJWK] = {}
+        self._jwks_fetched_at: float | None = None
+        # last fetch, successful or not, so failures are rate limited too
+        self._jwks_attempted_at: float | None = None
+        self._jwks_lock = asyncio.Lock()
+        self._claims_cache: TTLCache[dict[str, Any]] = TTLCache(
+            name="jwt_claims",
+            max_entries=config.supabase.jwt_claims_cache_max_entries,
+            ttl_seconds=config.supabase.jwt_claims_cache_ttl_seconds,
+        )
+
+    @property
+    def issuer(self) -> str:
+        return f"{config.supabase.url}/auth/v1"
+
+    @property
+    def jwks_url(self) -> str:
+        return f"{self.issuer}/.well-known/jwks.json"
+
+    async def _fetch_jwks(self) -> None:
+        """
+        Replace the cached key set with the project's current JWKS
+
+        Raises:
+            JWTKeysUnavailable: If none of the keys can be used (e.g. the
+                `cryptography` backend for ES256/RS256 is missing)
+        """
+        async with httpx.AsyncClient(timeout=5) as client:
+            response = await client.get(self.jwks_url)
+            response.raise_for_status()
+        keys = {}
+        for jwk in response.json().get("keys", []):
+            try:
+                keys[jwk.get("kid")] = jwt.PyJWK(jwk)
+            except jwt.PyJWKError as e:
+                logger.warning(f"Skipping unusable JWK {jwk.get('kid')}: {e}")
+        if not keys:
+            raise JWTKeysUnavailable("The JWKS has no usable signing keys")
+        self._jwks = keys
+        self._jwks_fetched_at = time.monotonic()
+        logger.info(f"Fetched {len(keys)} JWT signing keys")
+
+    def _may_fetch_jwks(self) -> bool:
+        """Whether jwks_min_refresh_seconds have passed since the last attempt"""
+        return self._jwks_attempted_at is None or (
+            time.monotonic() - self._jwks_attempted_at
+            > config.supabase.jwks_min_refresh_seconds
+        )
+
+    async def _get_signing_key(self, kid: str | None) -> jwt.PyJWK:
+        """
+        Get the JWKS key for a key ID, refetching the set when it is stale or
+        the key is unknown (rate limited to one attempt per jwks_min_refresh_seconds,
+        so during an outage requests fail fast instead of each retrying the fetch)
+
+        Raises:
+            JWTKeysUnavailable: If the JWKS can't be fetched or has no usable keys
+            jwt.InvalidTokenError: If no key matches the key ID
+        """
+        age = (
+            time.monotonic() - self._jwks_fetched_at
+            if self._jwks_fetched_at is not None
+            else None
+        )
+        expired = age is None or age > config.supabase.jwks_cache_ttl_seconds
+        if (expired or kid not in self._jwks) and self._may_fetch_jwks():
+            async with self._jwks_lock:
+                # another request may have tried while we waited
+                if self._may_fetch_jwks():
+                    self._jwks_attempted_at = time.monotonic()
+                    try:
+                        await self._fetch_jwks()
+                    except Exception as e:
+                        if not self._jwks:
+                            raise JWTKeysUnavailable(f"Failed to fetch JWKS: {e}")
+                        logger.warning(
+                            f"Failed to refresh JWKS, using cached keys: {e}"
+                        )
+
+        if not self._jwks:
+            raise JWTKeysUnavailable("No JWT signing keys available")
+        key = self._jwks.get(kid)
+        if key is None:
+            raise jwt.InvalidTokenError(f"Unknown signing key {kid}")
+        return key
+
+    async def verify(self, token: str) -> dict[str, Any]:
+        """
+        Verify a Supabase access token and return its claims
+
+        Raises:
+            jwt.InvalidTokenError: If the token is invalid or expired
+            JWTKeysUnavailable: If there is no key material to verify it with
+        """
+        cache_key = hashlib.sha256(token.encode()).hexdigest()
+        claims = self._claims_cache.get(cache_key)
+        if claims is not None:
+            return claims
+
+        header = jwt.get_unverified_header(token)
+        algorithm = header.get("alg")
+        if algorithm == "HS256":
+            if not config.supabase.jwt_secret:
+                raise JWTKeysUnavailable("SUPABASE__JWT_SECRET is not configured")
+            key: Any = config.supabase.jwt_secret
+        elif algorithm in ASYMMETRIC_ALGORITHMS:
+            key = await self._get_signing_key(header.get("kid"))
+        else:
+            raise jwt.InvalidAlgorithmError(f"Unsupported algorithm {algorithm}")
+
+        claims = jwt.decode(
+            token,
+            key,
+            algorithms=[algorithm],
+            audience=config.supabase.jwt_audience,
+            issuer=self.issuer,
+            options={"require": ["exp", "sub"]},
+        )
+
+        ttl = min(
+            config.supabase.jwt_claims_cache_ttl_seconds, claims["exp"] - time.time()
+        )
+        if ttl > 0:
+            self._claims_cache.set(cache_key, claims, ttl_seconds=ttl)
+        return claims
+
+
+jwt_verifier = SupabaseJWTVerifier()
@@ -1,58 +1,219 @@
 """
 Secrets management module that handles environment-based secret retrieval.
 For production (ENVIRONMENT=prod), secrets are pulled from AWS Secrets Manager.
-For other environments, secrets are pulled from environment variables.
+For other environments, secrets are pulled from environment variables, layered
+over an optional JSON file (SECRETS_FILE) so tests can supply a fixed bundle.
+
+The secret bundle is fetched once per process, on the first `get_secret`. With
+SECRETS_CACHE_KEY set (a Fernet key), the prod bundle is also cached encrypted
+in /tmp for SECRETS_CACHE_TTL_SECONDS, so a re-initialized Lambda environment
+reuses it instead of calling Secrets Manager. `refresh()` re-fetches the bundle
+(e.g. after rotation) and notifies listeners registered with
+`add_refresh_listener`.
+
+After rotating a secret, call `POST /diagnostics/secrets/refresh` as an admin
+(see DIAGNOSTICS__ADMIN_USER_IDS). It only refreshes the process that handles
+it; on Lambda other warm containers keep the old bundle until they are
+recycled, so keep the previous secret valid until then (or publish a new
+function version to replace them).
 """
 
 import os
 import json
-import boto3
+import asyncio
 import logging
+import threading
+from abc import ABC, abstractmethod
+from typing import Callable
 
 logger = logging.getLogger(__name__)
 
-client = boto3.client("secretsmanager")
+
+class SecretsProvider(ABC):
+    """Source of the full secret bundle"""
+
+    name = "secrets"
+
+    @abstractmethod
+    def fetch(self) -> dict[str, str]:
+        """The whole bundle, by secret name"""
+
+
+class AWSSecretsProvider(SecretsProvider):
+    """Reads one JSON secret from AWS Secrets Manager"""
+
+    name = "aws"
+
+    def __init__(self, *, secret_id: str | None):
+        self.secret_id = secret_id
+
+    def fetch(self) -> dict[str, str]:
+        # boto3 is only needed (and imported) when secrets come from AWS
+        import boto3
+
+        client = boto3.client("secretsmanager")
+        response = client.get_secret_value(SecretId=self.secret_id)
+        return json.loads(response["SecretString"])
+
+
+class LocalSecretsProvider(SecretsProvider):
+    """Environment variables, over an optional JSON file of secrets"""
+
+    name = "local"
+
+    def __init__(self, *, path: str | None = None):
+        self.path = path
+
+    def fetch(self) -> dict[str, str]:
+        secrets: dict[str, str] = {}
+        if self.path:
+            with open(self.path) as f:
+                secrets.update(json.load(f))
+        secrets.update(os.environ)
+        return secrets
+
+
+class EncryptedFileCache:
+    """Secret bundle stored as a Fernet token in a file, valid for `ttl_seconds`"""
+
+    def __init__(self, *, path: str, key: str, ttl_seconds: int):
+        from cryptography.fernet import Fernet
+
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self._fernet = Fernet(key.encode())
+
+    def load(self) -> dict[str, str] | None:
+        """Get the cached bundle, or None if missing, expired or unreadable"""
+        from cryptography.fernet import InvalidToken
+
+        try:
+            with open(self.path, "rb") as f:
+                token = f.read()
+            return json.loads(self._fernet.decrypt(token, ttl=self.ttl_seconds))
+        except FileNotFoundError:
+            return None
+        except (InvalidToken, ValueError) as e:
+            logger.info(f"Ignoring expired or invalid secrets cache: {e}")
+            return None
+
+    def save(self, secrets: dict[str, str]) -> None:
+        """Write the bundle atomically, readable only by this user"""
+        token = self._fernet.encrypt(json.dumps(secrets).encode())
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(token)
+        os.replace(tmp_path, self.path)
+
+    def clear(self) -> None:
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
 
 
 class SecretsManager:
     """Handles secret retrieval based on environment."""
 
-    def __init__(self):
-        self.secrets_name: str | None = os.getenv("SECRETS_MANAGER_SECRET_NAME")
-        self.environment: str = os.getenv("ENVIRONMENT", "local")
-        self._secrets_client = client
-        self._secrets_dict = self._get_secrets_dict()
-
-    def _get_secrets_dict(self) -> dict[str, str] | None:
-        if self.environment == "prod":
-            response = self._secrets_client.get_secret_value(SecretId=self.secrets_name)
-            return json.loads(response["SecretString"])
-        else:
-            return None
+    def __init__(
+        self,
+        *,
+        provider: SecretsProvider,
+        cache: EncryptedFileCache | None = None,
+    ):
+        self.provider = provider
+        self.cache = cache
+        self._secrets_dict: dict[str, str] | None = None
+        self._lock = threading.Lock()
+        self._refresh_listeners: list[Callable[[], None]] = []
+
+    @classmethod
+    def from_env(cls) -> "SecretsManager":
+        """Build the manager for the current ENVIRONMENT"""
+        if os.getenv("ENVIRONMENT", "local") != "prod":
+            return cls(provider=LocalSecretsProvider(path=os.getenv("SECRETS_FILE")))
+
+        cache = None
+        cache_key = os.getenv("SECRETS_CACHE_KEY")
+        if cache_key:
+            try:
+                cache = EncryptedFileCache(
+                    path=os.getenv("SECRETS_CACHE_PATH", "/tmp/amia-secrets.cache"),
+                    key=cache_key,
+                    ttl_seconds=int(os.getenv("SECRETS_CACHE_TTL_SECONDS", "900")),
+                )
+            except Exception as e:
+                logger.warning(f"Secrets cache disabled: {e}")
+        return cls(
+            provider=AWSSecretsProvider(
+                secret_id=os.getenv("SECRETS_MANAGER_SECRET_NAME")
+            ),
+            cache=cache,
+        )
+
+    def _load(self, *, use_cache: bool) -> dict[str, str]:
+        if use_cache and self.cache is not None:
+            secrets = self.cache.load()
+            if secrets is not None:
+                logger.info(f"Loaded {len(secrets)} secrets from the local cache")
+                return secrets
+
+        secrets = self.provider.fetch()
+        logger.info(f"Fetched secrets from the {self.provider.name} provider")
+        if self.cache is not None:
+            try:
+                self.cache.save(secrets)
+            except OSError as e:
+                logger.warning(f"Failed to write secrets cache: {e}")
+        return secrets
+
+    def _get_secrets_dict(self) -> dict[str, str]:
+        """Fetch the bundle once per process"""
+        if self._secrets_dict is None:
+            with self._lock:
+                if self._secrets_dict is None:
+                    self._secrets_dict = self._load(use_cache=True)
+        return self._secrets_dict
 
     def get_secret(self, *, name: str, default: str | type(...) = ...) -> str:
         """
-        Get a secret value based on environment.
+        Get a secret value from the bundle.
 
         Args:
-            name: Name of the secret in AWS Secrets Manager (for prod)
-            env_var_name: Name of the environment variable (for dev)
+            name: Name of the secret in the bundle (AWS secret key or env var)
             default: Default value if secret is not found
 
         Returns:
             Secret value as string
         """
-        print(
-            f"Getting secret '{name}' from SECRETS_MANAGER_SECRET_NAME: '{self.secrets_name}' with environment '{self.environment}'"
-        )
-        if self.environment == "prod":
-            return (
-                self._secrets_dict.get(name, default)
-                if default is not ...
-                else self._secrets_dict[name]
-            )
-        else:
-            return os.getenv(name, default)
+        secrets = self._get_secrets_dict()
+        return secrets.get(name, default) if default is not ... else secrets[name]
+
+    def add_refresh_listener(self, listener: Callable[[], None]) -> None:
+        """Call `listener` after every `refresh`, e.g. to rebuild clients"""
+        self._refresh_listeners.append(listener)
+
+    def refresh(self) -> None:
+        """Re-fetch the bundle from the provider (bypassing the cache) after rotation"""
+        self._reload()
+        self._notify_refresh_listeners()
+
+    async def refresh_async(self) -> None:
+        """`refresh` with the fetch in a thread; listeners still run on the event loop"""
+        await asyncio.to_thread(self._reload)
+        self._notify_refresh_listeners()
+
+    def _reload(self) -> None:
+        with self._lock:
+            self._secrets_dict = self._load(use_cache=False)
+
+    def _notify_refresh_listeners(self) -> None:
+        for listener in self._refresh_listeners:
+            try:
+                listener()
+            except Exception as e:
+                logger.error(f"Secrets refresh listener failed: {e}")
 
 
-secrets_manager = SecretsManager()
+secrets_manager = SecretsManager.from_env()
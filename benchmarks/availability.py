@@ -0,0 +1,138 @@
+"""
+Benchmark availability queries against large synthetic calendars
+
+Builds `BusyIntervals` for several users with 10k events each and times
+`is_free`, `free_slots` and `first_common_free_slot` against a linear scan
+over the raw events, which is what answering from an event list costs.
+
+Usage:
+    uv run python -m benchmarks.availability --events 10000 --users 5
+"""
+
+import argparse
+import random
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+
+from api.core.availability import BusyIntervals, first_common_free_slot, to_utc
+from api.proxy.models.google_models import CalendarEvent
+
+EPOCH = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _synthetic_events(count: int, *, seed: int) -> list[CalendarEvent]:
+    rng = random.Random(seed)
+    events = []
+    cursor = EPOCH
+    for i in range(count):
+        cursor += timedelta(minutes=rng.choice([0, 15, 30, 60, 90, 240]))
+        if rng.random() < 0.02:
+            day = cursor.date().isoformat()
+            next_day = (cursor.date() + timedelta(days=1)).isoformat()
+            start, end = {"date": day}, {"date": next_day}
+        else:
+            start = {"dateTime": cursor.isoformat()}
+            end = {
+                "dateTime": (
+                    cursor + timedelta(minutes=rng.choice([15, 30, 45, 60, 120]))
+                ).isoformat()
+            }
+        events.append(CalendarEvent(id=f"event-{seed}-{i}", start=start, end=end))
+    return events
+
+
+def _linear_is_free(
+    intervals: list[tuple[float, float]], start: float, end: float
+) -> bool:
+    return all(
+        busy_end <= start or busy_start >= end for busy_start, busy_end in intervals
+    )
+
+
+def _time(fn, queries: list) -> list[float]:
+    samples = []
+    for query in queries:
+        begin = time.perf_counter()
+        fn(*query)
+        samples.append(time.perf_counter() - begin)
+    return samples
+
+
+def _summary(samples: list[float]) -> str:
+    us = sorted(sample * 1_000_000 for sample in samples)
+    p95 = us[max(0, int(len(us) * 0.95) - 1)]
+    return f"mean {statistics.mean(us):9.2f} us  p50 {statistics.median(us):9.2f} us  p95 {p95:9.2f} us"
+
+
+def main(*, events: int, users: int, queries: int) -> None:
+    calendars = [_synthetic_events(events, seed=seed) for seed in range(users)]
+
+    begin = time.perf_counter()
+    indexes = [BusyIntervals.from_events(calendar) for calendar in calendars]
+    build = (time.perf_counter() - begin) / users
+
+    raw = [
+        (to_utc(event.start).timestamp(), to_utc(event.end).timestamp())
+        for event in calendars[0]
+    ]
+    span = raw[-1][1] - raw[0][0]
+
+    rng = random.Random(42)
+    windows = []
+    for _ in range(queries):
+        start = EPOCH + timedelta(seconds=rng.uniform(0, span))
+        windows.append((start, start + timedelta(minutes=30)))
+
+    print(f"availability ({users} users x {events} events, {queries} queries)")
+    print(
+        f"  build index:        {build * 1000:9.2f} ms per user ({len(indexes[0])} merged intervals)"
+    )
+    print(
+        "  is_free (linear):   "
+        + _summary(
+            _time(
+                lambda s, e: _linear_is_free(raw, s.timestamp(), e.timestamp()), windows
+            )
+        )
+    )
+    print(
+        "  is_free (index):    "
+        + _summary(_time(lambda s, e: indexes[0].is_free(start=s, end=e), windows))
+    )
+    print(
+        "  free_slots (1 day): "
+        + _summary(
+            _time(
+                lambda s, _: indexes[0].free_slots(
+                    window_start=s,
+                    window_end=s + timedelta(days=1),
+                    min_duration=timedelta(minutes=30),
+                ),
+                windows,
+            )
+        )
+    )
+    print(
+        f"  first common ({users} users, 1 week): "
+        + _summary(
+            _time(
+                lambda s, _: first_common_free_slot(
+                    calendars=indexes,
+                    window_start=s,
+                    window_end=s + timedelta(weeks=1),
+                    duration=timedelta(hours=1),
+                ),
+                windows,
+            )
+        )
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--events", type=int, default=10_000)
+    parser.add_argument("--users", type=int, default=5)
+    parser.add_argument("--queries", type=int, default=1_000)
+    args = parser.parse_args()
+    main(events=args.events, users=args.users, queries=args.queries)
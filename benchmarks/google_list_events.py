@@ -0,0 +1,88 @@
+"""
+Benchmark cold vs warm `list_events` latency
+
+Cold calls clear the process-wide discovery service cache first, so they pay for
+parsing the Calendar v3 discovery document. Warm calls reuse the cached service
+and only bind it to the user's credentials. Google is stubbed with a canned
+events response so only client-side overhead is measured.
+
+Usage:
+    uv run python -m benchmarks.google_list_events --iterations 50
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import time
+
+os.environ.setdefault("SUPABASE__URL", "https://benchmark.supabase.co")
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-2")
+
+from googleapiclient.http import HttpMock
+
+import api.proxy.google_client as google_client
+import api.proxy.google_proxy as google_proxy
+
+
+def _events_payload(count: int) -> bytes:
+    return json.dumps(
+        {
+            "items": [
+                {
+                    "id": f"event-{i}",
+                    "summary": f"Event {i}",
+                    "start": {"dateTime": "2025-01-15T10:00:00Z"},
+                    "end": {"dateTime": "2025-01-15T11:00:00Z"},
+                }
+                for i in range(count)
+            ]
+        }
+    ).encode()
+
+
+def _install_stub(payload: bytes) -> None:
+    def authorized_http(self: google_client.GoogleApiClient) -> HttpMock:
+        http = HttpMock(headers={"status": "200"})
+        http.data = payload
+        return http
+
+    google_client.GoogleApiClient.authorized_http = authorized_http
+
+
+async def _time_call(*, cold: bool) -> float:
+    if cold:
+        google_client.clear_discovery_services()
+    start = time.perf_counter()
+    events = await google_proxy.list_events("access-token", "refresh-token")
+    elapsed = time.perf_counter() - start
+    if events is None:
+        raise RuntimeError("list_events failed against the stubbed transport")
+    return elapsed
+
+
+def _summary(samples: list[float]) -> str:
+    ms = sorted(sample * 1000 for sample in samples)
+    p95 = ms[max(0, int(len(ms) * 0.95) - 1)]
+    return f"mean {statistics.mean(ms):7.2f} ms  p50 {statistics.median(ms):7.2f} ms  p95 {p95:7.2f} ms"
+
+
+async def main(*, iterations: int, events: int) -> None:
+    _install_stub(_events_payload(events))
+    cold = [await _time_call(cold=True) for _ in range(iterations)]
+    await _time_call(cold=False)
+    warm = [await _time_call(cold=False) for _ in range(iterations)]
+
+    print(f"list_events ({iterations} iterations, {events} events per response)")
+    print(f"  cold: {_summary(cold)}")
+    print(f"  warm: {_summary(warm)}")
+    print(f"  speedup: {statistics.mean(cold) / statistics.mean(warm):.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--events", type=int, default=25)
+    args = parser.parse_args()
+    asyncio.run(main(iterations=args.iterations, events=args.events))
@@ -0,0 +1,257 @@
+"""
+Profile the import cost of `api.main` and enforce a cold-start budget
+
+Each run imports `api.main` in a fresh interpreter under `python -X importtime`
+and reports the slowest modules (self and cumulative time) and the heaviest
+top-level packages. It also imports `api.main` once as in prod
+(ENVIRONMENT=prod) with a stub boto3, to check that secrets aren't fetched at
+import. The command exits non-zero when an SDK that should be imported lazily
+(see LAZY_MODULES) is imported at startup, when the prod import touches boto3,
+or when the median total import time is over the budget, so it can gate CI.
+
+Import time depends on the machine, so by default the budget is relative to
+the packages `api.main` can't do without (REFERENCE_MODULES), imported the same
+way in the same run: `api.main` may take at most `--max-overhead` percent
+(IMPORT_TIME_MAX_OVERHEAD_PERCENT, 200 by default) longer. Alternatively
+budget against a `benchmarks.startup` JSON from the same machine
+(`--baseline`, failing more than `--max-regression` percent above its import
+median) or an absolute ceiling (`--budget-ms` or IMPORT_TIME_BUDGET_MS).
+
+Usage:
+    uv run python -m benchmarks.import_time --runs 5
+    uv run python -m benchmarks.startup --runs 5 --output startup.json
+    uv run python -m benchmarks.import_time --runs 5 --baseline startup.json
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+from dataclasses import dataclass
+
+# SDKs that are only needed by some requests and must not load at import time
+LAZY_MODULES = (
+    "openai",
+    "autogen_agentchat",
+    "autogen_ext",
+    "boto3",
+    "sqlalchemy",
+    "requests",
+)
+
+# frameworks `api.main` needs at import, the yardstick for the relative budget
+REFERENCE_MODULES = (
+    "fastapi",
+    "mangum",
+    "pydantic_settings",
+    "supabase",
+    "jwt",
+    "google.oauth2.credentials",
+    "google_auth_httplib2",
+)
+
+# stands in for boto3 in the prod import, reporting any use of it
+_BOTO3_STUB = """
+import sys
+
+print("boto3 imported", file=sys.stderr)
+
+
+def client(service_name, *args, **kwargs):
+    raise RuntimeError(f"boto3 {service_name} client created at import")
+"""
+
+_IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+@dataclass
+class ModuleImport:
+    name: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def _env(**overrides: str) -> dict[str, str]:
+    return {
+        **os.environ,
+        "SUPABASE__URL": os.environ.get(
+            "SUPABASE__URL", "https://benchmark.supabase.co"
+        ),
+        "AWS_DEFAULT_REGION": os.environ.get("AWS_DEFAULT_REGION", "us-east-2"),
+        **overrides,
+    }
+
+
+def import_modules(target: str = "api.main") -> list[ModuleImport]:
+    """Import `target` (comma-separated modules) in a fresh interpreter and parse `-X importtime` output"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        capture_output=True,
+        text=True,
+        env=_env(),
+        check=True,
+    )
+    modules = []
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            modules.append(
+                ModuleImport(
+                    name=match[4],
+                    self_us=int(match[1]),
+                    cumulative_us=int(match[2]),
+                    depth=len(match[3]) // 2,
+                )
+            )
+    return modules
+
+
+def total_ms(modules: list[ModuleImport], target: str = "api.main") -> float:
+    """Cumulative import time of the target module"""
+    return next(m.cumulative_us for m in modules if m.name == target) / 1000
+
+
+def top_level_ms(modules: list[ModuleImport]) -> float:
+    """Import time of everything imported directly, e.g. by `import a, b`"""
+    return sum(m.cumulative_us for m in modules if m.depth == 0) / 1000
+
+
+def prod_import_problems() -> list[str]:
+    """Import `api.main` as in prod with a stub boto3; what it did that it shouldn't"""
+    with tempfile.TemporaryDirectory() as stub_dir:
+        os.mkdir(os.path.join(stub_dir, "boto3"))
+        with open(os.path.join(stub_dir, "boto3", "__init__.py"), "w") as f:
+            f.write(_BOTO3_STUB)
+        result = subprocess.run(
+            [sys.executable, "-c", "import api.main"],
+            capture_output=True,
+            text=True,
+            env=_env(
+                ENVIRONMENT="prod",
+                SECRETS_MANAGER_SECRET_NAME="benchmark",
+                PYTHONPATH=os.pathsep.join(
+                    filter(None, [stub_dir, os.environ.get("PYTHONPATH")])
+                ),
+            ),
+        )
+    problems = []
+    if "boto3 imported" in result.stderr:
+        problems.append("boto3 is imported")
+    if result.returncode != 0:
+        problems.append(f"the import failed: {result.stderr.strip().splitlines()[-1]}")
+    return problems
+
+
+def package_costs(modules: list[ModuleImport]) -> dict[str, float]:
+    """Cumulative ms per top-level package, taken from its outermost import"""
+    costs: dict[str, tuple[int, int]] = {}
+    for module in modules:
+        package = module.name.split(".")[0]
+        outermost = costs.get(package)
+        if outermost is None or module.depth < outermost[0]:
+            costs[package] = (module.depth, module.cumulative_us)
+    return {package: us / 1000 for package, (_, us) in costs.items()}
+
+
+def baseline_budget_ms(path: str, *, max_regression: float) -> tuple[float, str]:
+    """The budget from a `benchmarks.startup` JSON, and a description of it"""
+    with open(path) as f:
+        baseline = json.load(f)
+    median = baseline["metrics"]["importtime_ms"]["median"]
+    return (
+        median * (1 + max_regression / 100),
+        f"{max_regression:.0f}% over the {median:.0f} ms baseline from {baseline.get('commit')}",
+    )
+
+
+def reference_budget_ms(*, runs: int, max_overhead: float) -> tuple[float, str]:
+    """The budget relative to importing REFERENCE_MODULES, and a description of it"""
+    median = statistics.median(
+        top_level_ms(import_modules(", ".join(REFERENCE_MODULES))) for _ in range(runs)
+    )
+    return (
+        median * (1 + max_overhead / 100),
+        f"{max_overhead:.0f}% over the {median:.0f} ms its frameworks take",
+    )
+
+
+def main(*, runs: int, budget_ms: float, budget_label: str, top: int) -> int:
+    samples = [import_modules() for _ in range(runs)]
+    totals = [total_ms(modules) for modules in samples]
+    median = statistics.median(totals)
+    # report the run closest to the median
+    modules = min(samples, key=lambda m: abs(total_ms(m) - median))
+
+    print(
+        f"api.main import ({runs} runs): median {median:.0f} ms, min {min(totals):.0f} ms, max {max(totals):.0f} ms"
+    )
+
+    print(f"\nslowest modules (self time, top {top}):")
+    for module in sorted(modules, key=lambda m: m.self_us, reverse=True)[:top]:
+        print(f"  {module.self_us / 1000:8.1f} ms  {module.name}")
+
+    print(f"\nheaviest packages (cumulative, top {top}):")
+    packages = package_costs(modules)
+    for package, ms in sorted(packages.items(), key=lambda p: p[1], reverse=True)[:top]:
+        print(f"  {ms:8.1f} ms  {package}")
+
+    failed = False
+    eager = [name for name in LAZY_MODULES if name in packages]
+    if eager:
+        print(f"\nFAIL: imported at startup but should be lazy: {', '.join(eager)}")
+        failed = True
+    prod_problems = prod_import_problems()
+    if prod_problems:
+        print(f"\nFAIL: importing in prod mode: {'; '.join(prod_problems)}")
+        failed = True
+    if median > budget_ms:
+        print(
+            f"\nFAIL: median import time {median:.0f} ms is over the {budget_ms:.0f} ms budget ({budget_label})"
+        )
+        failed = True
+    if not failed:
+        print(f"\nOK: within the {budget_ms:.0f} ms budget ({budget_label})")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument(
+        "--max-overhead",
+        type=float,
+        default=float(os.environ.get("IMPORT_TIME_MAX_OVERHEAD_PERCENT", 200)),
+        help="percent over the REFERENCE_MODULES import",
+    )
+    parser.add_argument("--baseline", help="benchmarks.startup JSON to budget against")
+    parser.add_argument(
+        "--max-regression", type=float, default=25, help="percent over the baseline"
+    )
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=os.environ.get("IMPORT_TIME_BUDGET_MS"),
+        help="absolute budget instead",
+    )
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+    if args.budget_ms is not None:
+        budget_ms, budget_label = float(args.budget_ms), "absolute"
+    elif args.baseline:
+        budget_ms, budget_label = baseline_budget_ms(
+            args.baseline, max_regression=args.max_regression
+        )
+    else:
+        budget_ms, budget_label = reference_budget_ms(
+            runs=args.runs, max_overhead=args.max_overhead
+        )
+    sys.exit(
+        main(
+            runs=args.runs, budget_ms=budget_ms, budget_label=budget_label, top=args.top
+        )
+    )
@@ -0,0 +1,438 @@
+"""
+Offline accuracy eval for the auto-fill parse tiers
+
+Runs a fixed set of labelled auto-fill inputs through each tier of
+`LLMService` and compares the start, end and approvers (and the title, where
+labelled) with the expected answer. For every tier it reports coverage (how
+often the tier's answer would be accepted), accuracy, latency and cost.
+
+- rules: the rule-based parser, no API calls; accuracy is over the cases it
+  accepts, which must stay at or above `--min-accuracy`
+- small / large: the configured small and large models on every case
+- routed: the full routing (rules, then small, then large); its accuracy must
+  be within `--tolerance` of the large model's, so routing saves money
+  without losing accuracy
+
+The model tiers call the OpenAI API and need OPENAI__API_KEY.
+
+Usage:
+    uv run python -m benchmarks.parse_eval
+    uv run python -m benchmarks.parse_eval --tiers rules,small,large,routed
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+
+from api.core.event_parser import Contact
+from api.models.v1.event_requests import (
+    EventDateTime,
+    SmartParseEvent,
+    SmartParseEventRequestRequest,
+)
+from api.services.llm_service import LLMService
+from api.settings.config import config
+
+# Wednesday morning, US Central (daylight time)
+NOW = datetime(2026, 10, 14, 9, 0, tzinfo=timezone(timedelta(hours=-5)))
+
+CONTACTS = [
+    Contact(id="u-sam", name="Sam Lee"),
+    Contact(id="u-alex", name="Alex Kim"),
+    Contact(id="u-jordan-park", name="Jordan Park"),
+    Contact(id="u-jordan-smith", name="Jordan Smith"),
+    Contact(id="u-priya", name="Priya Shah"),
+]
+
+
+@dataclass
+class Case:
+    text: str
+    start: str
+    end: str
+    # user id -> required
+    approvers: dict[str, bool] = field(default_factory=dict)
+    title: str | None = None
+
+
+CASES = [
+    Case(
+        "lunch with Alex tomorrow 12-1",
+        "2026-10-15T12:00",
+        "2026-10-15T13:00",
+        title="Lunch with Alex",
+    ),
+    Case(
+        "dinner with Sam friday at 7",
+        "2026-10-16T19:00",
+        "2026-10-16T20:00",
+        title="Dinner with Sam",
+    ),
+    Case(
+        "Dinner with Sam Friday at 7, ask Priya",
+        "2026-10-16T19:00",
+        "2026-10-16T20:00",
+        {"u-priya": True},
+        "Dinner with Sam",
+    ),
+    Case(
+        "standup 9:30am for 15 min",
+        "2026-10-14T09:30",
+        "2026-10-14T09:45",
+        title="Standup",
+    ),
+    Case("gym 6-7:30pm", "2026-10-14T18:00", "2026-10-14T19:30", title="Gym"),
+    Case(
+        "call mom tonight at 8",
+        "2026-10-14T20:00",
+        "2026-10-14T21:00",
+        title="Call mom",
+    ),
+    Case(
+        "meeting oct 20 3-4pm, let Sam and Priya know",
+        "2026-10-20T15:00",
+        "2026-10-20T16:00",
+        {"u-sam": False, "u-priya": False},
+        "Meeting",
+    ),
+    Case(
+        "dentist 10/22 at 2:15pm",
+        "2026-10-22T14:15",
+        "2026-10-22T15:15",
+        title="Dentist",
+    ),
+    Case(
+        "brunch sunday 11-1pm", "2026-10-18T11:00", "2026-10-18T13:00", title="Brunch"
+    ),
+    Case(
+        "hike sat 8am for 3 hours", "2026-10-17T08:00", "2026-10-17T11:00", title="Hike"
+    ),
+    Case(
+        "team sync thursday at 3",
+        "2026-10-15T15:00",
+        "2026-10-15T16:00",
+        title="Team sync",
+    ),
+    Case(
+        "coffee with Priya tomorrow 8:30-9am",
+        "2026-10-15T08:30",
+        "2026-10-15T09:00",
+        title="Coffee with Priya",
+    ),
+    Case(
+        "movie with Alex saturday 7:30pm, run it by Sam",
+        "2026-10-17T19:30",
+        "2026-10-17T20:30",
+        {"u-sam": True},
+        "Movie with Alex",
+    ),
+    Case(
+        "breakfast with Jordan Park monday at 8",
+        "2026-10-19T08:00",
+        "2026-10-19T09:00",
+        title="Breakfast with Jordan Park",
+    ),
+    Case(
+        "drinks friday 5-7, let Alex know",
+        "2026-10-16T17:00",
+        "2026-10-16T19:00",
+        {"u-alex": False},
+        "Drinks",
+    ),
+    Case(
+        "1:1 with Alex thursday 14:00-14:30",
+        "2026-10-15T14:00",
+        "2026-10-15T14:30",
+        title="1:1 with Alex",
+    ),
+    Case(
+        "coffee with Priya at Blue Bottle tomorrow at 10am",
+        "2026-10-15T10:00",
+        "2026-10-15T11:00",
+    ),
+    Case(
+        "ask Jordan Smith if we can do lunch friday at noon",
+        "2026-10-16T12:00",
+        "2026-10-16T13:00",
+        {"u-jordan-smith": True},
+    ),
+    Case("tennis at 8 tonight", "2026-10-14T20:00", "2026-10-14T21:00", title="Tennis"),
+    Case(
+        "doctor appointment nov 3 at 10:15am for 45 minutes",
+        "2026-11-03T10:15",
+        "2026-11-03T11:00",
+        title="Doctor appointment",
+    ),
+    Case(
+        "study session with Sam 2-4 tomorrow",
+        "2026-10-15T14:00",
+        "2026-10-15T16:00",
+        title="Study session with Sam",
+    ),
+    Case(
+        "pick up Alex from the airport friday at 6pm, tell Sam",
+        "2026-10-16T18:00",
+        "2026-10-16T19:00",
+        {"u-sam": False},
+    ),
+    Case(
+        "haircut oct 22nd 4pm", "2026-10-22T16:00", "2026-10-22T17:00", title="Haircut"
+    ),
+    Case(
+        "lunch with Sam and Alex tomorrow at 12:30, check with Priya",
+        "2026-10-15T12:30",
+        "2026-10-15T13:30",
+        {"u-priya": True},
+        "Lunch with Sam and Alex",
+    ),
+    Case(
+        "weekly planning monday 9-10am",
+        "2026-10-19T09:00",
+        "2026-10-19T10:00",
+        title="Weekly planning",
+    ),
+    Case(
+        "date night saturday at 8",
+        "2026-10-17T20:00",
+        "2026-10-17T21:00",
+        title="Date night",
+    ),
+    Case(
+        "run 7am tomorrow for 30 minutes",
+        "2026-10-15T07:00",
+        "2026-10-15T07:30",
+        title="Run",
+    ),
+    Case(
+        "board game night 10/24 6:30-10pm, ask Sam and Alex",
+        "2026-10-24T18:30",
+        "2026-10-24T22:00",
+        {"u-sam": True, "u-alex": True},
+        "Board game night",
+    ),
+    Case(
+        "parent-teacher conference thursday 4:15-4:45pm",
+        "2026-10-15T16:15",
+        "2026-10-15T16:45",
+        title="Parent-teacher conference",
+    ),
+    Case("lunch with Jordan sometime next week", "", ""),
+]
+
+
+@dataclass
+class Outcome:
+    case: Case
+    answer: SmartParseEvent | None
+    accepted: bool
+    latency_seconds: float
+    cost: float = 0.0
+    error: str | None = None
+
+    @property
+    def correct(self) -> bool:
+        return self.answer is not None and not _mismatches(self.case, self.answer)
+
+
+def _request(case: Case) -> SmartParseEventRequestRequest:
+    return SmartParseEventRequestRequest(
+        title=case.text,
+        start_date=EventDateTime(),
+        end_date=EventDateTime(),
+        current_date=NOW,
+    )
+
+
+def _context(case: Case) -> str:
+    return LLMService._smart_parse_context(_request(case), CONTACTS)
+
+
+def _minute(value: datetime | None) -> str:
+    return value.replace(tzinfo=None).isoformat(timespec="minutes") if value else ""
+
+
+def _mismatches(case: Case, answer: SmartParseEvent) -> list[str]:
+    """Fields of the answer that differ from the label"""
+    mismatches = []
+    if _minute(answer.start_date.date_time) != case.start:
+        mismatches.append(
+            f"start {_minute(answer.start_date.date_time)} != {case.start}"
+        )
+    if _minute(answer.end_date.date_time) != case.end:
+        mismatches.append(f"end {_minute(answer.end_date.date_time)} != {case.end}")
+    approvers = {
+        approver.user_id: approver.required for approver in answer.approvers or []
+    }
+    if approvers != case.approvers:
+        mismatches.append(f"approvers {approvers} != {case.approvers}")
+    if case.title and (answer.title or "").strip().lower() != case.title.lower():
+        mismatches.append(f"title {answer.title!r} != {case.title!r}")
+    return mismatches
+
+
+async def _run_rules(service: LLMService, case: Case) -> Outcome:
+    start = time.perf_counter()
+    answer, confidence = service._rule_parse(_request(case), CONTACTS)
+    return Outcome(
+        case=case,
+        answer=answer,
+        accepted=confidence >= config.llm.parse_rules_min_confidence,
+        latency_seconds=time.perf_counter() - start,
+    )
+
+
+async def _run_model(
+    service: LLMService, case: Case, model: str, threshold: float
+) -> Outcome:
+    start = time.perf_counter()
+    try:
+        answer, cost, confidence = await service._model_parse(
+            model, _request(case), _context(case), CONTACTS
+        )
+    except Exception as e:
+        return Outcome(
+            case=case,
+            answer=None,
+            accepted=False,
+            latency_seconds=time.perf_counter() - start,
+            error=str(e),
+        )
+    return Outcome(
+        case=case,
+        answer=answer,
+        accepted=confidence >= threshold,
+        latency_seconds=time.perf_counter() - start,
+        cost=cost.total_cost,
+    )
+
+
+async def _run_routed(service: LLMService, case: Case) -> Outcome:
+    start = time.perf_counter()
+    try:
+        answer, cost = await service._route_smart_parse(
+            _request(case), _context(case), CONTACTS
+        )
+    except Exception as e:
+        return Outcome(
+            case=case,
+            answer=None,
+            accepted=False,
+            latency_seconds=time.perf_counter() - start,
+            error=str(e),
+        )
+    return Outcome(
+        case=case,
+        answer=answer,
+        accepted=True,
+        latency_seconds=time.perf_counter() - start,
+        cost=cost,
+    )
+
+
+async def run_tier(tier: str) -> list[Outcome]:
+    service = LLMService()
+    outcomes = []
+    # one at a time, so latencies aren't skewed by rate limits
+    for case in CASES:
+        if tier == "rules":
+            outcomes.append(await _run_rules(service, case))
+        elif tier == "small":
+            outcomes.append(
+                await _run_model(
+                    service,
+                    case,
+                    config.llm.parse_small_model,
+                    config.llm.parse_small_min_confidence,
+                )
+            )
+        elif tier == "large":
+            outcomes.append(
+                await _run_model(service, case, config.llm.parse_large_model, 0.0)
+            )
+        else:
+            outcomes.append(await _run_routed(service, case))
+    return outcomes
+
+
+def _labelled(outcomes: list[Outcome]) -> list[Outcome]:
+    # cases without a label only check that a tier doesn't accept them
+    return [outcome for outcome in outcomes if outcome.case.start]
+
+
+def accuracy(outcomes: list[Outcome]) -> float:
+    labelled = _labelled(outcomes)
+    return (
+        sum(outcome.correct for outcome in labelled) / len(labelled)
+        if labelled
+        else 0.0
+    )
+
+
+def _report(tier: str, outcomes: list[Outcome]) -> None:
+    accepted = [outcome for outcome in outcomes if outcome.accepted]
+    latencies = [outcome.latency_seconds * 1000 for outcome in outcomes]
+    print(f"\n{tier}:")
+    print(f"  accepted   {len(accepted)}/{len(outcomes)}")
+    print(
+        f"  accuracy   {accuracy(outcomes):.0%} of all, {accuracy(accepted):.0%} of accepted"
+    )
+    print(
+        f"  latency    p50 {statistics.median(latencies):.1f} ms, max {max(latencies):.1f} ms"
+    )
+    print(f"  cost       ${sum(outcome.cost for outcome in outcomes):.5f} total")
+    for outcome in outcomes:
+        if outcome.error:
+            print(f"  error      {outcome.case.text!r}: {outcome.error}")
+        elif outcome.accepted and not outcome.case.start:
+            print(f"  accepted unlabelled {outcome.case.text!r}")
+        elif outcome.accepted and not outcome.correct:
+            print(
+                f"  wrong      {outcome.case.text!r}: {'; '.join(_mismatches(outcome.case, outcome.answer))}"
+            )
+
+
+def main(*, tiers: list[str], min_accuracy: float, tolerance: float) -> int:
+    results = {tier: asyncio.run(run_tier(tier)) for tier in tiers}
+    for tier, outcomes in results.items():
+        _report(tier, outcomes)
+
+    failed = False
+    if "rules" in results:
+        accepted = [outcome for outcome in results["rules"] if outcome.accepted]
+        wrongly_accepted = [outcome for outcome in accepted if not outcome.case.start]
+        if accuracy(accepted) < min_accuracy or wrongly_accepted:
+            print(
+                f"\nFAIL: rules accuracy on accepted cases is {accuracy(accepted):.0%} (min {min_accuracy:.0%})"
+            )
+            failed = True
+    if "routed" in results and "large" in results:
+        routed, large = accuracy(results["routed"]), accuracy(results["large"])
+        if routed < large - tolerance:
+            print(
+                f"\nFAIL: routed accuracy {routed:.0%} is below the large model's {large:.0%}"
+            )
+            failed = True
+    if not failed:
+        print("\nOK")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--tiers", default="rules", help="comma-separated: rules, small, large, routed"
+    )
+    parser.add_argument("--min-accuracy", type=float, default=1.0)
+    parser.add_argument("--tolerance", type=float, default=0.02)
+    args = parser.parse_args()
+    sys.exit(
+        main(
+            tiers=args.tiers.split(","),
+            min_accuracy=args.min_accuracy,
+            tolerance=args.tolerance,
+        )
+    )
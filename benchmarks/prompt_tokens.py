@@ -0,0 +1,180 @@
+"""
+Compare auto-fill prompt size and cacheable prefix, before and after compaction
+
+For users with a growing number of relationships, builds the auto-fill prompt
+the way it used to be built (current date first, then a Python repr of every
+relationship) and the way `LLMService._smart_parse_messages` builds it now
+(static instructions, then a pruned id/name table, then the date and request).
+It reports:
+
+- prompt: tokens in the whole prompt
+- user prefix: tokens two calls from the same user share from the start (a
+  different request, a minute later), which the provider can serve from its
+  prompt cache once it is at least 1024 tokens
+- shared prefix: tokens every user's calls share (another user, another request)
+
+Tokens are counted with tiktoken's o200k_base encoding (gpt-4o) when it can be
+loaded, otherwise estimated from words and punctuation.
+
+Usage:
+    uv run python -m benchmarks.prompt_tokens --relationships 5,25,100,500
+"""
+
+import argparse
+import random
+import re
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Callable
+
+from api.core.event_parser import Contact
+from api.models.v1.event_requests import EventDateTime, SmartParseEventRequestRequest
+from api.services.llm_service import LLMService
+
+FIRST_NAMES = [
+    "Sam",
+    "Alex",
+    "Jordan",
+    "Priya",
+    "Maria",
+    "Chen",
+    "Olu",
+    "Noah",
+    "Ava",
+    "Liam",
+    "Zoe",
+    "Ibrahim",
+]
+LAST_NAMES = [
+    "Lee",
+    "Kim",
+    "Park",
+    "Shah",
+    "Garcia",
+    "Wei",
+    "Adeyemi",
+    "Brown",
+    "Nguyen",
+    "Smith",
+    "Cohen",
+    "Khan",
+]
+
+NOW = datetime(2026, 10, 14, 9, 0, tzinfo=timezone(timedelta(hours=-5)))
+
+
+def token_counter() -> tuple[str, Callable[[str], int]]:
+    try:
+        import tiktoken
+
+        encoding = tiktoken.get_encoding("o200k_base")
+        return "tiktoken o200k_base", lambda text: len(encoding.encode(text))
+    except Exception:
+        # roughly one token per word or punctuation mark in English prose
+        return "estimate", lambda text: len(re.findall(r"\w+|[^\w\s]", text))
+
+
+def _contacts(count: int, *, seed: int = 7) -> list[Contact]:
+    rng = random.Random(seed)
+    return [
+        Contact(
+            id=str(uuid.UUID(int=rng.getrandbits(128))),
+            name=f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+        )
+        for _ in range(count)
+    ]
+
+
+def _request(text: str, current_date: datetime) -> SmartParseEventRequestRequest:
+    return SmartParseEventRequestRequest(
+        title=text,
+        start_date=EventDateTime(),
+        end_date=EventDateTime(),
+        current_date=current_date,
+    )
+
+
+def legacy_messages(
+    request: SmartParseEventRequestRequest, contacts: list[Contact]
+) -> list[dict[str, str]]:
+    """The prompt as auto-fill built it before the static prefix and compact table"""
+    _current_date = request.current_date.strftime("%A, %B %d, %Y - %I:%M %p")
+    context = f"The current date is {_current_date}"
+    context += f"\nThe user has the following relationships: {[
+        {"id": contact.id, "name": contact.name} for contact in contacts
+    ]}"
+    prompt = f"""<context>{context}</context>
+        <request>{request.model_dump_json()}</request>
+        <additional_instructions>
+Use the context to help you parse the request into the required format, filling out the other fields based on the contents of the request. (fields might be in the wrong place)</additional_instructions>
+If the user asks you to "ask someone" / "run it by someone", ONLY THEN add that user to the approvers list (with required set to true)
+ONLY if the user asks you to notify someone, then add that user to the approvers list (with required set to false).
+Use your discretion to determine whether the user is asking you to notify someone or ask them for permission / run it by someone.
+Do not add ANY information that isn't in the request. If the user doesn't specify something, leave it blank.
+"""
+    return [
+        {
+            "role": "system",
+            "content": "You are a helpful assistant that can parse event requests.",
+        },
+        {"role": "user", "content": prompt},
+    ]
+
+
+def current_messages(
+    request: SmartParseEventRequestRequest, contacts: list[Contact]
+) -> list[dict[str, str]]:
+    service = LLMService()
+    return service._smart_parse_messages(
+        request, service._smart_parse_context(request, contacts)
+    )
+
+
+def _flatten(messages: list[dict[str, str]]) -> str:
+    return "".join(f"<{message['role']}>{message['content']}" for message in messages)
+
+
+def _common_prefix(a: str, b: str) -> str:
+    length = 0
+    for x, y in zip(a, b):
+        if x != y:
+            break
+        length += 1
+    return a[:length]
+
+
+def main(*, relationship_counts: list[int]) -> None:
+    counter_name, count = token_counter()
+    print(f"auto-fill prompt tokens ({counter_name})")
+    print(
+        f"{'relationships':>13}  {'layout':8} {'prompt':>7} {'user prefix':>12} {'shared prefix':>14}"
+    )
+    for relationships in relationship_counts:
+        contacts = _contacts(relationships)
+        other_contacts = _contacts(relationships, seed=8)
+        # the request names the first contact, as "ask X" requests do
+        first = _request(f"dinner with {contacts[0].name} friday at 7", NOW)
+        later = _request(
+            f"lunch tomorrow 12-1, ask {contacts[0].name}", NOW + timedelta(minutes=1)
+        )
+        for layout, build in (("before", legacy_messages), ("after", current_messages)):
+            prompt = _flatten(build(first, contacts))
+            user_prefix = _common_prefix(prompt, _flatten(build(later, contacts)))
+            shared_prefix = _common_prefix(
+                prompt, _flatten(build(later, other_contacts))
+            )
+            print(
+                f"{relationships:>13}  {layout:8} {count(prompt):>7} "
+                f"{count(user_prefix):>12} {count(shared_prefix):>14}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--relationships",
+        default="5,25,100,500",
+        help="comma-separated relationship counts",
+    )
+    args = parser.parse_args()
+    main(relationship_counts=[int(n) for n in args.relationships.split(",")])
@@ -0,0 +1,186 @@
+"""
+Benchmark how long `api.main:handler` takes to become ready on a cold start
+
+Every measurement runs in a fresh interpreter, like a new Lambda container:
+
+- import: `python -X importtime` total for `api.main` (see benchmarks.import_time)
+- first response: import `api.main` and invoke the Mangum handler with an
+  API Gateway REST event for `GET /health`, then invoke it again warm
+- memory: peak RSS (high-water mark) after importing `api.main` and after
+  the first response; the Lambda is given 512 MB
+
+No external service is contacted: secrets come from the environment, and the
+Supabase/Google/OpenAI clients are not built for `/health`. Results are written
+as JSON so runs on different commits can be compared with `--baseline`.
+
+Usage:
+    uv run python -m benchmarks.startup --runs 5 --output startup.json
+    uv run python -m benchmarks.startup --baseline startup.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+from datetime import datetime, timezone
+
+from benchmarks.import_time import LAZY_MODULES, import_modules, package_costs, total_ms
+
+# run in a child interpreter; prints one JSON line with its measurements
+_COLD_START_SCRIPT = """
+import json, resource, time
+start = time.perf_counter()
+import api.main
+imported = time.perf_counter()
+rss_after_import_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+event = {
+    "resource": "/{proxy+}",
+    "path": "/health",
+    "httpMethod": "GET",
+    "headers": {"Host": "api.amiavailable.com"},
+    "multiValueHeaders": {"Host": ["api.amiavailable.com"]},
+    "queryStringParameters": None,
+    "multiValueQueryStringParameters": None,
+    "pathParameters": {"proxy": "health"},
+    "stageVariables": None,
+    "requestContext": {
+        "resourcePath": "/{proxy+}",
+        "httpMethod": "GET",
+        "path": "/health",
+        "stage": "prod",
+        "requestId": "benchmark",
+        "identity": {"sourceIp": "127.0.0.1"},
+    },
+    "body": None,
+    "isBase64Encoded": False,
+}
+response = api.main.handler(event, None)
+first = time.perf_counter()
+api.main.handler(event, None)
+second = time.perf_counter()
+print(json.dumps({
+    "status_code": response["statusCode"],
+    "import_ms": (imported - start) * 1000,
+    "first_response_ms": (first - start) * 1000,
+    "first_invoke_ms": (first - imported) * 1000,
+    "warm_invoke_ms": (second - first) * 1000,
+    "rss_after_import_mb": rss_after_import_kb / 1024,
+    "rss_peak_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+}))
+"""
+
+
+def _env() -> dict[str, str]:
+    return {
+        **os.environ,
+        "SUPABASE__URL": os.environ.get(
+            "SUPABASE__URL", "https://benchmark.supabase.co"
+        ),
+        "AWS_DEFAULT_REGION": os.environ.get("AWS_DEFAULT_REGION", "us-east-2"),
+        "ENVIRONMENT": "local",
+    }
+
+
+def cold_start() -> dict[str, float]:
+    """Import the app and serve /health twice in a fresh interpreter"""
+    result = subprocess.run(
+        [sys.executable, "-c", _COLD_START_SCRIPT],
+        capture_output=True,
+        text=True,
+        env=_env(),
+        check=True,
+    )
+    # the app logs to stdout too; the measurements are the last line
+    measurements = json.loads(result.stdout.strip().splitlines()[-1])
+    if measurements.pop("status_code") != 200:
+        raise RuntimeError("/health did not return 200")
+    return measurements
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except Exception:
+        return None
+
+
+def _summary(values: list[float]) -> dict[str, float]:
+    return {
+        "median": statistics.median(values),
+        "min": min(values),
+        "max": max(values),
+    }
+
+
+def run(*, runs: int) -> dict:
+    importtime_runs = [import_modules() for _ in range(runs)]
+    importtime_totals = [total_ms(modules) for modules in importtime_runs]
+    packages = package_costs(importtime_runs[-1])
+
+    cold_starts = [cold_start() for _ in range(runs)]
+    metrics = {
+        "importtime_ms": _summary(importtime_totals),
+        **{
+            key: _summary([sample[key] for sample in cold_starts])
+            for key in cold_starts[0]
+        },
+    }
+    return {
+        "commit": _git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "runs": runs,
+        "metrics": metrics,
+        "top_packages_ms": dict(
+            sorted(packages.items(), key=lambda p: p[1], reverse=True)[:15]
+        ),
+        "eager_lazy_modules": [name for name in LAZY_MODULES if name in packages],
+    }
+
+
+def _print(results: dict, baseline: dict | None) -> None:
+    print(f"startup benchmark ({results['runs']} runs, commit {results['commit']})")
+    for name, summary in results["metrics"].items():
+        line = f"  {name:22s} {summary['median']:9.1f}  (min {summary['min']:.1f}, max {summary['max']:.1f})"
+        previous = (baseline or {}).get("metrics", {}).get(name)
+        if previous:
+            delta = summary["median"] - previous["median"]
+            percent = delta / previous["median"] * 100 if previous["median"] else 0
+            line += f"  {delta:+.1f} ({percent:+.0f}%) vs {baseline.get('commit')}"
+        print(line)
+    if results["eager_lazy_modules"]:
+        print(f"  imported eagerly: {', '.join(results['eager_lazy_modules'])}")
+
+
+def main(*, runs: int, output: str | None, baseline_path: str | None) -> None:
+    baseline = None
+    if baseline_path:
+        with open(baseline_path) as f:
+            baseline = json.load(f)
+
+    results = run(runs=runs)
+    _print(results, baseline)
+
+    if output:
+        with open(output, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"wrote {output}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--output", help="write results as JSON to this path")
+    parser.add_argument(
+        "--baseline", help="JSON results from an earlier run to compare with"
+    )
+    args = parser.parse_args()
+    main(runs=args.runs, output=args.output, baseline_path=args.baseline)
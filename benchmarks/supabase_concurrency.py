@@ -0,0 +1,117 @@
+"""
+Load test concurrent databridge-style queries: sync vs async Supabase client
+
+A local stub PostgREST server answers every query after a fixed latency. The
+same select is issued by many concurrent "requests" on one event loop, once
+with the sync client called inside `async def` (how the databridges used to
+work, blocking the loop per round trip) and once awaiting the shared
+AsyncClient the databridges use now.
+
+Usage:
+    uv run python -m benchmarks.supabase_concurrency --requests 200 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from supabase import create_async_client, create_client
+
+ROW = {
+    "id": "00000000-0000-0000-0000-000000000000",
+    "google_access_token": "access-token",
+    "google_refresh_token": "refresh-token",
+}
+
+
+def _start_stub_server(latency: float) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive, like PostgREST
+        # send headers and body in one segment so Nagle doesn't add latency
+        wbufsize = 65536
+        disable_nagle_algorithm = True
+
+        def do_GET(self):
+            time.sleep(latency)
+            body = json.dumps([ROW]).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    class Server(ThreadingHTTPServer):
+        daemon_threads = True
+        request_queue_size = 1024
+
+    server = Server(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+async def _run(handler, *, requests: int, concurrency: int) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with semaphore:
+            await handler()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(requests)))
+    return time.perf_counter() - start
+
+
+async def main(*, requests: int, concurrency: int, latency_ms: float) -> None:
+    server = _start_stub_server(latency_ms / 1000)
+    url = f"http://127.0.0.1:{server.server_port}"
+    key = "benchmark-key"
+
+    sync_client = create_client(url, key)
+    async_client = await create_async_client(url, key)
+
+    async def sync_query():
+        sync_client.table("user_tokens").select("*").eq("id", ROW["id"]).execute()
+
+    async def async_query():
+        await async_client.table("user_tokens").select("*").eq(
+            "id", ROW["id"]
+        ).execute()
+
+    # warm up connections
+    await sync_query()
+    await async_query()
+
+    before = await _run(sync_query, requests=requests, concurrency=concurrency)
+    after = await _run(async_query, requests=requests, concurrency=concurrency)
+
+    print(
+        f"supabase queries ({requests} requests, concurrency {concurrency}, "
+        f"{latency_ms:.0f} ms server latency)"
+    )
+    print(f"  sync client:  {before:6.2f} s  {requests / before:8.1f} req/s")
+    print(f"  async client: {after:6.2f} s  {requests / after:8.1f} req/s")
+    print(f"  speedup: {before / after:.1f}x")
+
+    await async_client.postgrest.aclose()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--latency-ms", type=float, default=20)
+    args = parser.parse_args()
+    asyncio.run(
+        main(
+            requests=args.requests,
+            concurrency=args.concurrency,
+            latency_ms=args.latency_ms,
+        )
+    )
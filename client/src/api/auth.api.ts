@@ -1,4 +1,5 @@
 import { supabase } from '../lib/supabaseClient';
+import { GOOGLE_ACCESS_TOKEN_LIFETIME_MS } from '../redux/constants';
 
 export interface UserTokens {
     id: string;
@@ -21,6 +22,10 @@ export const storeAccessTokens = async (
                 id: userId,
                 google_access_token: googleAccessToken,
                 google_refresh_token: googleRefreshToken,
+                // lets the API refresh the token before Google rejects it
+                google_token_expires_at: new Date(
+                    Date.now() + GOOGLE_ACCESS_TOKEN_LIFETIME_MS
+                ).toISOString(),
             })
             .select()
             .single();
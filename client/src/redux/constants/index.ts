@@ -1,5 +1,8 @@
 export * from './api.constants';
 
+// Google access tokens from the OAuth sign-in are valid for an hour
+export const GOOGLE_ACCESS_TOKEN_LIFETIME_MS = 60 * 60 * 1000;
+
 // Action Status Constants
 export const ACTION_STATUS = {
     IDLE: 'idle',
@@ -1,7 +1,11 @@
 import { supabase } from '../../lib/supabaseClient';
 import { Session } from '@supabase/supabase-js';
 import axiosInstance from '../../lib/axios';
-import { HTTP_METHODS, CONTENT_TYPES } from '../constants';
+import {
+    HTTP_METHODS,
+    CONTENT_TYPES,
+    GOOGLE_ACCESS_TOKEN_LIFETIME_MS,
+} from '../constants';
 import { store } from '../store';
 import { selectAccessToken } from '../selectors/auth.selectors';
 import { UserTokens, GetAccessTokensResponse } from '../types/auth.types';
@@ -178,6 +182,10 @@ export async function storeAccessTokens(
                 id: userId,
                 google_access_token: googleAccessToken,
                 google_refresh_token: googleRefreshToken,
+                // lets the API refresh the token before Google rejects it
+                google_token_expires_at: new Date(
+                    Date.now() + GOOGLE_ACCESS_TOKEN_LIFETIME_MS
+                ).toISOString(),
             })
             .select()
             .single();
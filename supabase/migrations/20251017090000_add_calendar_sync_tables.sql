@@ -0,0 +1,36 @@
+-- Local store of each user's Google Calendar events, kept up to date with
+-- incremental (syncToken) syncs so views can be answered without Google.
+CREATE TABLE IF NOT EXISTS public.calendar_sync_state (
+    user_id UUID NOT NULL REFERENCES auth.users(id) ON DELETE CASCADE,
+    calendar_id TEXT NOT NULL,
+    sync_token TEXT, -- nextSyncToken from the last completed sync, null forces a full sync
+    last_synced_at TIMESTAMP WITH TIME ZONE, -- null marks the store as stale
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    PRIMARY KEY (user_id, calendar_id)
+);
+
+ALTER TABLE public.calendar_sync_state ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Users can view calendar sync state" ON public.calendar_sync_state
+  FOR SELECT USING (auth.uid() = user_id);
+
+CREATE TABLE IF NOT EXISTS public.calendar_events (
+    user_id UUID NOT NULL REFERENCES auth.users(id) ON DELETE CASCADE,
+    calendar_id TEXT NOT NULL,
+    event_id TEXT NOT NULL, -- Google Calendar event ID
+    start_time TIMESTAMP WITH TIME ZONE, -- all-day events start at midnight UTC
+    end_time TIMESTAMP WITH TIME ZONE, -- exclusive
+    data JSONB NOT NULL, -- the event as returned by Google
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    PRIMARY KEY (user_id, calendar_id, event_id)
+);
+
+CREATE INDEX IF NOT EXISTS calendar_events_user_calendar_start_idx
+    ON public.calendar_events (user_id, calendar_id, start_time);
+
+ALTER TABLE public.calendar_events ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Users can view calendar events" ON public.calendar_events
+  FOR SELECT USING (auth.uid() = user_id);
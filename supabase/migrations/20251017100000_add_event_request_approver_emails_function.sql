@@ -0,0 +1,26 @@
+-- Function to get the approvers of an event request with their email addresses,
+-- used to query their calendars' free/busy in one FreeBusy API call
+DROP FUNCTION IF EXISTS public.get_event_request_approver_emails;
+
+CREATE OR REPLACE FUNCTION public.get_event_request_approver_emails(
+    p_event_request_id UUID
+)
+RETURNS TABLE (
+    user_id UUID,
+    email VARCHAR(255),
+    required BOOLEAN
+)
+LANGUAGE plpgsql
+SECURITY DEFINER
+AS $$
+BEGIN
+    RETURN QUERY
+    SELECT
+        era.user_id,
+        au.email,
+        era.required
+    FROM public.event_request_approvals era
+    JOIN auth.users au ON au.id = era.user_id
+    WHERE era.event_request_id = p_event_request_id;
+END;
+$$;
@@ -0,0 +1,4 @@
+-- Track when the stored Google access token expires so the API can refresh it
+-- before it is rejected instead of after a 401
+ALTER TABLE public.user_tokens
+  ADD COLUMN IF NOT EXISTS google_token_expires_at TIMESTAMP WITH TIME ZONE;
@@ -0,0 +1,171 @@
+-- Keyset pagination on (created_at, id) for notifications, event requests and relationships
+
+CREATE INDEX IF NOT EXISTS notifications_user_created_idx
+    ON public.notifications (user_id, created_at DESC, id DESC);
+
+CREATE INDEX IF NOT EXISTS event_requests_created_by_created_idx
+    ON public.event_requests (created_by, created_at DESC, id DESC);
+
+CREATE INDEX IF NOT EXISTS relationships_user_1_created_idx
+    ON public.relationships (user_id_1, created_at DESC, id DESC);
+
+CREATE INDEX IF NOT EXISTS relationships_user_2_created_idx
+    ON public.relationships (user_id_2, created_at DESC, id DESC);
+
+DROP FUNCTION IF EXISTS public.list_event_requests_with_approvals;
+
+-- Rows come back newest first; pass the last row's created_at/id as the cursor
+-- to get the next page. total_count is only computed when p_include_total is set.
+CREATE OR REPLACE FUNCTION public.list_event_requests_with_approvals(
+    p_user_id UUID DEFAULT NULL,
+    p_status TEXT DEFAULT NULL,
+    p_skip INTEGER DEFAULT 0,
+    p_take INTEGER DEFAULT 50,
+    p_cursor_created_at TIMESTAMP WITH TIME ZONE DEFAULT NULL,
+    p_cursor_id UUID DEFAULT NULL,
+    p_include_total BOOLEAN DEFAULT TRUE
+)
+RETURNS TABLE (
+    id UUID,
+    google_event_id UUID,
+    title TEXT,
+    location TEXT,
+    description TEXT,
+    start_date JSONB,
+    end_date JSONB,
+    importance_level INTEGER,
+    status TEXT,
+    notes TEXT,
+    created_by UUID,
+    created_at TIMESTAMP WITH TIME ZONE,
+    updated_at TIMESTAMP WITH TIME ZONE,
+    approval_status TEXT,
+    requested_approvals INTEGER,
+    completed_count INTEGER,
+    total_count BIGINT
+)
+LANGUAGE plpgsql
+SECURITY DEFINER
+AS $$
+DECLARE
+    v_total_count BIGINT;
+BEGIN
+    IF p_include_total THEN
+        SELECT COUNT(*) INTO v_total_count
+        FROM public.event_requests er
+        WHERE (p_user_id IS NULL OR er.created_by = p_user_id)
+          AND (p_status IS NULL OR er.status = p_status);
+    END IF;
+
+    RETURN QUERY
+    SELECT
+        er.id,
+        er.google_event_id,
+        er.title,
+        er.location,
+        er.description,
+        er.start_date,
+        er.end_date,
+        er.importance_level,
+        er.status,
+        er.notes,
+        er.created_by,
+        er.created_at,
+        er.updated_at,
+        -- Calculate approval status based on approval records
+        CASE
+            WHEN COUNT(era.id) = 0 THEN 'no_approvals'
+            WHEN COUNT(era.id) FILTER (WHERE era.status = 'rejected') > 0 THEN 'rejected'
+            WHEN COUNT(era.id) FILTER (WHERE era.status = 'pending') > 0 THEN 'pending'
+            WHEN COUNT(era.id) FILTER (WHERE era.status = 'approved') = COUNT(era.id) THEN 'approved'
+            ELSE 'pending'
+        END as approval_status,
+        -- Total number of approval requests
+        COUNT(era.id)::INTEGER as requested_approvals,
+        -- Number of completed (non-pending) approvals
+        COUNT(era.id) FILTER (WHERE era.status != 'pending')::INTEGER as completed_count,
+        v_total_count
+    FROM public.event_requests er
+    LEFT JOIN public.event_request_approvals era ON er.id = era.event_request_id
+    WHERE (p_user_id IS NULL OR er.created_by = p_user_id)
+      AND (p_status IS NULL OR er.status = p_status)
+      AND (
+          p_cursor_created_at IS NULL
+          OR (er.created_at, er.id) < (p_cursor_created_at, p_cursor_id)
+      )
+    GROUP BY er.id, er.google_event_id, er.title, er.location, er.description,
+             er.start_date, er.end_date, er.importance_level, er.status,
+             er.notes, er.created_by, er.created_at, er.updated_at
+    ORDER BY er.created_at DESC, er.id DESC
+    OFFSET p_skip
+    LIMIT p_take;
+END;
+$$;
+
+GRANT EXECUTE ON FUNCTION public.list_event_requests_with_approvals TO authenticated;
+
+DROP FUNCTION IF EXISTS get_user_relationships CASCADE;
+
+CREATE OR REPLACE FUNCTION get_user_relationships(
+    p_user_id UUID,
+    p_skip INTEGER DEFAULT 0,
+    p_take INTEGER DEFAULT 10,
+    p_cursor_created_at TIMESTAMPTZ DEFAULT NULL,
+    p_cursor_id UUID DEFAULT NULL,
+    p_include_total BOOLEAN DEFAULT TRUE
+)
+RETURNS TABLE (
+    id UUID,
+    user_id_1 UUID,
+    user_id_2 UUID,
+    created_at TIMESTAMPTZ,
+    updated_at TIMESTAMPTZ,
+    other_user_id UUID,
+    other_user_email VARCHAR(255),
+    other_user_full_name TEXT,
+    total_count BIGINT
+)
+LANGUAGE plpgsql
+SECURITY DEFINER
+AS $$
+DECLARE
+    total_relationships BIGINT;
+BEGIN
+    IF p_include_total THEN
+        SELECT COUNT(*) INTO total_relationships
+        FROM public.relationships r
+        WHERE r.user_id_1 = p_user_id OR r.user_id_2 = p_user_id;
+    END IF;
+
+    RETURN QUERY
+    SELECT
+        r.id,
+        r.user_id_1,
+        r.user_id_2,
+        r.created_at,
+        r.updated_at,
+        CASE
+            WHEN r.user_id_1 = p_user_id THEN r.user_id_2
+            ELSE r.user_id_1
+        END as other_user_id,
+        au.email as other_user_email,
+        COALESCE(au.raw_user_meta_data->>'full_name', '')::TEXT as other_user_full_name,
+        total_relationships as total_count
+    FROM public.relationships r
+    JOIN auth.users au ON (
+        CASE
+            WHEN r.user_id_1 = p_user_id THEN r.user_id_2
+            ELSE r.user_id_1
+        END = au.id
+    )
+    WHERE (r.user_id_1 = p_user_id OR r.user_id_2 = p_user_id)
+      AND (
+          p_cursor_created_at IS NULL
+          OR (r.created_at, r.id) < (p_cursor_created_at, p_cursor_id)
+      )
+    ORDER BY r.created_at DESC, r.id DESC
+    LIMIT p_take OFFSET p_skip;
+END;
+$$;
+
+GRANT EXECUTE ON FUNCTION get_user_relationships(UUID, INTEGER, INTEGER, TIMESTAMPTZ, UUID, BOOLEAN) TO authenticated;
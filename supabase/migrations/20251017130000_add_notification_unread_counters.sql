@@ -0,0 +1,64 @@
+-- Per-user unread notification count, kept up to date by a trigger so the
+-- badge doesn't have to count the user's whole notification history
+
+CREATE TABLE IF NOT EXISTS public.notification_counters (
+    user_id UUID PRIMARY KEY REFERENCES auth.users(id) ON DELETE CASCADE,
+    unread_count INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+ALTER TABLE public.notification_counters ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Users can view notification counters" ON public.notification_counters
+  FOR SELECT USING (auth.uid() = user_id);
+
+-- A notification counts as unread until it is read or deleted
+CREATE OR REPLACE FUNCTION public.update_notification_counters()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+AS $$
+DECLARE
+    v_old_unread INTEGER := 0;
+    v_new_unread INTEGER := 0;
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        v_old_unread := (NOT COALESCE(OLD.is_read, false) AND NOT COALESCE(OLD.is_deleted, false))::INTEGER;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        v_new_unread := (NOT COALESCE(NEW.is_read, false) AND NOT COALESCE(NEW.is_deleted, false))::INTEGER;
+    END IF;
+
+    IF TG_OP = 'UPDATE' AND OLD.user_id IS DISTINCT FROM NEW.user_id THEN
+        UPDATE public.notification_counters
+        SET unread_count = GREATEST(unread_count - v_old_unread, 0), updated_at = NOW()
+        WHERE user_id = OLD.user_id;
+        v_old_unread := 0;
+    END IF;
+
+    IF v_new_unread - v_old_unread <> 0 THEN
+        INSERT INTO public.notification_counters (user_id, unread_count)
+        VALUES (COALESCE(NEW.user_id, OLD.user_id), GREATEST(v_new_unread - v_old_unread, 0))
+        ON CONFLICT (user_id) DO UPDATE
+        SET unread_count = GREATEST(
+                public.notification_counters.unread_count + (v_new_unread - v_old_unread), 0
+            ),
+            updated_at = NOW();
+    END IF;
+
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS notifications_unread_counter ON public.notifications;
+
+CREATE TRIGGER notifications_unread_counter
+    AFTER INSERT OR UPDATE OF is_read, is_deleted, user_id OR DELETE ON public.notifications
+    FOR EACH ROW EXECUTE FUNCTION public.update_notification_counters();
+
+-- Backfill counts for existing notifications
+INSERT INTO public.notification_counters (user_id, unread_count)
+SELECT user_id, COUNT(*) FILTER (WHERE NOT COALESCE(is_read, false) AND NOT COALESCE(is_deleted, false))
+FROM public.notifications
+GROUP BY user_id
+ON CONFLICT (user_id) DO UPDATE SET unread_count = EXCLUDED.unread_count, updated_at = NOW();
@@ -0,0 +1,6 @@
+-- get_event_request_approver_emails reads auth.users as its owner, so it must
+-- not be callable by clients: only the API (service role) may look up emails
+ALTER FUNCTION public.get_event_request_approver_emails(UUID) SET search_path = public;
+
+REVOKE EXECUTE ON FUNCTION public.get_event_request_approver_emails(UUID) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.get_event_request_approver_emails(UUID) TO service_role;